@@ -1,2 +1,5 @@
 from indata.dataio.load import DataSet, DataLoader
-from indata.dataio.transformer import Transformer, impute_mean, impute_mode, impute_median, replace_entries
\ No newline at end of file
+from indata.dataio.schema import Schema, Column
+from indata.dataio.predicate import Range, Equals, NotNull
+from indata.dataio.transformer import Transformer, impute_mean, impute_mode, impute_median, replace_entries
+from indata.dataio.imputer import Imputer
\ No newline at end of file
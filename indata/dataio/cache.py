@@ -0,0 +1,228 @@
+"""
+Parsed csv files and transformed dataframes are cached as uncompressed Arrow IPC files, which are
+memory-mapped when they are read. A cached file is identified by a fingerprint of the csv file and
+the options it was parsed and transformed with, thus a changed file or other options never hit a
+stale cache. The cache is bounded in size, the least recently used files are evicted first
+"""
+
+import os
+import json
+import types
+import hashlib
+import numpy as np
+
+from pathlib import Path
+from typing  import Any, Callable, Optional
+
+
+# size of the blocks in which the content of a file is hashed
+HASH_BLOCKSIZE = 1 << 20
+KEYS           = ("mtime", "content")
+
+
+def fingerprint(path_to_file: Path, key: str = "mtime", **options) -> str:
+    """
+    Fingerprint of a file and the options it is parsed with, the file is identified by its
+    absolute path, its size and either the time of its last modification or the hash of its content
+
+    Parameters
+    ----------
+    path_to_file : Path
+        Path to the file
+    key : str, optional
+        Either "mtime" or "content", hashing the content reads the whole file but survives copies
+        and touches of an unchanged file, by default "mtime"
+    options
+        Options which affect the parsed data, their `repr` has to be deterministic
+
+    Returns
+    -------
+    str
+        Hexadecimal digest of the fingerprint
+
+    Raises
+    ------
+    ValueError
+        Raised when the key is unknown
+    """
+    if key not in KEYS:
+        raise ValueError(f"Unknown cache key {key}, choose either 'mtime' or 'content'!")
+    stat     = os.stat(path_to_file)
+    version  = stat.st_mtime_ns if key == "mtime" else content_hash(path_to_file)
+    identity = repr((os.path.abspath(path_to_file), stat.st_size, version, sorted(options.items())))
+
+    return hashlib.sha1(identity.encode()).hexdigest()
+
+
+def content_hash(path_to_file: Path) -> str:
+    """ Hash of the content of a file, the file is read block by block """
+    digest = hashlib.sha1()
+    with open(path_to_file, "rb") as file:
+        for block in iter(lambda: file.read(HASH_BLOCKSIZE), b""):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+def function_key(function: Callable, _seen: set = None) -> Optional[tuple]:
+    """
+    Identifies a function by its qualified name and, if it is written in Python, by its bytecode and constants,
+    its default arguments, the contents of its closure and the globals it refers to, thus two different lambdas,
+    a redefined function or a function whose captured values changed get different keys. None if a captured
+    value cannot be identified by its content, e.g. a dataframe, then results of the function must not be cached
+    """
+    code = getattr(function, "__code__", None)
+    name = (getattr(function, "__module__", None), getattr(function, "__qualname__", repr(function)))
+    if code is None:
+        return name
+
+    seen = (_seen or set()) | {id(function)}
+    names    = _global_names(code)
+    captured = {'defaults': function.__defaults__, 'kwdefaults': function.__kwdefaults__,
+                'closure': tuple(cell.cell_contents for cell in function.__closure__ or () if cell.cell_contents is not function),
+                'globals': {name: function.__globals__[name] for name in sorted(names) if name in function.__globals__}}
+    captured = _value_key(captured, seen)
+    if captured is None:
+        return None
+
+    return (*name, _code_key(code), captured)
+
+
+def transformer_key(transformer: Any) -> Optional[tuple]:
+    """
+    Identifies the configuration of a transformer by its columns, functions and arguments, a fitted imputer by its fill values,
+    None if a function or an argument cannot be identified by its content, then the transformed dataframe is not cached
+    """
+    if hasattr(transformer, "to_dict"):
+        return (type(transformer).__name__, json.dumps(transformer.to_dict(), sort_keys = True))
+
+    functions = tuple(function_key(function) for function in transformer.funcs)
+    arguments = _value_key(transformer.args, set())
+    if arguments is None or any(key is None for key in functions):
+        return None
+
+    return (tuple(transformer.columns), functions, arguments)
+
+
+def _code_key(code: Any) -> str:
+    """ Hash of the bytecode and the constants of a code object including the code of its nested functions """
+    constants = tuple(_code_key(constant) if hasattr(constant, "co_code") else constant for constant in code.co_consts)
+
+    return hashlib.sha1(code.co_code + repr(constants).encode()).hexdigest()
+
+
+def _global_names(code: Any) -> set[str]:
+    """ Names which are looked up by the code and the code of its nested functions, among them the globals """
+    names = set(code.co_names)
+    for constant in code.co_consts:
+        if hasattr(constant, "co_names"):
+            names |= _global_names(constant)
+
+    return names
+
+
+def _value_key(value: Any, seen: set) -> Optional[str]:
+    """
+    Identifies a value by its content, scalars and containers of them by their repr, modules and classes by their names
+    and functions by `function_key`, None for every other value, whose repr might not reflect its content
+    """
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes, np.generic)):
+        return repr(value)
+    if isinstance(value, (tuple, list)):
+        keys = [_value_key(item, seen) for item in value]
+        return None if None in keys else f"{type(value).__name__}({', '.join(keys)})"
+    if isinstance(value, (set, frozenset)):
+        keys = [_value_key(item, seen) for item in value]
+        return None if None in keys else f"{type(value).__name__}({', '.join(sorted(keys))})"
+    if isinstance(value, dict):
+        keys = [(_value_key(key, seen), _value_key(item, seen)) for key, item in value.items()]
+        return None if any(None in pair for pair in keys) else f"dict({', '.join(sorted(f'{key}: {item}' for key, item in keys))})"
+    if isinstance(value, types.ModuleType):
+        return f"module {value.__name__}"
+    if isinstance(value, (type, types.BuiltinFunctionType, np.ufunc)):
+        return f"{getattr(value, '__module__', None)}.{getattr(value, '__qualname__', value.__name__)}"
+    if isinstance(value, types.FunctionType):
+        if id(value) in seen:
+            return f"recursion {value.__qualname__}"
+        key = function_key(value, seen)
+        return None if key is None else repr(key)
+
+    return None
+
+
+def hit(path_to_file: Path) -> bool:
+    """ Whether a cached file exists, a hit marks the file as recently used """
+    if not os.path.exists(path_to_file):
+        return False
+    os.utime(path_to_file)
+
+    return True
+
+
+def evict(cache_dir: Path, max_bytes: int, keep: Path = None) -> list[Path]:
+    """
+    Evicts the least recently used files of the cache until its size does not exceed `max_bytes`
+
+    Parameters
+    ----------
+    cache_dir : Path
+        Directory of the cache
+    max_bytes : int
+        Maximal size of all cached files together
+    keep : Path, optional
+        File which is never evicted, e.g. the file which was just written, by default None
+
+    Returns
+    -------
+    list[Path]
+        The evicted files
+    """
+    files = []
+    for path_to_file in Path(cache_dir).glob("*.arrow"):
+        try:
+            stat = path_to_file.stat()
+        except FileNotFoundError:
+            # evicted by another process in the meantime
+            continue
+        files.append((stat.st_mtime_ns, stat.st_size, path_to_file))
+
+    size    = sum(file[1] for file in files)
+    evicted = []
+    for _, file_size, path_to_file in sorted(files, key = lambda file: file[0]):
+        if size <= max_bytes:
+            break
+        if keep is not None and path_to_file == Path(keep):
+            continue
+        try:
+            os.remove(path_to_file)
+        except FileNotFoundError:
+            pass
+        size -= file_size
+        evicted.append(path_to_file)
+
+    return evicted
+
+
+def cached_path(cache_dir: Path, path_to_file: Path, key: str = "mtime", **options) -> Path:
+    """
+    Path of the cached Arrow IPC file of a file and the options it is parsed with
+
+    Parameters
+    ----------
+    cache_dir : Path
+        Directory of the cache, it is created if it does not exist
+    path_to_file : Path
+        Path to the file
+    key : str, optional
+        Either "mtime" or "content", see `fingerprint`, by default "mtime"
+    options
+        Options which affect the parsed data, see `fingerprint`
+
+    Returns
+    -------
+    Path
+        The path of the cached file, which might not exist yet
+    """
+    os.makedirs(cache_dir, exist_ok = True)
+
+    return Path(cache_dir) / f"{Path(path_to_file).stem}-{fingerprint(path_to_file, key = key, **options)}.arrow"
\ No newline at end of file
@@ -0,0 +1,308 @@
+"""
+Columnar file formats, i.e. Parquet, Feather/Arrow IPC and ORC, are read by the dataset
+scanner of pyarrow, which only reads the projected columns and skips the row groups whose
+statistics rule out the predicates. The statistics of Parquet files can also be read without
+scanning the data
+"""
+
+import os
+import pandas as pd
+
+from pathlib import Path
+from typing  import Any, Callable, Iterator
+
+import indata.dataio.predicate as predicate
+
+
+# file formats by suffix, every other suffix is read as csv
+FORMATS = {'.parquet': "parquet", '.pq': "parquet", '.feather': "feather", '.arrow': "feather", '.ipc': "feather",
+           '.orc': "orc"}
+
+
+def detect_format(path_to_file: Path) -> str:
+    """
+    Detects the format of a file by its suffix
+
+    Parameters
+    ----------
+    path_to_file : Path
+        Path to the file
+
+    Returns
+    -------
+    str
+        Either "parquet", "feather", "orc" or "csv"
+    """
+    return FORMATS.get(Path(path_to_file).suffix.lower(), "csv")
+
+
+def open_dataset(path_to_file: Path, file_format: str, memory_map: bool = False) -> Any:
+    """
+    Opens a columnar file as a pyarrow dataset
+
+    Parameters
+    ----------
+    path_to_file : Path
+        Path to the file
+    file_format : str
+        Either "parquet", "feather" or "orc"
+    memory_map : bool, optional
+        Whether the file is memory-mapped instead of being read into buffers, by default False
+
+    Returns
+    -------
+    pyarrow.dataset.Dataset
+        The dataset
+
+    Raises
+    ------
+    ImportError
+        Raised when pyarrow is not installed
+    """
+    try:
+        import pyarrow.dataset as ds
+        import pyarrow.fs as fs
+    except ImportError as error:
+        raise ImportError(f"Reading {file_format} files requires the package pyarrow to be installed!") from error
+
+    return ds.dataset(os.path.abspath(path_to_file), format = file_format, filesystem = fs.LocalFileSystem(use_mmap = memory_map))
+
+
+def read(dataset: Any, columns: list[str] = None, predicates: list[predicate.IFPredicate] = None) -> pd.DataFrame:
+    """
+    Reads a pyarrow dataset into a dataframe, the projection and the predicates are pushed
+    into the scanner
+
+    Parameters
+    ----------
+    dataset : pyarrow.dataset.Dataset
+        The dataset
+    columns : list[str], optional
+        Only these columns are read, by default None which reads all columns
+    predicates : list[predicate.IFPredicate], optional
+        Only the rows which satisfy all predicates are read, by default None
+
+    Returns
+    -------
+    pd.DataFrame
+        The dataframe
+    """
+    return dataset.to_table(columns = columns, filter = _expression(predicates)).to_pandas()
+
+
+def read_ipc(path_to_file: Path, columns: list[str] = None) -> pd.DataFrame:
+    """
+    Reads an Arrow IPC/Feather file zero-copy, the file is memory-mapped and the columns of the
+    dataframe are views on the mapped pages as long as the file is not compressed and the columns
+    contain no nulls, thus processes which read the same file share one copy in the page cache
+
+    Parameters
+    ----------
+    path_to_file : Path
+        Path to the Arrow IPC/Feather file
+    columns : list[str], optional
+        Only these columns are read, by default None which reads all columns
+
+    Returns
+    -------
+    pd.DataFrame
+        The dataframe
+    """
+    import pyarrow as pa
+
+    table = pa.ipc.open_file(pa.memory_map(str(path_to_file))).read_all()
+    if columns is not None:
+        table = table.select(columns)
+
+    # every column is kept in its own block, otherwise pandas copies the columns into 2d blocks
+    return table.to_pandas(split_blocks = True)
+
+
+def write_ipc(dataframe: pd.DataFrame, path_to_file: Path) -> None:
+    """
+    Writes a dataframe as uncompressed Arrow IPC file, such that it can be read zero-copy by
+    `read_ipc`, missing values are stored as nulls
+
+    Parameters
+    ----------
+    dataframe : pd.DataFrame
+        The dataframe, its index is not stored
+    path_to_file : Path
+        Path of the Arrow IPC file, the file is replaced atomically
+    """
+    import pyarrow as pa
+
+    table     = pa.Table.from_pandas(dataframe, preserve_index = False)
+    temporary = f"{path_to_file}.{os.getpid()}.tmp"
+    with pa.OSFile(temporary, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema, options = pa.ipc.IpcWriteOptions(compression = None)) as writer:
+            writer.write_table(table)
+    os.replace(temporary, path_to_file)
+
+
+def write_ipc_chunks(chunks: Callable[[], Iterator[pd.DataFrame]], path_to_file: Path) -> None:
+    """
+    Writes a stream of dataframes as uncompressed Arrow IPC file, one record batch per dataframe, thus only
+    one dataframe is held in memory at once. If the type of a column changes between the dataframes, e.g. integers
+    become floats once a value is missing, the type is widened and the stream is written again
+
+    Parameters
+    ----------
+    chunks : Callable[[], Iterator[pd.DataFrame]]
+        Returns the stream of dataframes, it is called once more for every widening of the types
+    path_to_file : Path
+        Path of the Arrow IPC file, the file is replaced atomically
+    """
+    schema    = None
+    temporary = f"{path_to_file}.{os.getpid()}.tmp"
+    while True:
+        widened = _write_batches(chunks(), temporary, schema)
+        if widened is None:
+            break
+        schema = widened
+    os.replace(temporary, path_to_file)
+
+
+def scan(dataset: Any, columns: list[str] = None, predicates: list[predicate.IFPredicate] = None, batch_size: int = None) -> Iterator[pd.DataFrame]:
+    """
+    Scans a pyarrow dataset batch by batch, the projection and the predicates are pushed
+    into the scanner
+
+    Parameters
+    ----------
+    dataset : pyarrow.dataset.Dataset
+        The dataset
+    columns : list[str], optional
+        Only these columns are read, by default None which reads all columns
+    predicates : list[predicate.IFPredicate], optional
+        Only the rows which satisfy all predicates are read, by default None
+    batch_size : int, optional
+        Maximal number of rows per batch, by default None which lets pyarrow decide
+
+    Returns
+    -------
+    Iterator[pd.DataFrame]
+        The batches as dataframes, the row index is continued across batches
+    """
+    options = {'columns': columns, 'filter': _expression(predicates)}
+    if batch_size is not None:
+        options['batch_size'] = batch_size
+
+    offset = 0
+    for batch in dataset.to_batches(**options):
+        if batch.num_rows == 0:
+            continue
+        dataframe       = batch.to_pandas()
+        dataframe.index = pd.RangeIndex(offset, offset + len(dataframe))
+        offset         += len(dataframe)
+        yield dataframe
+
+
+def parquet_statistics(path_to_file: Path, columns: list[str] = None) -> pd.DataFrame:
+    """
+    Aggregates the statistics of the row groups of a Parquet file, a statistic is None if
+    any row group lacks it
+
+    Parameters
+    ----------
+    path_to_file : Path
+        Path to the Parquet file
+    columns : list[str], optional
+        The columns whose statistics are aggregated, by default None which takes all top-level columns
+
+    Returns
+    -------
+    pd.DataFrame
+        Count, missing values, minimum and maximum per column
+    """
+    import pyarrow.parquet as pq
+
+    metadata   = pq.ParquetFile(path_to_file).metadata
+    positions  = {metadata.schema.column(index).path: index for index in range(metadata.num_columns)}
+    columns    = columns if columns is not None else list(positions)
+    statistics = {}
+    for column in columns:
+        chunks  = [(metadata.row_group(group).num_rows, metadata.row_group(group).column(positions[column]).statistics)
+                   for group in range(metadata.num_row_groups)]
+        missing = None
+        if all(stats is not None and stats.has_null_count for _, stats in chunks):
+            missing = sum(stats.null_count for _, stats in chunks)
+        # the bounds are only known if every row group which contains values has them
+        known   = all(stats is not None and (stats.has_min_max or (stats.has_null_count and stats.null_count == rows)) for rows, stats in chunks)
+        bounds  = [(stats.min, stats.max) for _, stats in chunks if stats is not None and stats.has_min_max]
+        statistics[column] = {'Count': metadata.num_rows - missing if missing is not None else None, 'Missing': missing,
+                              'Min': min(bound[0] for bound in bounds) if known and bounds else None,
+                              'Max': max(bound[1] for bound in bounds) if known and bounds else None}
+
+    return pd.DataFrame.from_dict(statistics, orient = "index")
+
+
+def parquet_rows(path_to_file: Path) -> int:
+    """ The number of rows of a Parquet file, which is read from its footer """
+    import pyarrow.parquet as pq
+
+    return pq.ParquetFile(path_to_file).metadata.num_rows
+
+
+def _write_batches(chunks: Iterator[pd.DataFrame], path_to_file: Path, schema: Any = None) -> Any:
+    """
+    Writes the dataframes as record batches of the schema of the first dataframe or of the given schema
+
+    Returns
+    -------
+    pyarrow.Schema
+        None if all dataframes were written, otherwise the widened schema with which the dataframes have to be written again
+    """
+    import pyarrow as pa
+
+    writer = None
+    with pa.OSFile(str(path_to_file), "wb") as sink:
+        try:
+            for chunk in chunks:
+                table  = pa.Table.from_pandas(chunk, preserve_index = False).replace_schema_metadata(None)
+                schema = schema if schema is not None else table.schema
+                if table.schema != schema:
+                    try:
+                        table = table.cast(schema)
+                    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                        return _widen(schema, table.schema)
+                if writer is None:
+                    writer = pa.ipc.new_file(sink, schema, options = pa.ipc.IpcWriteOptions(compression = None))
+                writer.write_table(table)
+            if writer is None:
+                writer = pa.ipc.new_file(sink, schema if schema is not None else pa.schema([]))
+        finally:
+            if writer is not None:
+                writer.close()
+
+    return None
+
+
+def _widen(schema: Any, other: Any) -> Any:
+    """ Unifies the types of the columns of two schemas, columns whose types cannot be unified become strings like pandas parses them """
+    import pyarrow as pa
+
+    fields = []
+    for field in schema:
+        other_field = other.field(field.name)
+        try:
+            unified = pa.unify_schemas([pa.schema([field]), pa.schema([other_field])], promote_options = "permissive").field(0)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            unified = field.with_type(pa.string())
+        # a type which is not widened, e.g. when the values of the other type do not fit, becomes a string
+        if unified.type == field.type and field.type != other_field.type:
+            unified = field.with_type(pa.string())
+        fields.append(unified)
+    if pa.schema(fields) == schema:
+        raise ValueError(f"The types {schema} and {other} of the chunks cannot be unified!")
+
+    return pa.schema(fields)
+
+
+def _expression(predicates: list[predicate.IFPredicate]) -> Any:
+    """ Conjunction of the expressions of all predicates, None if there are no predicates """
+    expression = None
+    for condition in predicates or []:
+        expression = condition.expression() if expression is None else expression & condition.expression()
+
+    return expression
\ No newline at end of file
@@ -0,0 +1,325 @@
+"""
+Compressed csv files are decompressed while they are parsed. A background thread decompresses the
+file ahead of the parser into a bounded queue, thus decompression overlaps with parsing and with
+everything that is done with the chunks. Formats which consist of independent blocks are decompressed
+by a pool of threads, i.e. BGZF files, whose blocks are gzip members, and zstd files of several frames.
+The decompressed size of a batch of blocks is bounded, thus the memory does not grow with the file
+"""
+
+import io
+import bz2
+import gzip
+import lzma
+import zlib
+import queue
+import struct
+import itertools
+import threading
+
+from pathlib            import Path
+from typing             import Any, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import indata.dataio.partition as partition
+
+
+# compressions by suffix
+COMPRESSIONS = {'.gz': "gzip", '.bgz': "gzip", '.bz2': "bz2", '.zst': "zstd", '.zstd': "zstd", '.xz': "xz"}
+# number of decompressed bytes which are passed to the parser at once
+PIECE_BYTES  = 1 << 20
+# number of pieces which are decompressed ahead of the parser
+PREFETCH     = 8
+# independent blocks are decompressed in batches of roughly this many compressed bytes
+BATCH_BYTES  = 4 << 20
+# decompressed bytes of a batch, larger zstd frames or frames of unknown size are streamed instead
+BATCH_OUTPUT = 32 << 20
+
+_ZSTD_MAGIC  = 0xFD2FB528
+_BGZF_HEADER = b"\x1f\x8b\x08\x04"
+
+
+def detect_compression(path_to_file: Path) -> str:
+    """
+    Detects the compression of a file by its suffix
+
+    Parameters
+    ----------
+    path_to_file : Path
+        Path to the file
+
+    Returns
+    -------
+    str
+        Either "gzip", "bz2", "zstd", "xz" or None for uncompressed files
+    """
+    return COMPRESSIONS.get(Path(path_to_file).suffix.lower())
+
+
+def open_stream(path_to_file: Path, compression: str, threads: int = 1) -> io.BufferedReader:
+    """
+    Opens a compressed file as a stream of its decompressed bytes, which are decompressed ahead of the reader
+    by a background thread
+
+    Parameters
+    ----------
+    path_to_file : Path
+        Path to the compressed file
+    compression : str
+        Either "gzip", "bz2", "zstd" or "xz"
+    threads : int, optional
+        Number of threads which decompress independent blocks of BGZF and zstd files, by default 1
+
+    Returns
+    -------
+    io.BufferedReader
+        The decompressed bytes, the stream has to be closed
+
+    Raises
+    ------
+    ValueError
+        Raised when the compression is unknown
+    ImportError
+        Raised when a zstd file is read without pyarrow being installed
+    """
+    if compression not in COMPRESSIONS.values():
+        raise ValueError(f"Unknown compression {compression}, choose one of {sorted(set(COMPRESSIONS.values()))}!")
+    if compression == "zstd":
+        import pyarrow
+
+    return io.BufferedReader(_Prefetch(lambda: _pieces(path_to_file, compression, threads)), buffer_size = PIECE_BYTES)
+
+
+#################################################################################################
+#                                         Prefetch                                              #
+#################################################################################################
+
+class _Prefetch(io.RawIOBase):
+    """ Raw stream whose bytes are produced by a background thread into a bounded queue """
+
+    def __init__(self, produce: Callable[[], Iterator[bytes]]):
+        super().__init__()
+        self._queue  = queue.Queue(maxsize = PREFETCH)
+        self._stop   = threading.Event()
+        self._piece  = memoryview(b"")
+        self._done   = False
+        self._thread = threading.Thread(target = self.__run, args = (produce,), daemon = True)
+        self._thread.start()
+
+
+    def readable(self) -> bool:
+        return True
+
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._piece and not self._done:
+            piece = self._queue.get()
+            if piece is None:
+                self._done = True
+            elif isinstance(piece, BaseException):
+                self._done = True
+                raise piece
+            else:
+                self._piece = memoryview(piece)
+        size          = min(len(buffer), len(self._piece))
+        buffer[:size] = self._piece[:size]
+        self._piece   = self._piece[size:]
+
+        return size
+
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stop.set()
+            # unblocks the producer if the queue is full
+            while self._thread.is_alive():
+                try:
+                    self._queue.get(timeout = 0.1)
+                except queue.Empty:
+                    pass
+        super().close()
+
+
+    def __run(self, produce: Callable[[], Iterator[bytes]]) -> None:
+        """ Decompresses the file piece by piece until it is exhausted or the stream is closed """
+        try:
+            for piece in produce():
+                if piece and not self.__put(piece):
+                    return
+            self.__put(None)
+        except BaseException as error:
+            self.__put(error)
+
+
+    def __put(self, item: Any) -> bool:
+        """ Puts an item into the queue, returns False if the stream was closed meanwhile """
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout = 0.1)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+
+#################################################################################################
+#                                         Helpers                                               #
+#################################################################################################
+
+def _pieces(path_to_file: Path, compression: str, threads: int) -> Iterator[bytes]:
+    """ The decompressed bytes of a file, independent blocks are decompressed in parallel """
+    if compression == "gzip" and threads > 1 and _is_bgzf(path_to_file):
+        yield from _parallel(_bgzf_blocks(path_to_file), _inflate, threads)
+    elif compression == "zstd" and threads > 1:
+        yield from _zstd_parallel(path_to_file, threads)
+    elif compression == "zstd":
+        import pyarrow as pa
+
+        with pa.CompressedInputStream(pa.OSFile(str(path_to_file)), "zstd") as stream:
+            yield from iter(lambda: stream.read(PIECE_BYTES), b"")
+    else:
+        opener = {'gzip': gzip.open, 'bz2': bz2.open, 'xz': lzma.open}[compression]
+        with opener(path_to_file, "rb") as stream:
+            yield from iter(lambda: stream.read(PIECE_BYTES), b"")
+
+
+def _parallel(batches: Iterator[list[bytes]], decompress: Callable[[list[bytes]], bytes], threads: int) -> Iterator[bytes]:
+    """ Decompresses batches of independent blocks in a pool of threads and returns them in order """
+    with ThreadPoolExecutor(max_workers = threads) as pool:
+        yield from partition.ordered(pool, decompress, batches, window = 2 * threads)
+
+
+def _batched(blocks: Iterator[tuple[Any, int]]) -> Iterator[list[Any]]:
+    """
+    Groups consecutive blocks into batches of roughly `BATCH_BYTES` compressed bytes, a batch is closed
+    before its decompressed size exceeds `BATCH_OUTPUT`, the blocks are given with their decompressed size
+    """
+    batch, size, output = [], 0, 0
+    for block, block_output in blocks:
+        if batch and output + block_output > BATCH_OUTPUT:
+            yield batch
+            batch, size, output = [], 0, 0
+        batch.append(block)
+        size   += len(block)
+        output += block_output
+        if size >= BATCH_BYTES:
+            yield batch
+            batch, size, output = [], 0, 0
+    if batch:
+        yield batch
+
+
+def _is_bgzf(path_to_file: Path) -> bool:
+    """ Whether a gzip file consists of BGZF blocks, i.e. its first member carries the `BC` extra field """
+    with open(path_to_file, "rb") as file:
+        header = file.read(16)
+
+    return len(header) == 16 and header[:4] == _BGZF_HEADER and header[12:14] == b"BC"
+
+
+def _bgzf_blocks(path_to_file: Path) -> Iterator[list[bytes]]:
+    """
+    Batches of the BGZF blocks of a file, every block is a gzip member whose size is stored in its header
+    and whose decompressed size is stored in its last four bytes
+    """
+    def blocks() -> Iterator[tuple[bytes, int]]:
+        with open(path_to_file, "rb") as file:
+            while True:
+                header = file.read(18)
+                if not header:
+                    return
+                if len(header) < 18 or header[:4] != _BGZF_HEADER or header[12:14] != b"BC":
+                    raise ValueError(f"The file {path_to_file} is no valid BGZF file!")
+                size = struct.unpack("<H", header[16:18])[0] + 1
+                body = file.read(size - 18)
+                if len(body) < size - 18 or size < 26:
+                    raise ValueError(f"The BGZF file {path_to_file} is truncated!")
+                yield header + body, struct.unpack("<I", body[-4:])[0]
+
+    return _batched(blocks())
+
+
+def _inflate(blocks: list[bytes]) -> bytes:
+    """ Decompresses gzip members, zlib releases the GIL meanwhile """
+    return b"".join(zlib.decompress(block, wbits = 31) for block in blocks)
+
+
+def _zstd_parallel(path_to_file: Path, threads: int) -> Iterator[bytes]:
+    """
+    Decompresses the frames of a zstd file, runs of frames whose decompressed size is known and small are
+    decompressed in batches by a pool of threads, all other frames, e.g. the single frame of a file which was
+    compressed at once, are streamed piece by piece. The file is memory-mapped, thus frames are not copied
+    """
+    import pyarrow as pa
+
+    with pa.memory_map(str(path_to_file)) as source, ThreadPoolExecutor(max_workers = threads) as pool:
+        data   = source.read_buffer()
+        frames = _zstd_frames(data, path_to_file)
+        for small, run in itertools.groupby(frames, key = lambda frame: frame[1] is not None and frame[1] <= BATCH_OUTPUT):
+            if small:
+                yield from partition.ordered(pool, _unzstd, _batched(run), window = 2 * threads)
+                continue
+            for frame, _ in run:
+                with pa.CompressedInputStream(pa.BufferReader(frame), "zstd") as stream:
+                    yield from iter(lambda: stream.read(PIECE_BYTES), b"")
+
+
+def _zstd_frames(data: Any, path_to_file: Path) -> Iterator[tuple[Any, int]]:
+    """
+    The zstd frames of a file with their decompressed sizes, None if a frame does not store it, the end of a
+    frame is found by walking over the headers of its blocks, skippable frames are left out
+
+    Raises
+    ------
+    ValueError
+        Raised when the file is no zstd file or it is truncated
+    """
+    view     = memoryview(data)
+    position = 0
+    while position < len(view):
+        number = struct.unpack("<I", _take(view, position, 4, path_to_file))[0]
+        if 0x184D2A50 <= number <= 0x184D2A5F:
+            position += 8 + struct.unpack("<I", _take(view, position + 4, 4, path_to_file))[0]
+            _take(view, position, 0, path_to_file)
+            continue
+        if number != _ZSTD_MAGIC:
+            raise ValueError(f"The file {path_to_file} is no valid zstd file!")
+
+        start          = position
+        flags          = _take(view, position + 4, 1, path_to_file)[0]
+        single_segment = (flags >> 5) & 1
+        size_bytes     = (single_segment, 2, 4, 8)[flags >> 6]
+        dictionary     = (0, 1, 2, 4)[flags & 3]
+        position      += 5 + (not single_segment) + dictionary
+        content_size   = None
+        if size_bytes:
+            content_size = int.from_bytes(_take(view, position, size_bytes, path_to_file), "little") + (256 if size_bytes == 2 else 0)
+        position      += size_bytes
+        while True:
+            header    = int.from_bytes(_take(view, position, 3, path_to_file), "little")
+            if (header >> 1) & 3 == 3:
+                raise ValueError(f"The file {path_to_file} is no valid zstd file!")
+            # a block of type RLE holds a single byte which is repeated
+            position += 3 + (1 if (header >> 1) & 3 == 1 else header >> 3)
+            _take(view, position, 0, path_to_file)
+            if header & 1:
+                break
+        position += 4 if (flags >> 2) & 1 else 0
+        _take(view, position, 0, path_to_file)
+        yield data.slice(start, position - start), content_size
+
+
+def _take(view: memoryview, position: int, size: int, path_to_file: Path) -> bytes:
+    """ The `size` bytes at `position`, a ValueError is raised if the file ends before """
+    if position + size > len(view):
+        raise ValueError(f"The zstd file {path_to_file} is truncated!")
+
+    return bytes(view[position:position + size])
+
+
+def _unzstd(frames: list[Any]) -> bytes:
+    """ Decompresses zstd frames of known size with pyarrow, which releases the GIL meanwhile """
+    import pyarrow as pa
+
+    with pa.CompressedInputStream(pa.BufferReader(pa.py_buffer(b"".join(frames))), "zstd") as stream:
+        return stream.read()
\ No newline at end of file
@@ -0,0 +1,209 @@
+"""
+Parse engines read a csv file into a pandas dataframe, besides the C parser of pandas, the
+multithreaded parsers of pyarrow and polars can be used if they are installed. The engine is
+either chosen by name or automatically based on the size of the file
+"""
+
+import io
+import os
+import attrs
+import pandas as pd
+
+from abc     import abstractmethod
+from pathlib import Path
+from typing  import Any, Union
+
+
+# files of at least this size are parsed by pyarrow if the engine is chosen automatically
+AUTO_ENGINE_BYTES = 64 << 20
+
+
+#################################################################################################
+#                                    Interface Engine                                           #
+#################################################################################################
+
+class IFEngine:
+    """
+    Interface for the parse engines
+
+    Methods
+    -------
+    read()
+        Reads a csv file into a dataframe
+    """
+
+    @abstractmethod
+    def read(self): # pragma: no cover
+        pass
+
+
+#################################################################################################
+#                                         Engines                                               #
+#################################################################################################
+
+@attrs.define()
+class CEngine(IFEngine):
+    """
+    The single-threaded C parser of pandas, it supports every line terminator
+    """
+
+    def read(self, path_to_file: Union[Path, Any], sep: str, lineterminator: str, options: dict) -> pd.DataFrame:
+        """
+        Reads a csv file into a dataframe
+
+        Parameters
+        ----------
+        path_to_file : Union[Path, Any]
+            Path to the csv file or a binary stream of its bytes, e.g. of a decompressed file
+        sep : str
+            Seperator which is used for the csv file
+        lineterminator : str
+            Indicates when a line is terminated inside of the csv file, None for newlines
+        options : dict
+            Further arguments of `pd.read_csv`, i.e. `usecols`, `dtype` and `parse_dates`
+
+        Returns
+        -------
+        pd.DataFrame
+            The parsed dataframe
+        """
+        return pd.read_csv(path_to_file, sep = sep, lineterminator = lineterminator, engine = "c", **options)
+
+
+@attrs.define()
+class ArrowEngine(IFEngine):
+    """
+    The multithreaded parser of pyarrow, only newlines are supported as line terminators. Types which
+    are not declared by `options['dtype']` are inferred by pyarrow, columns which pyarrow would infer as
+    dates, times or timestamps are read as the raw strings of the file like pandas does
+    """
+
+    def read(self, path_to_file: Union[Path, Any], sep: str, lineterminator: str, options: dict) -> pd.DataFrame:
+        """ See `CEngine.read` """
+        _check_newline(lineterminator, engine = "pyarrow")
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+
+        # pandas keeps the order of the columns in the file
+        header          = _header(path_to_file, sep = sep) if options.get('usecols') is not None else None
+        parse_options   = pacsv.ParseOptions(delimiter = sep)
+        column_types    = {column: pa.string() for column in _temporal(path_to_file, parse_options = parse_options)}
+        convert_options = pacsv.ConvertOptions(include_columns = options.get('usecols'), strings_can_be_null = True,
+                                               column_types = column_types)
+        table           = pacsv.read_csv(path_to_file, read_options = pacsv.ReadOptions(use_threads = True),
+                                         parse_options = parse_options, convert_options = convert_options)
+        if header is not None:
+            table = table.select([column for column in header if column in options['usecols']])
+
+        return _apply_options(table.to_pandas(), options)
+
+
+@attrs.define()
+class PolarsEngine(IFEngine):
+    """
+    The multithreaded parser of polars, only newlines are supported as line terminators
+    """
+
+    def read(self, path_to_file: Union[Path, Any], sep: str, lineterminator: str, options: dict) -> pd.DataFrame:
+        """ See `CEngine.read` """
+        _check_newline(lineterminator, engine = "polars")
+        import polars as pl
+
+        # a carriage return before the newline is stripped by polars
+        dataframe = pl.read_csv(path_to_file, separator = sep, eol_char = "\n", columns = options.get('usecols'),
+                                try_parse_dates = False)
+
+        return _apply_options(dataframe.to_pandas(), options)
+
+
+ENGINES = {'c': CEngine, 'pyarrow': ArrowEngine, 'polars': PolarsEngine}
+
+
+def create_engine(name: str, path_to_file: Path, lineterminator: str = None) -> IFEngine:
+    """
+    Creates a parse engine
+
+    Parameters
+    ----------
+    name : str
+        Either "c", "pyarrow", "polars" or "auto", the latter chooses pyarrow for files of at least
+        `AUTO_ENGINE_BYTES` if pyarrow is installed and the lines are terminated by newlines, otherwise
+        the C parser of pandas
+    path_to_file : Path
+        Path to the csv file
+    lineterminator : str, optional
+        Indicates when a line is terminated inside of the csv file, by default None
+
+    Returns
+    -------
+    IFEngine
+        The parse engine
+
+    Raises
+    ------
+    ValueError
+        Raised when the engine is unknown
+    ImportError
+        Raised when the package of the engine is not installed
+    """
+    if name == "auto":
+        name = "c"
+        if lineterminator in (None, "\n", "\r\n") and os.path.getsize(path_to_file) >= AUTO_ENGINE_BYTES and _installed("pyarrow"):
+            name = "pyarrow"
+    if name not in ENGINES:
+        raise ValueError(f"Unknown engine {name}, choose one of {[*ENGINES, 'auto']}!")
+    if name != "c" and not _installed(name):
+        raise ImportError(f"The engine {name} requires the package {name} to be installed!")
+
+    return ENGINES[name]()
+
+
+#################################################################################################
+#                                         Helpers                                               #
+#################################################################################################
+
+def _installed(package: str) -> bool:
+    """ Whether a package can be imported """
+    try:
+        __import__(package)
+    except ImportError:
+        return False
+
+    return True
+
+
+def _header(source: Union[Path, Any], sep: str) -> pd.Index:
+    """ The columns of a csv file, a stream is peeked at instead of being consumed """
+    if isinstance(source, io.BufferedReader):
+        return pd.read_csv(io.BytesIO(source.peek(1 << 20)), sep = sep, nrows = 0).columns
+
+    return pd.read_csv(source, sep = sep, nrows = 0).columns
+
+
+def _temporal(source: Union[Path, Any], parse_options: Any) -> list[str]:
+    """ The columns which pyarrow infers as temporal from the first block of a csv file, a stream is peeked at """
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    if isinstance(source, io.BufferedReader):
+        sample = source.peek(1 << 20)
+        source = io.BytesIO(sample[:sample.rfind(b"\n") + 1] or sample)
+    with pacsv.open_csv(source, parse_options = parse_options) as reader:
+        return [field.name for field in reader.schema if pa.types.is_temporal(field.type)]
+
+
+def _check_newline(lineterminator: str, engine: str) -> None:
+    """ Raises a ValueError for line terminators which are no newlines """
+    if lineterminator not in (None, "\n", "\r\n"):
+        raise ValueError(f"The engine {engine} only supports newlines as line terminators!")
+
+
+def _apply_options(dataframe: pd.DataFrame, options: dict) -> pd.DataFrame:
+    """ Applies the dtypes and the date columns of `options` which the engine did not parse itself """
+    for column, dtype in options.get('dtype', {}).items():
+        if dataframe[column].dtype != dtype:
+            dataframe[column] = dataframe[column].astype(dtype)
+    for column in options.get('parse_dates', []):
+        dataframe[column] = pd.to_datetime(dataframe[column])
+
+    return dataframe
\ No newline at end of file
@@ -0,0 +1,387 @@
+"""
+The Imputer fits the fill values of columns on the whole data in one streaming pass and
+applies the same fill values on every chunk, file or worker process afterwards. In contrast to
+`impute_mean`, `impute_median` and `impute_mode`, which compute their fill value from the dataframe
+they are given, the imputation does not depend on how the data is split up
+"""
+
+import json
+import attrs
+import numpy as np
+import pandas as pd
+
+from abc     import abstractmethod
+from pathlib import Path
+from typing  import Any, Iterable, Union
+
+import indata.dataio.transformer as transform
+import indata.utils.quantile     as quantile
+import indata.utils.sketch       as sketch
+
+
+STRATEGIES = ("mean", "median", "mode")
+
+
+#################################################################################################
+#                                    Interface Imputer                                          #
+#################################################################################################
+
+class IFImputer(transform.IFTransformer):
+    """
+    Interface for the Imputer
+
+    Methods
+    -------
+    fit()
+        Fits the fill values on a dataframe or a stream of dataframes
+    partial_fit()
+        Adds a dataframe to the fitted statistics
+    merge()
+        Merges the statistics of another imputer
+    transform()
+        Fills the missing values of a dataframe
+    """
+
+    @abstractmethod
+    def fit(self): # pragma: no cover
+        pass
+
+
+    @abstractmethod
+    def partial_fit(self): # pragma: no cover
+        pass
+
+
+    @abstractmethod
+    def merge(self): # pragma: no cover
+        pass
+
+
+#################################################################################################
+#                                          Imputer                                              #
+#################################################################################################
+
+@attrs.define()
+class Imputer(IFImputer):
+    """
+    Imputes the missing values of columns with their mean, median or mode which are fitted
+    on all chunks of the data. Imputers which were fitted on different parts of the data, e.g.
+    in worker processes, can be merged and a fitted imputer can be persisted and loaded again
+
+        imputer = Imputer({"price": "median", "city": "mode"}).fit(dataloader.read_chunks(chunksize = 100_000))
+        for chunk in dataloader.read_chunks(chunksize = 100_000, transformer = imputer):
+            ...
+
+    Methods
+    -------
+    fit(data: Union[pd.DataFrame, Iterable[pd.DataFrame]])
+        Fits the fill values on a dataframe or a stream of dataframes
+    partial_fit(dataframe: pd.DataFrame)
+        Adds a dataframe to the fitted statistics
+    merge(other: Imputer)
+        Merges the statistics of another imputer which was fitted on another part of the data
+    transform(dataframe: pd.DataFrame)
+        Fills the missing values of a dataframe with the fitted values
+    to_dict()
+        Serializes the fill values into a json compatible dictionary
+    save(path_to_file: Path)
+        Stores the fill values as a json file
+    """
+    strategies: dict[str, str] = attrs.field(factory = dict)
+    approximate: bool          = attrs.field(default = False)
+    k: int                     = attrs.field(default = 200)
+    capacity: int              = attrs.field(default = 1000)
+    _states: dict[str, Any]    = attrs.field(factory = dict)
+    _values: dict[str, Any]    = attrs.field(default = None)
+
+    def __init__(self, strategies: dict[str, str], approximate: bool = False, k: int = 200, capacity: int = 1000):
+        """
+        Parameters
+        ----------
+        strategies : dict[str, str]
+            Maps the names of the columns to either "mean", "median" or "mode"
+        approximate : bool, optional
+            If True, the median is estimated by a KLL sketch and the mode by a Space-Saving sketch,
+            thus the memory does not grow with the number of rows or distinct values, otherwise all present
+            values of a median column and all distinct values of a mode column are kept, by default False
+        k : int, optional
+            Capacity of the quantile sketch for the approximate median, by default 200
+        capacity : int, optional
+            Number of counters of the Space-Saving sketch for the approximate mode, by default 1000
+
+        Raises
+        ------
+        ValueError
+            Raised when a strategy is unknown
+        """
+        unknown = {column: strategy for column, strategy in strategies.items() if strategy not in STRATEGIES}
+        if unknown:
+            raise ValueError(f"Unknown strategies {unknown}, choose either 'mean', 'median' or 'mode'!")
+        self.strategies  = dict(strategies)
+        self.approximate = approximate
+        self.k           = k
+        self.capacity    = capacity
+        self._states     = {}
+        self._values     = None
+
+
+    @property
+    def columns(self) -> list[str]:
+        """ Names of the imputed columns """
+        return list(self.strategies)
+
+
+    @property
+    def fitted(self) -> bool:
+        """ Whether the imputer has seen any data or was loaded with fill values """
+        return self._values is not None or bool(self._states)
+
+
+    @property
+    def values(self) -> dict[str, Any]:
+        """ The fill value per column, NaN if a column had no present value """
+        if self._values is None:
+            if not self._states:
+                raise ValueError("The imputer has to be fitted before its values can be used!")
+            self._values = {column: self.__value(column) for column in self.strategies}
+
+        return self._values
+
+
+    def fit(self, data: Union[pd.DataFrame, Iterable[pd.DataFrame]]) -> "Imputer":
+        """
+        Fits the fill values in one pass, previously fitted statistics are discarded
+
+        Parameters
+        ----------
+        data : Union[pd.DataFrame, Iterable[pd.DataFrame]]
+            A dataframe or a stream of dataframes, e.g. `DataLoader.read_chunks`
+
+        Returns
+        -------
+        Imputer
+            The imputer itself, such that it can be fitted and used at once
+        """
+        self._states = {}
+        self._values = None
+        for dataframe in ([data] if isinstance(data, pd.DataFrame) else data):
+            self.partial_fit(dataframe)
+
+        return self
+
+
+    def partial_fit(self, dataframe: pd.DataFrame) -> "Imputer":
+        """
+        Adds a dataframe to the statistics which were fitted so far
+
+        Parameters
+        ----------
+        dataframe : pd.DataFrame
+            Dataframe which contains all imputed columns
+
+        Returns
+        -------
+        Imputer
+            The imputer itself
+
+        Raises
+        ------
+        KeyError
+            Raised when an imputed column is missing in the dataframe
+        ValueError
+            Raised when the mean or the median of a non-numeric column is requested
+        """
+        missing = [column for column in self.strategies if column not in dataframe.columns]
+        if missing:
+            raise KeyError(f"The columns {missing} which should be imputed are not part of the dataframe!")
+        for column, strategy in self.strategies.items():
+            if strategy != "mode" and not pd.api.types.is_numeric_dtype(dataframe[column]):
+                raise ValueError(f"The {strategy} of the non-numeric column {column} cannot be fitted!")
+            if column not in self._states:
+                self._states[column] = self.__empty_state(strategy)
+            self._states[column] = _update(self._states[column], strategy, dataframe[column])
+        self._values = None
+
+        return self
+
+
+    def merge(self, other: "Imputer") -> "Imputer":
+        """
+        Merges the statistics of another imputer with the same strategies which was fitted on another part of the data
+
+        Parameters
+        ----------
+        other : Imputer
+            The other imputer, it has to be fitted and must not be loaded from its fill values
+
+        Returns
+        -------
+        Imputer
+            The imputer itself, such that merges can be chained
+
+        Raises
+        ------
+        ValueError
+            Raised when the strategies differ or the statistics of an imputer are not available
+        """
+        if other.strategies != self.strategies or other.approximate != self.approximate:
+            raise ValueError("Only imputers with the same strategies can be merged!")
+        if (self._values is not None and not self._states) or (other._values is not None and not other._states):
+            raise ValueError("Imputers which were loaded from their fill values cannot be merged!")
+        for column, state in other._states.items():
+            if column not in self._states:
+                self._states[column] = state
+                continue
+            self._states[column] = _merge(self._states[column], self.strategies[column], state)
+        self._values = None
+
+        return self
+
+
+    def transform(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fills the missing values of the imputed columns with the fitted values, columns which are not
+        part of the dataframe, e.g. because they were not selected, are skipped
+
+        Returns
+        -------
+        pd.DataFrame
+            The in-place modified dataframe
+        """
+        values = {column: value for column, value in self.values.items() if column in dataframe.columns}
+        if values:
+            dataframe[list(values)] = dataframe[list(values)].fillna(values)
+
+        return dataframe
+
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serializes the strategies and the fill values into a json compatible dictionary
+
+        Returns
+        -------
+        dict[str, Any]
+            The state of the imputer
+        """
+        return {'strategies': self.strategies, 'approximate': self.approximate, 'k': self.k, 'capacity': self.capacity,
+                'values': {column: _to_python(value) for column, value in self.values.items()}}
+
+
+    @staticmethod
+    def from_dict(state: dict[str, Any]) -> "Imputer":
+        """
+        Restores an imputer which was serialized by `to_dict`, it can transform dataframes but cannot be merged
+
+        Parameters
+        ----------
+        state : dict[str, Any]
+            The state of the imputer
+
+        Returns
+        -------
+        Imputer
+            The restored imputer
+        """
+        imputer         = Imputer(state['strategies'], approximate = state['approximate'], k = state['k'], capacity = state['capacity'])
+        imputer._values = {column: np.nan if value is None else value for column, value in state['values'].items()}
+
+        return imputer
+
+
+    def save(self, path_to_file: Path) -> None:
+        """ Stores the fill values as a json file """
+        with open(path_to_file, "w") as file:
+            json.dump(self.to_dict(), file)
+
+
+    @staticmethod
+    def load(path_to_file: Path) -> "Imputer":
+        """ Loads an imputer which was stored by `save` """
+        with open(path_to_file, "r") as file:
+            return Imputer.from_dict(json.load(file))
+
+
+    def __empty_state(self, strategy: str) -> Any:
+        """ The statistics of a column before it has seen any values """
+        if strategy == "mean":
+            return (0, 0.0)
+        if strategy == "median":
+            return sketch.QuantileSketch(k = self.k) if self.approximate else []
+        if self.approximate:
+            return sketch.SpaceSaving(capacity = self.capacity)
+
+        return pd.Series(dtype = np.int64)
+
+
+    def __value(self, column: str) -> Any:
+        """ Computes the fill value of a column from its statistics """
+        strategy = self.strategies[column]
+        state    = self._states.get(column)
+        if state is None:
+            return np.nan
+        if strategy == "mean":
+            count, total = state
+            return total / count if count else np.nan
+        if strategy == "median":
+            if self.approximate:
+                return state.quantile(0.5) if state.count else np.nan
+            values = np.concatenate(state) if state else np.empty(0, dtype = np.float64)
+            return quantile.exact_quantiles(values, [0.5])[0]
+        counts = state.counts if self.approximate else state
+        if counts.empty:
+            return np.nan
+
+        return _smallest(counts.index[counts == counts.max()])
+
+
+#################################################################################################
+#                                         Helpers                                               #
+#################################################################################################
+
+def _update(state: Any, strategy: str, values: pd.Series) -> Any:
+    """ Adds the present values of a column to its statistics """
+    if strategy == "mean":
+        present = values.dropna()
+        return state[0] + len(present), state[1] + float(present.sum())
+    if strategy == "median":
+        if isinstance(state, sketch.QuantileSketch):
+            state.update(values.to_numpy(dtype = np.float64, na_value = np.nan))
+            return state
+        present = values.dropna().to_numpy(dtype = np.float64)
+        return state + [present] if len(present) else state
+    if isinstance(state, sketch.SpaceSaving):
+        state.update(values.dropna().to_numpy())
+        return state
+
+    return state.add(sketch.value_counts(values.dropna()), fill_value = 0).astype(np.int64)
+
+
+def _merge(state: Any, strategy: str, other: Any) -> Any:
+    """ Merges the statistics of a column which were fitted on two parts of the data """
+    if strategy == "mean":
+        return state[0] + other[0], state[1] + other[1]
+    if isinstance(state, (sketch.QuantileSketch, sketch.SpaceSaving)):
+        return state.merge(other)
+    if strategy == "median":
+        return state + other
+
+    return state.add(other, fill_value = 0).astype(np.int64)
+
+
+def _smallest(candidates: pd.Index) -> Any:
+    """ The smallest of equally frequent values like `pd.Series.mode`, the first one if the values cannot be ordered """
+    try:
+        return min(candidates)
+    except TypeError:
+        return candidates[0]
+
+
+def _to_python(value: Any) -> Any:
+    """ Converts numpy scalars into Python scalars and NaN into None, such that the value can be stored as json """
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+
+    return value
\ No newline at end of file
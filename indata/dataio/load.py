@@ -6,15 +6,31 @@ classes.
 
 import os
 import attrs
+import contextlib
 import pandas as pd
 
-from abc     import abstractmethod
-from pathlib import Path
+from abc                import abstractmethod
+from pathlib            import Path
+from typing             import Any, Iterator
+from concurrent.futures import ThreadPoolExecutor
 
 import indata.dataio.transformer as transform
+import indata.dataio.schema      as schemas
+import indata.dataio.predicate   as predicate
+import indata.dataio.engine      as engines
+import indata.dataio.columnar    as columnar
+import indata.dataio.cache       as cache
+import indata.dataio.partition   as partition
+import indata.dataio.compression as compressions
 import indata.exception.base     as exception
 
 
+# number of rows per chunk which are filtered at once when predicates are given
+FILTER_CHUNKSIZE = 100_000
+# number of rows per record batch of a csv file which is parsed into the cache
+CACHE_CHUNKSIZE  = 100_000
+
+
 #################################################################################################
 #                                         DataSet                                               #
 #################################################################################################
@@ -22,25 +38,74 @@ import indata.exception.base     as exception
 attrs.define()
 class DataSet:
     """
-    DataSet stores the metadata about the target file
+    DataSet stores the metadata about the target file, a dataset which is split up into many files
+    is given by a glob pattern or a directory, the files are its partitions
     """
-    path_to_file: Path = attrs.field(factory = Path)
+    path_to_file: Path           = attrs.field(factory = Path)
+    schema: schemas.Schema       = attrs.field(default = None)
+    file_format: str             = attrs.field(factory = str)
+    compression: str             = attrs.field(default = None)
+    partitions: list[Path]       = attrs.field(factory = list)
+    partition_values: list[dict] = attrs.field(factory = list)
+    partition_dtypes: dict       = attrs.field(factory = dict)
 
-    def __init__(self, path_to_file: Path):
+    def __init__(self, path_to_file: Path, schema: schemas.Schema = None, file_format: str = None, compression: str = None):
         """
         Parameters
         ---------   
         path_to_file: str
-            The `path` to the target file
+            The `path` to the target file, a glob pattern like `./data/*.csv` or a directory whose files are
+            found recursively, `key=value` directories of Hive-style layouts become columns of the dataset
+        schema: schemas.Schema, optional
+            Declares the columns of the file and their types, only the declared columns are read and
+            their dtypes are not inferred, by default None
+        file_format: str, optional
+            Either "csv", "parquet", "feather" or "orc", by default None which detects the format
+            by the suffix of the file, unknown suffixes are read as csv, all partitions have the format of the first one
+        compression: str, optional
+            Either "gzip", "bz2", "zstd" or "xz", by default None which detects the compression by the suffix of the
+            file, e.g. `.csv.gz`, only csv files can be compressed
 
         Raises
         ------
         PathNotFoundError
-            Raised when the path of the the target file does not exists!
+            Raised when the path of the the target file does not exists or no file matches the pattern!
+        ValueError
+            Raised when the file format or the compression is unknown or a columnar file is compressed
         """
-        if not os.path.exists(path_to_file):
+        if not partition.is_pattern(path_to_file) and not os.path.exists(path_to_file):
             raise exception.PathNotFoundError("Given path to file does not exists! Please check it again.")
+        if file_format is not None and file_format not in ("csv", *columnar.FORMATS.values()):
+            raise ValueError(f"Unknown file format {file_format}!")
+        if compression is not None and compression not in compressions.COMPRESSIONS.values():
+            raise ValueError(f"Unknown compression {compression}!")
         self.path_to_file = path_to_file
+        self.schema       = schema
+        if partition.is_pattern(path_to_file) or os.path.isdir(path_to_file):
+            self.partitions, self.partition_values = partition.discover(path_to_file)
+            if not self.partitions:
+                raise exception.PathNotFoundError(f"There are no files at {path_to_file}! Please check it again.")
+        else:
+            self.partitions, self.partition_values = [path_to_file], [{}]
+        # integer partition columns whose key is missing for some files are of the nullable dtype
+        self.partition_dtypes = partition.dtypes(self.partition_values)
+        self.compression  = compression or compressions.detect_compression(self.partitions[0])
+        # the suffix of the compression is not the suffix of the format
+        self.file_format  = file_format or columnar.detect_format(Path(self.partitions[0]).with_suffix("") if self.compression else self.partitions[0])
+        if self.compression is not None and self.file_format != "csv":
+            raise ValueError(f"Only csv files can be compressed, but the file is of format {self.file_format}!")
+
+
+    @property
+    def partitioned(self) -> bool:
+        """ Whether the dataset is given by a glob pattern or a directory instead of a single file """
+        return self.partitions != [self.path_to_file]
+
+
+    @property
+    def partition_columns(self) -> list[str]:
+        """ The columns of the Hive partitions in the order of their first appearance """
+        return list(dict.fromkeys(key for values in self.partition_values for key in values))
 
 
 #################################################################################################
@@ -53,15 +118,36 @@ class IFDataLoader:
     
     Methods
     -------
+    read()
+        Reads the file in its format
+    read_chunks()
+        Reads the file in its format chunk by chunk
     read_csv()
         Reads the csv file
+    read_csv_chunks()
+        Reads the csv file chunk by chunk
     """
 
+    @abstractmethod
+    def read(self): # pragma: no cover
+        pass
+
+
+    @abstractmethod
+    def read_chunks(self): # pragma: no cover
+        pass
+
+
     @abstractmethod
     def read_csv(self): # pragma: no cover
         pass
 
 
+    @abstractmethod
+    def read_csv_chunks(self): # pragma: no cover
+        pass
+
+
 #################################################################################################
 #                                         DataLoader                                            #
 #################################################################################################
@@ -73,22 +159,210 @@ class DataLoader(IFDataLoader):
 
     Methods
     -------
+    read()
+        Reads the file, csv files by `read_csv` and columnar files by the dataset scanner of pyarrow
+    read_chunks()
+        Reads the file chunk by chunk, such that only one chunk is held in memory at once
+    read_statistics()
+        Reads the statistics of the columns of a Parquet file without scanning the data
     read_csv()
-        Reads the csv file
+        Reads the csv file with the C parser of pandas, pyarrow or polars
+    read_csv_chunks()
+        Reads the csv file chunk by chunk, such that only one chunk is held in memory at once
+    read_partitions()
+        Reads the partitions of the dataset concurrently and returns them one by one
     """
     dataset: DataSet = attrs.field(factory = DataSet)
+    engine: str      = attrs.field(factory = str)
+    memory_map: bool = attrs.field(factory = bool)
+    cache_dir: Path  = attrs.field(default = None)
+    cache_size: int  = attrs.field(default = None)
+    cache_key: str   = attrs.field(factory = str)
+    workers: int     = attrs.field(default = None)
 
-    def __init__(self, dataset: DataSet):
+    def __init__(self, dataset: DataSet, engine: str = "auto", memory_map: bool = False, cache_dir: Path = None,
+                 cache_size: int = None, cache_key: str = "mtime", workers: int = None):
         """
         Parameters
         ----------
         dataset: DataSet
             Defines the data source from which the file gets loaded
+        engine: str, optional
+            Engine which parses the whole csv file, either "c" for the C parser of pandas, "pyarrow" or "polars"
+            for their multithreaded parsers or "auto" which uses pyarrow for large files if it is installed,
+            chunks are always parsed by the C parser, by default "auto"
+        memory_map: bool, optional
+            Whether columnar files are memory-mapped instead of being read into buffers, uncompressed Arrow IPC/Feather
+            files are then read zero-copy, by default False
+        cache_dir: Path, optional
+            If given, `read` and `read_chunks` parse a csv file once into an uncompressed Arrow IPC file inside of
+            this directory, all subsequent reads memory-map this file zero-copy instead of parsing the csv file, dataframes
+            which are read by `read` with a transformer are cached as well, by default None
+        cache_size: int, optional
+            Maximal size of the cache in bytes, the least recently used files are evicted when it is exceeded,
+            by default None which does not bound the cache
+        cache_key: str, optional
+            Identifies a changed file either by the time of its last modification "mtime" or by the hash of its
+            content "content", by default "mtime"
+        workers: int, optional
+            Number of threads which read the partitions of a dataset concurrently or decompress the blocks of a BGZF
+            or zstd file, by default None which uses the number of CPUs
+
+        Raises
+        ------
+        ValueError
+            Raised when the cache key is unknown or the size of the cache or the number of workers is not positive
+        """
+        if cache_key not in cache.KEYS:
+            raise ValueError(f"Unknown cache key {cache_key}, choose either 'mtime' or 'content'!")
+        if cache_size is not None and cache_size <= 0:
+            raise ValueError("The size of the cache has to be positive!")
+        if workers is not None and workers < 1:
+            raise ValueError("The number of workers has to be positive!")
+        self.dataset    = dataset
+        self.engine     = engine
+        self.memory_map = memory_map
+        self.cache_dir  = cache_dir
+        self.cache_size = cache_size
+        self.cache_key  = cache_key
+        self.workers    = workers or os.cpu_count()
+
+
+    def read(self, sep: str = ",", lineterminator: str = None, transformer: transform.Transformer = None, columns: list[str] = None,
+             predicates: list[predicate.IFPredicate] = None, engine: str = None) -> pd.DataFrame:
+        """
+        Reads the file into a pandas dataframe, csv files are read by `read_csv` unless they are cached, for
+        columnar files the projection and the predicates are pushed into the dataset scanner of pyarrow, thus only
+        the projected columns are read and row groups are skipped based on their statistics, with a cache
+        directory the transformed dataframe is cached as well
+
+        Parameters
+        ----------
+        sep : str, optional
+            Seperator which is used for csv files, by default ","
+        lineterminator : str, optional
+            Indicates when a line is terminated inside of csv files, by default None
+        transformer : transform.Transformer, optional
+            Transforms dataframes in-place depending on specified columns and which callable
+            to apply on the column
+        columns : list[str], optional
+            Only these columns are read, by default None which reads all columns
+        predicates : list[predicate.IFPredicate], optional
+            Only the rows which satisfy all predicates are kept, by default None
+        engine : str, optional
+            Overrides the engine of the DataLoader for csv files, by default None
+
+        Returns
+        -------
+        pd.DataFrame
+            A pandas dataframe, the partitions of a dataset are read concurrently and concatenated
         """
-        self.dataset = dataset
+        if self.dataset.partitioned:
+            return self.__read_all(transformer = transformer, columns = columns, predicates = predicates, sep = sep,
+                                   lineterminator = lineterminator, engine = engine)
+
+        if self.dataset.file_format == "csv" and self.cache_dir is None:
+            return self.read_csv(sep = sep, lineterminator = lineterminator, transformer = transformer, columns = columns,
+                                 predicates = predicates, engine = engine)
+
+        if isinstance(transformer, transform.IFTransformer) and self.cache_dir is not None:
+            return self.__read_transformed(sep = sep, lineterminator = lineterminator, transformer = transformer, columns = columns,
+                                           predicates = predicates, engine = engine)
+
+        path_to_file, file_format, memory_map = self.__source(sep = sep, lineterminator = lineterminator)
+        if file_format == "feather" and memory_map and not predicates:
+            dataframe = columnar.read_ipc(path_to_file, columns = self.__projection(columns))
+        else:
+            dataset   = columnar.open_dataset(path_to_file, file_format = file_format, memory_map = memory_map)
+            dataframe = columnar.read(dataset, columns = self.__projection(columns), predicates = predicates)
+        dataframe = self.__conform(dataframe)
+        if isinstance(transformer, transform.IFTransformer):
+            dataframe = transformer.transform(dataframe)
 
+        return dataframe
 
-    def read_csv(self, sep: str = ",", lineterminator: str = None, transformer: transform.Transformer = None) -> pd.DataFrame:
+
+    def read_chunks(self, chunksize: int = None, chunk_bytes: int = None, sep: str = ",", lineterminator: str = None,
+                    transformer: transform.Transformer = None, columns: list[str] = None,
+                    predicates: list[predicate.IFPredicate] = None) -> Iterator[pd.DataFrame]:
+        """
+        Streams the file as a sequence of dataframes, csv files are streamed by `read_csv_chunks`,
+        columnar files batch by batch by the dataset scanner of pyarrow, see `read_csv_chunks` for the parameters
+
+        Returns
+        -------
+        Iterator[pd.DataFrame]
+            A stream of pandas dataframes, the row index is continued across chunks and partitions
+
+        Raises
+        ------
+        ValueError
+            Raised when neither `chunksize` nor `chunk_bytes` is given or when they are not positive
+        """
+        if self.dataset.partitioned:
+            return self.__stream_all(chunksize = chunksize, chunk_bytes = chunk_bytes, sep = sep, lineterminator = lineterminator,
+                                     transformer = transformer, columns = columns, predicates = predicates)
+
+        if self.dataset.file_format == "csv" and self.cache_dir is None:
+            return self.read_csv_chunks(chunksize = chunksize, chunk_bytes = chunk_bytes, sep = sep, lineterminator = lineterminator,
+                                        transformer = transformer, columns = columns, predicates = predicates)
+
+        if chunksize is None and chunk_bytes is None:
+            raise ValueError("Either chunksize or chunk_bytes has to be specified!")
+        if chunk_bytes is not None and chunk_bytes <= 0:
+            raise ValueError("The size of a chunk has to be positive!")
+        path_to_file, file_format, memory_map = self.__source(sep = sep, lineterminator = lineterminator)
+        dataset = columnar.open_dataset(path_to_file, file_format = file_format, memory_map = memory_map)
+        if chunksize is None:
+            # the size of the file is a rough estimate of the size of its rows
+            chunksize = max(1, int(chunk_bytes * max(1, dataset.count_rows()) // max(1, os.path.getsize(path_to_file))))
+        if chunksize <= 0:
+            raise ValueError("The size of a chunk has to be positive!")
+
+        return self.__stream_columnar(dataset, chunksize = chunksize, transformer = transformer, columns = columns, predicates = predicates)
+
+
+    def read_statistics(self, columns: list[str] = None) -> pd.DataFrame:
+        """
+        Reads the count, the number of missing values, the minimum and the maximum of the columns
+        of a Parquet file from the statistics of its row groups, without scanning the data, the statistics of
+        the partition columns of a partitioned dataset are derived from the partition values of its files
+
+        Parameters
+        ----------
+        columns : list[str], optional
+            The columns whose statistics are read, by default None which reads all columns
+
+        Returns
+        -------
+        pd.DataFrame
+            The statistics per column, a statistic which is not stored for every row group is None
+
+        Raises
+        ------
+        ValueError
+            Raised when the file is no Parquet file
+        """
+        if self.dataset.file_format != "parquet":
+            raise ValueError(f"Statistics can only be read from Parquet files, but the file is of format {self.dataset.file_format}!")
+        if self.dataset.partitioned:
+            columns = self.__projection(columns)
+            keys    = [key for key in self.dataset.partition_columns if columns is None or key in columns]
+            # the statistics of the partition columns are derived from the partition values of the files
+            def read(index: int) -> pd.DataFrame:
+                path_to_file = self.dataset.partitions[index]
+                statistics   = columnar.parquet_statistics(path_to_file, columns = self.__file_columns(columns))
+                return pd.concat([statistics, partition.partition_statistics(self.dataset.partition_values[index], keys,
+                                                                             rows = columnar.parquet_rows(path_to_file))])
+            with ThreadPoolExecutor(max_workers = self.workers) as pool:
+                statistics = partition.merge_statistics(list(pool.map(read, range(len(self.dataset.partitions)))))
+            return statistics.loc[columns] if columns is not None else statistics
+
+        return columnar.parquet_statistics(self.dataset.path_to_file, columns = self.__projection(columns))
+
+
+    def read_csv(self, sep: str = ",", lineterminator: str = None, transformer: transform.Transformer = None, columns: list[str] = None,
+                 predicates: list[predicate.IFPredicate] = None, engine: str = None) -> pd.DataFrame:
         """
         Extracts data out of a csv file and returns a pandas dataframe
 
@@ -101,14 +375,397 @@ class DataLoader(IFDataLoader):
         transformer : transform.Transformer, optional
             Transforms dataframes in-place depending on specified columns and which callable
             to apply on the column
+        columns : list[str], optional
+            Only these columns are parsed, by default None which parses all columns
+        predicates : list[predicate.IFPredicate], optional
+            Only the rows which satisfy all predicates are kept, the C parser parses and
+            filters the file chunk by chunk, by default None
+        engine : str, optional
+            Overrides the engine of the DataLoader for this call, by default None
 
         Returns
         -------
         pd.DataFrame
             A pandas dataframe
+
+        Raises
+        ------
+        ValueError
+            Raised when the engine is unknown or does not support the line terminator
+        ImportError
+            Raised when the package of the engine is not installed
+        """
+        if self.dataset.partitioned:
+            return self.__read_all(transformer = transformer, columns = columns, predicates = predicates, sep = sep,
+                                   lineterminator = lineterminator, engine = engine)
+
+        parser = engines.create_engine(engine or self.engine, path_to_file = self.dataset.path_to_file, lineterminator = lineterminator)
+        if predicates and isinstance(parser, engines.CEngine):
+            chunks    = self.__stream_csv(chunksize = FILTER_CHUNKSIZE, sep = sep, lineterminator = lineterminator, transformer = None,
+                                          columns = columns, predicates = predicates)
+            dataframe = pd.concat(list(chunks), ignore_index = True)
+            # the categories of the chunks can differ
+            dataframe = self.__conform(dataframe)
+        else:
+            with self.__open() as source:
+                dataframe = parser.read(source, sep = sep, lineterminator = lineterminator, options = self.__read_options(columns, predicates))
+            dataframe = self.__conform(dataframe)
+            if predicates:
+                dataframe = predicate.select(dataframe, predicates).reset_index(drop = True)
+            if columns is not None:
+                dataframe = dataframe[columns]
+        if isinstance(transformer, transform.IFTransformer):
+            dataframe = transformer.transform(dataframe)
+
+        return dataframe
+
+
+    def read_csv_chunks(self, chunksize: int = None, chunk_bytes: int = None, sep: str = ",", lineterminator: str = None,
+                        transformer: transform.Transformer = None, columns: list[str] = None,
+                        predicates: list[predicate.IFPredicate] = None) -> Iterator[pd.DataFrame]:
+        """
+        Streams the csv file as a sequence of dataframes, only one chunk is held in memory
+        at a time which keeps the memory footprint bounded, independent of the file size
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            Number of rows per chunk, by default None
+        chunk_bytes : int, optional
+            Approximate memory budget per chunk in bytes of the raw file, it is translated into a number of rows
+            based on the average row length of the head of the file, only used if `chunksize` is None, by default None
+        sep : str, optional
+            Seperator which is used for the csv file, by default ","
+        lineterminator : str, optional
+            Indicates when a line is terminated inside of the csv file, by default None
+        transformer : transform.Transformer, optional
+            Transforms every chunk in-place depending on specified columns and which callable
+            to apply on the column
+        columns : list[str], optional
+            Only these columns are parsed, by default None which parses all columns
+        predicates : list[predicate.IFPredicate], optional
+            Only the rows which satisfy all predicates are kept, thus chunks can be smaller
+            than `chunksize`, by default None
+
+        Returns
+        -------
+        Iterator[pd.DataFrame]
+            A stream of pandas dataframes, the row index is continued across chunks and refers
+            to the rows of the file
+
+        Raises
+        ------
+        ValueError
+            Raised when neither `chunksize` nor `chunk_bytes` is given or when they are not positive
+        """
+        if self.dataset.partitioned:
+            return self.__stream_all(chunksize = chunksize, chunk_bytes = chunk_bytes, sep = sep, lineterminator = lineterminator,
+                                     transformer = transformer, columns = columns, predicates = predicates)
+
+        if chunksize is None and chunk_bytes is None:
+            raise ValueError("Either chunksize or chunk_bytes has to be specified!")
+        if chunksize is None:
+            chunksize = self.__estimate_rows(chunk_bytes = chunk_bytes, lineterminator = lineterminator)
+        if chunksize <= 0:
+            raise ValueError("The size of a chunk has to be positive!")
+
+        return self.__stream_csv(chunksize = chunksize, sep = sep, lineterminator = lineterminator, transformer = transformer,
+                                 columns = columns, predicates = predicates)
+
+
+    def read_partitions(self, sep: str = ",", lineterminator: str = None, transformer: transform.Transformer = None,
+                        columns: list[str] = None, predicates: list[predicate.IFPredicate] = None, engine: str = None) -> Iterator[pd.DataFrame]:
         """
-        dataframe = pd.read_csv(self.dataset.path_to_file, sep = sep, lineterminator = lineterminator)
-        if isinstance(transformer, transform.Transformer):
+        Streams the dataset partition by partition, the partitions are read concurrently by a pool of `workers`
+        threads but returned in their sorted order, at most `workers` partitions are held in memory at once.
+        Partitions whose Hive values do not satisfy the predicates are not read at all, see `read` for the parameters
+
+        Returns
+        -------
+        Iterator[pd.DataFrame]
+            A stream of pandas dataframes, one per partition, every partition is transformed separately
+        """
+        selected = self.__prune(predicates)
+
+        return self.__stream_partitions(selected, sep = sep, lineterminator = lineterminator, transformer = transformer,
+                                        columns = columns, predicates = predicates, engine = engine)
+
+
+    def __read_all(self, transformer: transform.Transformer = None, columns: list[str] = None,
+                   predicates: list[predicate.IFPredicate] = None, **options) -> pd.DataFrame:
+        """ Reads all partitions concurrently and concatenates them, the transformer is applied on the whole dataframe """
+        frames    = list(self.__stream_partitions(self.__prune(predicates), transformer = None, columns = columns,
+                                                  predicates = predicates, **options))
+        dataframe = pd.concat(frames, ignore_index = True) if frames else pd.DataFrame(columns = columns)
+        dataframe = self.__conform(dataframe)
+        if isinstance(transformer, transform.IFTransformer):
             dataframe = transformer.transform(dataframe)
 
-        return dataframe
\ No newline at end of file
+        return dataframe
+
+
+    def __stream_partitions(self, selected: list[int], columns: list[str] = None, predicates: list[predicate.IFPredicate] = None,
+                            transformer: transform.Transformer = None, **options) -> Iterator[pd.DataFrame]:
+        """ Generator behind `read_partitions`, a partition is read by a DataLoader of its file """
+        def read(index: int) -> pd.DataFrame:
+            dataframe = self.__partition_loader(index).read(columns = self.__file_columns(columns), predicates = self.__file_predicates(predicates),
+                                                            **options)
+            return self.__with_partition_columns(dataframe, index, columns)
+
+        with ThreadPoolExecutor(max_workers = self.workers) as pool:
+            for dataframe in partition.ordered(pool, read, selected, window = self.workers):
+                if isinstance(transformer, transform.IFTransformer):
+                    dataframe = transformer.transform(dataframe)
+                yield dataframe
+
+
+    def __stream_all(self, chunksize: int = None, chunk_bytes: int = None, transformer: transform.Transformer = None,
+                     columns: list[str] = None, predicates: list[predicate.IFPredicate] = None, **options) -> Iterator[pd.DataFrame]:
+        """ Streams the chunks of all partitions one partition after another, the arguments are validated beforehand """
+        if chunksize is None and chunk_bytes is None:
+            raise ValueError("Either chunksize or chunk_bytes has to be specified!")
+        if (chunksize is not None and chunksize <= 0) or (chunk_bytes is not None and chunk_bytes <= 0):
+            raise ValueError("The size of a chunk has to be positive!")
+
+        return self.__chain(self.__prune(predicates), chunksize = chunksize, chunk_bytes = chunk_bytes, transformer = transformer,
+                            columns = columns, predicates = predicates, **options)
+
+
+    def __chain(self, selected: list[int], transformer: transform.Transformer = None, columns: list[str] = None,
+                predicates: list[predicate.IFPredicate] = None, **options) -> Iterator[pd.DataFrame]:
+        """ Generator behind `__stream_all`, the row index of a partition continues after the last row of the previous one """
+        offset = 0
+        for index in selected:
+            chunks = self.__partition_loader(index).read_chunks(columns = self.__file_columns(columns),
+                                                                predicates = self.__file_predicates(predicates), **options)
+            end    = offset
+            for chunk in chunks:
+                chunk       = self.__with_partition_columns(chunk, index, columns)
+                chunk.index = chunk.index + offset
+                end         = max(end, chunk.index.max() + 1) if len(chunk) else end
+                if isinstance(transformer, transform.IFTransformer):
+                    chunk = transformer.transform(chunk)
+                yield chunk
+            offset = end
+
+
+    def __partition_loader(self, index: int) -> "DataLoader":
+        """ DataLoader of a single partition which shares the options of this DataLoader """
+        dataset = DataSet(self.dataset.partitions[index], schema = self.dataset.schema, file_format = self.dataset.file_format,
+                          compression = self.dataset.compression)
+
+        return DataLoader(dataset, engine = self.engine, memory_map = self.memory_map, cache_dir = self.cache_dir,
+                          cache_size = self.cache_size, cache_key = self.cache_key, workers = 1)
+
+
+    def __prune(self, predicates: list[predicate.IFPredicate] = None) -> list[int]:
+        """ Positions of the partitions whose Hive values satisfy the predicates on the partition columns """
+        keys = self.dataset.partition_columns
+
+        return partition.prune(self.dataset.partition_values, [condition for condition in predicates or [] if condition.column in keys])
+
+
+    def __file_predicates(self, predicates: list[predicate.IFPredicate] = None) -> list[predicate.IFPredicate]:
+        """ The predicates which are evaluated on the rows of a file, i.e. which are not on partition columns """
+        if predicates is None:
+            return None
+
+        return [condition for condition in predicates if condition.column not in self.dataset.partition_columns]
+
+
+    def __file_columns(self, columns: list[str] = None) -> list[str]:
+        """ The projection onto the columns of a file, i.e. without the partition columns """
+        if columns is None:
+            return None
+
+        return [column for column in columns if column not in self.dataset.partition_columns]
+
+
+    def __with_partition_columns(self, dataframe: pd.DataFrame, index: int, columns: list[str] = None) -> pd.DataFrame:
+        """ Adds the Hive values of a partition as columns, only the projected ones if columns are given """
+        values = self.dataset.partition_values[index]
+        keys   = [key for key in self.dataset.partition_columns if columns is None or key in columns]
+        if not keys:
+            return dataframe
+        dtypes    = self.dataset.partition_dtypes
+        dataframe = dataframe.assign(**{key: pd.Series(values.get(key), index = dataframe.index, dtype = dtypes[key]) if key in dtypes else values.get(key)
+                                        for key in keys})
+
+        return dataframe[columns] if columns is not None else dataframe
+
+
+    def __stream_csv(self, chunksize: int, sep: str, lineterminator: str, transformer: transform.Transformer, columns: list[str] = None,
+                     predicates: list[predicate.IFPredicate] = None) -> Iterator[pd.DataFrame]:
+        """
+        Generator behind `read_csv_chunks`, the arguments are validated beforehand such that
+        errors are raised when the stream is requested and not when it is consumed
+        """
+        predicates = predicates or []
+        options    = self.__read_options(columns, predicates)
+        with self.__open() as source, pd.read_csv(source, sep = sep, lineterminator = lineterminator, chunksize = chunksize, **options) as reader:
+            for chunk in reader:
+                chunk = self.__conform(chunk)
+                if predicates:
+                    chunk = predicate.select(chunk, predicates)
+                if columns is not None:
+                    # columns which are only read for the predicates are dropped
+                    chunk = chunk[columns]
+                if isinstance(transformer, transform.IFTransformer):
+                    chunk = transformer.transform(chunk)
+                yield chunk
+
+
+    def __open(self) -> Any:
+        """
+        Opens the csv file, an uncompressed file is passed to the parser by its path, a compressed file as a stream
+        which is decompressed by a background thread while the parser consumes it
+
+        Returns
+        -------
+        Any
+            A context manager which yields either the path or the stream of decompressed bytes
+        """
+        if self.dataset.compression is None:
+            return contextlib.nullcontext(self.dataset.path_to_file)
+
+        return compressions.open_stream(self.dataset.path_to_file, self.dataset.compression, threads = self.workers)
+
+
+    def __source(self, sep: str = ",", lineterminator: str = None) -> tuple[Path, str, bool]:
+        """
+        The columnar file which is read instead of the file of the dataset, a csv file is parsed into the cache
+        once if it is not cached yet, chunk by chunk, thus it is never held in memory at once
+
+        Returns
+        -------
+        tuple[Path, str, bool]
+            The path to the columnar file, its format and whether it is memory-mapped
+        """
+        if self.dataset.file_format != "csv":
+            return self.dataset.path_to_file, self.dataset.file_format, self.memory_map
+
+        # the cache is always built by the C parser, thus it is shared by all engines
+        path_to_file = cache.cached_path(self.cache_dir, self.dataset.path_to_file, key = self.cache_key, sep = sep,
+                                         lineterminator = lineterminator, options = self.__read_options())
+        if not cache.hit(path_to_file):
+            columnar.write_ipc_chunks(lambda: self.__stream_csv(chunksize = CACHE_CHUNKSIZE, sep = sep, lineterminator = lineterminator,
+                                                                transformer = None), path_to_file)
+            self.__evict(path_to_file)
+
+        return path_to_file, "feather", True
+
+
+    def __read_transformed(self, sep: str, lineterminator: str, transformer: transform.Transformer, columns: list[str] = None,
+                           predicates: list[predicate.IFPredicate] = None, engine: str = None) -> pd.DataFrame:
+        """
+        Reads the transformed dataframe from the cache, it is read and transformed once if it is not cached yet,
+        a transformer whose functions capture values which cannot be identified by their content is never cached
+        """
+        key = cache.transformer_key(transformer)
+        if key is None:
+            return transformer.transform(self.read(sep = sep, lineterminator = lineterminator, columns = columns, predicates = predicates, engine = engine))
+
+        path_to_file = cache.cached_path(self.cache_dir, self.dataset.path_to_file, key = self.cache_key, sep = sep,
+                                         lineterminator = lineterminator, options = self.__read_options(), engine = engine or self.engine,
+                                         columns = columns, predicates = repr(predicates), transformer = key)
+        if cache.hit(path_to_file):
+            return columnar.read_ipc(path_to_file)
+
+        dataframe = self.read(sep = sep, lineterminator = lineterminator, columns = columns, predicates = predicates, engine = engine)
+        self.__store(transformer.transform(dataframe), path_to_file)
+
+        # a hit and a miss return the same memory-mapped dataframe
+        return columnar.read_ipc(path_to_file)
+
+
+    def __store(self, dataframe: pd.DataFrame, path_to_file: Path) -> None:
+        """ Writes a dataframe into the cache and evicts the least recently used files if the cache is too large """
+        columnar.write_ipc(dataframe, path_to_file)
+        self.__evict(path_to_file)
+
+
+    def __evict(self, path_to_file: Path) -> None:
+        """ Evicts the least recently used files except of `path_to_file` if the cache is too large """
+        if self.cache_size is not None:
+            cache.evict(self.cache_dir, self.cache_size, keep = path_to_file)
+
+
+    def __stream_columnar(self, dataset: Any, chunksize: int, transformer: transform.Transformer, columns: list[str] = None,
+                          predicates: list[predicate.IFPredicate] = None) -> Iterator[pd.DataFrame]:
+        """ Generator behind `read_chunks` for columnar files """
+        for chunk in columnar.scan(dataset, columns = self.__projection(columns), predicates = predicates, batch_size = chunksize):
+            chunk = self.__conform(chunk)
+            if isinstance(transformer, transform.IFTransformer):
+                chunk = transformer.transform(chunk)
+            yield chunk
+
+
+    def __projection(self, columns: list[str] = None) -> list[str]:
+        """ The columns which are read from a columnar file, the declared columns of the schema if no columns are given """
+        if columns is None and self.dataset.schema is not None:
+            return self.dataset.schema.names
+        return columns
+
+
+    def __read_options(self, columns: list[str] = None, predicates: list[predicate.IFPredicate] = None) -> dict:
+        """
+        Arguments for `pd.read_csv` which are derived from the schema of the dataset and the projection
+        onto `columns`, columns which are needed to evaluate the predicates are parsed as well
+        """
+        options = self.dataset.schema.read_options() if self.dataset.schema is not None else {}
+        if columns is None:
+            return options
+
+        usecols = list(dict.fromkeys([*columns, *(condition.column for condition in predicates or [])]))
+        options = {'usecols': usecols,
+                   'dtype': {column: dtype for column, dtype in options.get('dtype', {}).items() if column in usecols},
+                   'parse_dates': [column for column in options.get('parse_dates', []) if column in usecols]}
+
+        return options
+
+
+    def __conform(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """ Converts the columns which are not parsed into their declared types by `pd.read_csv` """
+        if self.dataset.schema is None:
+            return dataframe
+        return self.dataset.schema.conform(dataframe)
+
+
+    def __estimate_rows(self, chunk_bytes: int, lineterminator: str = None, sample_lines: int = 1000) -> int:
+        """
+        Translates a byte budget into a number of rows by measuring the average length
+        of the first `sample_lines` lines of the file
+
+        Parameters
+        ----------
+        chunk_bytes : int
+            Budget of raw bytes per chunk
+        lineterminator : str, optional
+            Indicates when a line is terminated inside of the csv file, by default None
+        sample_lines : int, optional
+            Number of lines used for the estimation, by default 1000
+
+        Returns
+        -------
+        int
+            Number of rows which roughly fit into `chunk_bytes`
+        """
+        if chunk_bytes <= 0:
+            raise ValueError("The size of a chunk has to be positive!")
+
+        terminator = (lineterminator or "\n").encode()
+        file       = open(self.dataset.path_to_file, "rb") if self.dataset.compression is None else self.__open()
+        with file:
+            buffer = file.read(1 << 20)
+
+        lines = buffer.split(terminator)
+        if len(buffer) == 1 << 20:
+            # the last line might be cut off by the buffer
+            lines = lines[:-1]
+        # the header is skipped
+        lines = [line for line in lines[1:sample_lines + 1] if line]
+        if not lines:
+            return 1
+        average_row_bytes = sum(len(line) + len(terminator) for line in lines) / len(lines)
+
+        return max(1, int(chunk_bytes // average_row_bytes))
\ No newline at end of file
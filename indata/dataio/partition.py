@@ -0,0 +1,226 @@
+"""
+A dataset can be split up into many files, e.g. one file per day. The files are found by a glob
+pattern or inside of a directory, in Hive-style layouts like `year=2023/month=01/part-0.parquet`
+the `key=value` directories become columns of the rows inside of the files. Predicates on these
+columns prune whole files before they are read
+"""
+
+import os
+import glob
+import pandas as pd
+
+from pathlib            import Path
+from typing             import Any, Callable, Iterable, Iterator
+from concurrent.futures import Executor
+
+import indata.dataio.predicate as predicate
+
+
+# value of a Hive partition whose key is missing
+HIVE_NULL = "__HIVE_DEFAULT_PARTITION__"
+
+
+def is_pattern(path: Path) -> bool:
+    """ Whether the path is a glob pattern """
+    return glob.has_magic(str(path))
+
+
+def discover(path: Path) -> tuple[list[Path], list[dict[str, Any]]]:
+    """
+    Finds the files of a dataset in sorted order, hidden files and files starting with an underscore,
+    e.g. `_SUCCESS` or `_metadata`, are skipped
+
+    Parameters
+    ----------
+    path : Path
+        A glob pattern, e.g. `./data/*.csv` or `./data/**/*.parquet`, or a directory which is searched recursively
+
+    Returns
+    -------
+    tuple[list[Path], list[dict[str, Any]]]
+        The files and the values of their Hive partitions keyed by the partition columns, the values
+        of a column are converted into numbers if all of them are numeric
+    """
+    if is_pattern(path):
+        root  = _static_prefix(str(path))
+        files = [Path(file) for file in glob.glob(str(path), recursive = True) if os.path.isfile(file)]
+    else:
+        root  = str(path)
+        files = [Path(directory) / name for directory, _, names in os.walk(path) for name in names]
+    files  = sorted(file for file in files if not _hidden(file))
+    values = [_hive_values(os.path.relpath(file.parent, root)) for file in files]
+
+    return files, _typed(values)
+
+
+def prune(values: list[dict[str, Any]], predicates: Iterable[predicate.IFPredicate]) -> list[int]:
+    """
+    Evaluates the predicates on the partition columns of every file
+
+    Parameters
+    ----------
+    values : list[dict[str, Any]]
+        The values of the Hive partitions of every file
+    predicates : Iterable[predicate.IFPredicate]
+        Predicates on partition columns
+
+    Returns
+    -------
+    list[int]
+        Positions of the files whose rows can satisfy the predicates
+    """
+    predicates = list(predicates)
+    if not predicates or not values:
+        return list(range(len(values)))
+
+    return predicate.select(pd.DataFrame(values), predicates).index.tolist()
+
+
+def merge_statistics(statistics: list[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Merges the statistics of the columns of several Parquet files, see `columnar.parquet_statistics`,
+    a statistic is None if it is unknown for any file which contains values of the column
+
+    Parameters
+    ----------
+    statistics : list[pd.DataFrame]
+        Count, missing values, minimum and maximum per column and file
+
+    Returns
+    -------
+    pd.DataFrame
+        Count, missing values, minimum and maximum per column
+    """
+    merged = {}
+    for column in statistics[0].index:
+        rows   = [frame.loc[column] for frame in statistics]
+        counts = [row['Count'] for row in rows]
+        filled = [row for row in rows if row['Count'] is None or pd.isna(row['Count']) or row['Count'] > 0]
+        known  = all(row['Min'] is not None and not pd.isna(row['Min']) for row in filled)
+        merged[column] = {'Count': None if any(_missing(count) for count in counts) else sum(counts),
+                          'Missing': None if any(_missing(row['Missing']) for row in rows) else sum(row['Missing'] for row in rows),
+                          'Min': min(row['Min'] for row in filled) if known and filled else None,
+                          'Max': max(row['Max'] for row in filled) if known and filled else None}
+
+    return pd.DataFrame.from_dict(merged, orient = "index")
+
+
+def partition_statistics(values: dict[str, Any], keys: list[str], rows: int) -> pd.DataFrame:
+    """
+    The statistics of the partition columns of a file in the layout of `columnar.parquet_statistics`, every row of the
+    file holds the value of its partition, thus it is the minimum and the maximum, a missing value counts as missing in every row
+
+    Parameters
+    ----------
+    values : dict[str, Any]
+        The values of the Hive partitions of the file
+    keys : list[str]
+        The partition columns whose statistics are returned
+    rows : int
+        The number of rows of the file
+
+    Returns
+    -------
+    pd.DataFrame
+        Count, missing values, minimum and maximum per partition column
+    """
+    statistics = {}
+    for key in keys:
+        value           = values.get(key)
+        present         = not _missing(value)
+        statistics[key] = {'Count': rows if present else 0, 'Missing': 0 if present else rows,
+                           'Min': value if present else None, 'Max': value if present else None}
+
+    return pd.DataFrame.from_dict(statistics, orient = "index", columns = ["Count", "Missing", "Min", "Max"])
+
+
+def ordered(pool: Executor, function: Callable, items: Iterable[Any], window: int) -> Iterator[Any]:
+    """
+    Applies `function` on the items in a pool and yields the results in the order of the items,
+    at most `window` results are pending at once, thus the memory stays bounded
+
+    Parameters
+    ----------
+    pool : Executor
+        The pool
+    function : Callable
+        Function which receives an item
+    items : Iterable[Any]
+        The items
+    window : int
+        Maximal number of submitted items whose results were not yielded yet
+
+    Returns
+    -------
+    Iterator[Any]
+        The results in the order of the items
+    """
+    pending = []
+    for item in items:
+        pending.append(pool.submit(function, item))
+        if len(pending) >= window:
+            yield pending.pop(0).result()
+    while pending:
+        yield pending.pop(0).result()
+
+
+def _static_prefix(pattern: str) -> str:
+    """ The directory of a glob pattern in front of its first wildcard """
+    parts = []
+    for part in Path(pattern).parts:
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+
+    return str(Path(*parts)) if parts else "."
+
+
+def _hidden(path_to_file: Path) -> bool:
+    """ Whether a file is hidden or marks metadata, like `.crc` files or `_SUCCESS` """
+    return path_to_file.name.startswith((".", "_"))
+
+
+def _hive_values(relative: str) -> dict[str, str]:
+    """ The `key=value` directories of a relative path """
+    values = {}
+    for part in Path(relative).parts:
+        key, separator, value = part.partition("=")
+        if separator and key:
+            values[key] = None if value == HIVE_NULL else value
+
+    return values
+
+
+def _typed(values: list[dict[str, str]]) -> list[dict[str, Any]]:
+    """
+    Converts the values of every partition column into numbers if all of them are numeric, the type of a column
+    is inferred from its present values only, thus integers stay integers if the key is missing for some files
+    """
+    if not values or not any(values):
+        return values
+    keys  = list(dict.fromkeys(key for row in values for key in row))
+    typed = [{key: row.get(key) for key in keys} for row in values]
+    for key in keys:
+        present = [row[key] for row in typed if not _missing(row[key])]
+        try:
+            numbers = iter(pd.to_numeric(pd.Series(present, dtype = object)).tolist())
+        except (ValueError, TypeError):
+            continue
+        for row in typed:
+            if not _missing(row[key]):
+                row[key] = next(numbers)
+
+    return typed
+
+
+def dtypes(values: list[dict[str, Any]]) -> dict[str, str]:
+    """ The nullable dtype "Int64" of the partition columns whose values are integers but missing for some files, see `_typed` """
+    keys = list(dict.fromkeys(key for row in values for key in row))
+
+    return {key: "Int64" for key in keys if any(_missing(row.get(key)) for row in values)
+            and all(isinstance(row.get(key), int) for row in values if not _missing(row.get(key)))}
+
+
+def _missing(value: Any) -> bool:
+    """ Whether a value is None or NaN """
+    return value is None or (isinstance(value, float) and pd.isna(value))
\ No newline at end of file
@@ -0,0 +1,194 @@
+"""
+Predicates select the rows of a file while it is read, every predicate refers to a
+single column and a row is kept if it satisfies all predicates. Only the selected rows
+are kept in memory, chunk by chunk
+"""
+
+import attrs
+import pandas as pd
+
+from abc    import abstractmethod
+from typing import Any, Iterable
+
+
+#################################################################################################
+#                                   Interface Predicate                                         #
+#################################################################################################
+
+class IFPredicate:
+    """
+    Interface for predicates
+
+    Methods
+    -------
+    mask()
+        Evaluates the predicate on a dataframe
+    expression()
+        Translates the predicate into an expression of a pyarrow dataset scanner
+    """
+
+    @abstractmethod
+    def mask(self): # pragma: no cover
+        pass
+
+
+    @abstractmethod
+    def expression(self): # pragma: no cover
+        pass
+
+
+#################################################################################################
+#                                       Predicates                                              #
+#################################################################################################
+
+@attrs.define()
+class Range(IFPredicate):
+    """
+    Selects the rows whose value lies between `lower` and `upper`, both bounds are included
+    """
+    column: str = attrs.field(factory = str)
+    lower: Any  = attrs.field(default = None)
+    upper: Any  = attrs.field(default = None)
+
+    def __init__(self, column: str, lower: Any = None, upper: Any = None):
+        """
+        Parameters
+        ----------
+        column : str
+            Name of the column
+        lower : Any, optional
+            Lower bound, by default None which does not bound the values from below
+        upper : Any, optional
+            Upper bound, by default None which does not bound the values from above
+
+        Raises
+        ------
+        ValueError
+            Raised when neither bound is given
+        """
+        if lower is None and upper is None:
+            raise ValueError(f"At least one bound has to be given for the range of column {column}!")
+        self.column = column
+        self.lower  = lower
+        self.upper  = upper
+
+
+    def mask(self, dataframe: pd.DataFrame) -> pd.Series:
+        """ Boolean mask of the rows whose value lies in the range, missing values are not in range """
+        values = dataframe[self.column]
+        mask   = values.notna()
+        if self.lower is not None:
+            mask &= values >= self.lower
+        if self.upper is not None:
+            mask &= values <= self.upper
+
+        return mask.fillna(False).astype(bool)
+
+
+    def expression(self) -> Any:
+        """ The predicate as a `pyarrow.dataset.Expression` """
+        import pyarrow.dataset as ds
+
+        expression = ds.field(self.column).is_valid()
+        if self.lower is not None:
+            expression &= ds.field(self.column) >= self.lower
+        if self.upper is not None:
+            expression &= ds.field(self.column) <= self.upper
+
+        return expression
+
+
+@attrs.define()
+class Equals(IFPredicate):
+    """
+    Selects the rows whose value equals `value`, or one of the values if a list is given
+    """
+    column: str = attrs.field(factory = str)
+    value: Any  = attrs.field(default = None)
+
+    def __init__(self, column: str, value: Any):
+        """
+        Parameters
+        ----------
+        column : str
+            Name of the column
+        value : Any
+            The value or a list, tuple or set of values
+        """
+        self.column = column
+        self.value  = value
+
+
+    def mask(self, dataframe: pd.DataFrame) -> pd.Series:
+        """ Boolean mask of the rows whose value equals `value` """
+        values = dataframe[self.column]
+        if isinstance(self.value, (list, tuple, set)):
+            return values.isin(self.value)
+
+        return values.eq(self.value).fillna(False).astype(bool)
+
+
+    def expression(self) -> Any:
+        """ The predicate as a `pyarrow.dataset.Expression` """
+        import pyarrow.dataset as ds
+
+        if isinstance(self.value, (list, tuple, set)):
+            return ds.field(self.column).isin(list(self.value))
+
+        return ds.field(self.column) == self.value
+
+
+@attrs.define()
+class NotNull(IFPredicate):
+    """
+    Selects the rows which have a value in the column
+    """
+    column: str = attrs.field(factory = str)
+
+    def __init__(self, column: str):
+        """
+        Parameters
+        ----------
+        column : str
+            Name of the column
+        """
+        self.column = column
+
+
+    def mask(self, dataframe: pd.DataFrame) -> pd.Series:
+        """ Boolean mask of the rows which are not missing """
+        return dataframe[self.column].notna()
+
+
+    def expression(self) -> Any:
+        """ The predicate as a `pyarrow.dataset.Expression` """
+        import pyarrow.dataset as ds
+
+        return ds.field(self.column).is_valid()
+
+
+#################################################################################################
+#                                         Helpers                                               #
+#################################################################################################
+
+def select(dataframe: pd.DataFrame, predicates: Iterable[IFPredicate]) -> pd.DataFrame:
+    """
+    Selects the rows of a dataframe which satisfy all predicates
+
+    Parameters
+    ----------
+    dataframe : pd.DataFrame
+        Dataframe which contains all columns the predicates refer to
+    predicates : Iterable[IFPredicate]
+        The predicates
+
+    Returns
+    -------
+    pd.DataFrame
+        The selected rows, their index is kept
+    """
+    mask = pd.Series(True, index = dataframe.index)
+    for predicate in predicates:
+        mask &= predicate.mask(dataframe)
+
+    return dataframe if mask.all() else dataframe[mask]
\ No newline at end of file
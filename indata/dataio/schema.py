@@ -0,0 +1,168 @@
+"""
+A Schema declares the columns of a file together with their types, such that the parser
+does not need to infer the dtypes and categorical columns are stored as categories right away.
+Furthermore, the schema splits the columns into continuous and categorical features
+"""
+
+import attrs
+import pandas as pd
+
+
+# dtypes which can be declared for a column, nullable columns of integers and booleans
+# are parsed into the extension dtypes of pandas
+DTYPES = {'float': ("float64", "float64"), 'int': ("Int64", "int64"), 'bool': ("boolean", "bool"),
+          'string': ("object", "object"), 'category': ("category", "category"), 'datetime': (None, None)}
+
+
+#################################################################################################
+#                                          Column                                               #
+#################################################################################################
+
+@attrs.define()
+class Column:
+    """
+    Declaration of a single column of a file
+    """
+    name: str         = attrs.field(factory = str)
+    dtype: str        = attrs.field(factory = str)
+    categorical: bool = attrs.field(factory = bool)
+    nullable: bool    = attrs.field(default = True)
+    date_format: str  = attrs.field(default = None)
+
+    def __init__(self, name: str, dtype: str, categorical: bool = None, nullable: bool = True, date_format: str = None):
+        """
+        Parameters
+        ----------
+        name : str
+            Name of the column inside of the file
+        dtype : str
+            Either "float", "int", "bool", "string", "category" or "datetime"
+        categorical : bool, optional
+            Whether the column is a categorical feature, by default None which declares "bool",
+            "string" and "category" columns as categorical, categorical strings are parsed as categories
+        nullable : bool, optional
+            Whether the column may contain missing values, by default True
+        date_format : str, optional
+            Format of the dates of a "datetime" column, e.g. "%d.%m.%Y", by default None which infers the format
+
+        Raises
+        ------
+        ValueError
+            Raised when the dtype is unknown or a date format is given for a column which is no "datetime" column
+        """
+        if dtype not in DTYPES:
+            raise ValueError(f"Unknown dtype {dtype} of column {name}, choose one of {list(DTYPES)}!")
+        if date_format is not None and dtype != "datetime":
+            raise ValueError(f"A date format can only be given for datetime columns, but column {name} is of dtype {dtype}!")
+        self.name        = name
+        self.dtype       = dtype
+        self.categorical = categorical if categorical is not None else dtype in ("bool", "string", "category")
+        self.nullable    = nullable
+        self.date_format = date_format
+
+
+    @property
+    def pandas_dtype(self) -> str:
+        """ The dtype which is passed to the parser, None for datetime columns """
+        if self.dtype == "string" and self.categorical:
+            return "category"
+        nullable_dtype, dtype = DTYPES[self.dtype]
+
+        return nullable_dtype if self.nullable else dtype
+
+
+#################################################################################################
+#                                          Schema                                               #
+#################################################################################################
+
+@attrs.define()
+class Schema:
+    """
+    Declaration of the columns of a file, only the declared columns are read
+
+    Methods
+    -------
+    read_options()
+        Arguments for `pd.read_csv` which parse the columns according to the schema
+    conform(dataframe: pd.DataFrame)
+        Converts the columns of a parsed dataframe which are not yet of their declared type
+    """
+    columns: list[Column] = attrs.field(factory = list)
+
+    def __init__(self, columns: list[Column]):
+        """
+        Parameters
+        ----------
+        columns : list[Column]
+            The declared columns, in any order
+
+        Raises
+        ------
+        ValueError
+            Raised when a column is declared more than once
+        """
+        names = [column.name for column in columns]
+        if len(set(names)) != len(names):
+            raise ValueError(f"The columns {names} of the schema are not unique!")
+        self.columns = list(columns)
+
+
+    @property
+    def names(self) -> list[str]:
+        """ The names of all declared columns """
+        return [column.name for column in self.columns]
+
+
+    @property
+    def continuous_features(self) -> list[str]:
+        """ The names of the numeric columns which are not categorical """
+        return [column.name for column in self.columns if column.dtype in ("float", "int") and not column.categorical]
+
+
+    @property
+    def categorical_features(self) -> list[str]:
+        """ The names of the categorical columns """
+        return [column.name for column in self.columns if column.categorical]
+
+
+    def read_options(self) -> dict:
+        """
+        Arguments for `pd.read_csv` which parse the columns according to the schema, dates
+        with a declared format are converted by `conform`
+
+        Returns
+        -------
+        dict
+            The arguments `usecols`, `dtype` and `parse_dates`
+        """
+        dtypes      = {column.name: column.pandas_dtype for column in self.columns if column.dtype != "datetime"}
+        parse_dates = [column.name for column in self.columns if column.dtype == "datetime" and column.date_format is None]
+
+        return {'usecols': self.names, 'dtype': dtypes, 'parse_dates': parse_dates}
+
+
+    def conform(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Converts the columns of a parsed dataframe which are not yet of their declared type, e.g. dates
+        with a declared format or categories which were concatenated from chunks with different categories
+
+        Parameters
+        ----------
+        dataframe : pd.DataFrame
+            Dataframe which was parsed with the `read_options`
+
+        Returns
+        -------
+        pd.DataFrame
+            The dataframe with all columns converted in-place
+        """
+        for column in self.columns:
+            if column.name not in dataframe.columns:
+                continue
+            if column.dtype == "datetime":
+                if not pd.api.types.is_datetime64_any_dtype(dataframe[column.name]):
+                    dataframe[column.name] = pd.to_datetime(dataframe[column.name], format = column.date_format)
+            elif dataframe[column.name].dtype != column.pandas_dtype:
+                dataframe[column.name] = dataframe[column.name].astype(column.pandas_dtype)
+
+        return dataframe
\ No newline at end of file
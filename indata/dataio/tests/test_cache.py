@@ -0,0 +1,199 @@
+"""
+Testing the cache of parsed csv files
+"""
+
+import os
+import shutil
+import pytest
+import pandas as pd
+
+import indata.dataio.columnar as columnar
+import indata.dataio.cache    as cache
+import indata.dataio.load     as load
+from indata.dataio import DataLoader, DataSet, NotNull, Transformer, impute_mean
+
+
+class TestCache:
+    @pytest.fixture()
+    def setup(self, tmp_path):
+        """ Yields a copy of the test data and a cache directory """
+        pytest.importorskip("pyarrow")
+        path_to_file = tmp_path / "test2.csv"
+        shutil.copy(os.path.join(os.path.abspath(os.path.dirname(__file__)), "test2.csv"), path_to_file)
+
+        yield path_to_file, tmp_path / "cache"
+
+
+    def test_reading_s01(self, setup):
+        """ Test whether a csv file is parsed once into the cache and read from it afterwards """
+
+        """ PREPARATION """
+        path_to_file, cache_dir = setup
+        data_loader = DataLoader(dataset = DataSet(path_to_file = path_to_file), cache_dir = cache_dir)
+        exp_data_frame = DataLoader(dataset = DataSet(path_to_file = path_to_file)).read()
+
+        """ EXECUTION """
+        data_loader.read()
+        cached_files   = os.listdir(cache_dir)
+        act_data_frame = data_loader.read()
+        act_selection  = data_loader.read(columns = ["Item4"], predicates = [NotNull("Item1")])
+        act_chunks     = list(data_loader.read_chunks(chunksize = 3))
+
+        """ VERIFICATION """
+        assert len(cached_files) == 1 and cached_files == os.listdir(cache_dir)
+        pd.testing.assert_frame_equal(act_data_frame, exp_data_frame)
+        assert act_selection["Item4"].to_list() == ["Hello", "Anyone"]
+        pd.testing.assert_frame_equal(pd.concat(act_chunks), exp_data_frame)
+
+
+    def test_reading_s02(self, setup):
+        """ Test whether a modified csv file is parsed again """
+
+        """ PREPARATION """
+        path_to_file, cache_dir = setup
+        data_loader = DataLoader(dataset = DataSet(path_to_file = path_to_file), cache_dir = cache_dir)
+        data_loader.read()
+
+        """ EXECUTION """
+        with open(path_to_file, "a") as file:
+            file.write("\n1.5,2.5,R3,Again")
+        act_data_frame = data_loader.read()
+
+        """ VERIFICATION """
+        assert len(os.listdir(cache_dir)) == 2
+        assert act_data_frame["Item4"].to_list()[-1] == "Again"
+
+
+    def test_reading_s03(self, setup):
+        """ Test whether a transformed dataframe is cached per configuration of the transformer """
+
+        """ PREPARATION """
+        path_to_file, cache_dir = setup
+        data_loader   = DataLoader(dataset = DataSet(path_to_file = path_to_file), cache_dir = cache_dir)
+        transformer_1 = Transformer(columns = ["Item1"], funcs = [impute_mean])
+        transformer_2 = Transformer(columns = ["Item1"], funcs = [lambda x: x.fillna(0.0)])
+        exp_data_frame = transformer_1.transform(DataLoader(dataset = DataSet(path_to_file = path_to_file)).read())
+
+        """ EXECUTION """
+        act_data_frame_1 = data_loader.read(transformer = transformer_1)
+        act_data_frame_2 = data_loader.read(transformer = transformer_1)
+        act_data_frame_3 = data_loader.read(transformer = transformer_2)
+
+        """ VERIFICATION """
+        # the parsed csv file and two transformed dataframes
+        assert len(os.listdir(cache_dir)) == 3
+        pd.testing.assert_frame_equal(act_data_frame_1, exp_data_frame)
+        pd.testing.assert_frame_equal(act_data_frame_2, exp_data_frame)
+        assert act_data_frame_3["Item1"].isna().sum() == 0 and not act_data_frame_3.equals(act_data_frame_1)
+
+
+    def test_reading_s04(self, setup, monkeypatch):
+        """ Test whether the cache is built chunk by chunk and the types of columns which change between chunks are widened """
+
+        """ PREPARATION """
+        path_to_file, cache_dir = setup
+        with open(path_to_file, "w") as file:
+            file.write("Item1,Item2,Item3\n1,2,3\n4,5,6\n7,,x\n8,9.5,10")
+        exp_data_frame = DataLoader(dataset = DataSet(path_to_file = path_to_file)).read_csv()
+        monkeypatch.setattr(load, "CACHE_CHUNKSIZE", 2)
+        monkeypatch.setattr(DataLoader, "read_csv", lambda *args, **kwargs: pytest.fail("The whole csv file is read"))
+
+        """ EXECUTION """
+        act_chunks     = list(DataLoader(dataset = DataSet(path_to_file = path_to_file), cache_dir = cache_dir).read_chunks(chunksize = 10))
+        act_data_frame = columnar.read_ipc(cache_dir / os.listdir(cache_dir)[0])
+        DataLoader(dataset = DataSet(path_to_file = path_to_file), cache_dir = cache_dir, engine = "pyarrow").read_chunks(chunksize = 10)
+
+        """ VERIFICATION """
+        pd.testing.assert_frame_equal(pd.concat(act_chunks), exp_data_frame)
+        pd.testing.assert_frame_equal(act_data_frame, exp_data_frame)
+        # the cache is built by the C parser for every engine
+        assert len(os.listdir(cache_dir)) == 1
+
+
+    def test_reading_s05(self, setup):
+        """ Test whether the values which a function captures are part of the key of a transformed dataframe """
+
+        """ PREPARATION """
+        path_to_file, cache_dir = setup
+        data_loader = DataLoader(dataset = DataSet(path_to_file = path_to_file), cache_dir = cache_dir)
+        def scaled(factor):
+            return Transformer(columns = ["Item2"], funcs = [lambda x: x * factor])
+        weights = pd.Series([1.0, 2.0, 3.0, 4.0])
+
+        """ EXECUTION """
+        act_data_frame_1 = data_loader.read(transformer = scaled(2))
+        act_data_frame_2 = data_loader.read(transformer = scaled(3))
+        cached_files     = len(os.listdir(cache_dir))
+        act_data_frame_3 = data_loader.read(transformer = scaled(weights))
+
+        """ VERIFICATION """
+        assert cache.transformer_key(scaled(2)) == cache.transformer_key(scaled(2)) != cache.transformer_key(scaled(3))
+        pd.testing.assert_series_equal(act_data_frame_2["Item2"], act_data_frame_1["Item2"] / 2 * 3)
+        # a captured series cannot be identified by its content, thus the result is not cached
+        assert cache.transformer_key(scaled(weights)) is None
+        assert cached_files == 3 and len(os.listdir(cache_dir)) == 3
+        assert act_data_frame_3.shape == act_data_frame_1.shape
+
+
+    def test_eviction_s01(self, setup):
+        """ Test whether the least recently used files are evicted once the cache is too large """
+
+        """ PREPARATION """
+        path_to_file, cache_dir = setup
+        data_loader = DataLoader(dataset = DataSet(path_to_file = path_to_file), cache_dir = cache_dir)
+        data_loader.read(sep = ",")
+        data_loader.read(transformer = Transformer(columns = ["Item1"], funcs = [impute_mean]))
+        sizes = {path.name: path.stat().st_size for path in cache_dir.iterdir()}
+
+        """ EXECUTION """
+        evicted = cache.evict(cache_dir, max_bytes = max(sizes.values()))
+
+        """ VERIFICATION """
+        # the parsed csv file is the least recently used file
+        assert len(evicted) == 1 and len(os.listdir(cache_dir)) == 1
+        assert DataLoader(dataset = DataSet(path_to_file = path_to_file), cache_dir = cache_dir, cache_size = 1).read().shape == (4, 4)
+        assert len(os.listdir(cache_dir)) == 1
+
+
+    def test_fingerprint_s01(self, setup):
+        """ Test whether the content key ignores the modification time of an unchanged file """
+
+        """ PREPARATION """
+        path_to_file, _ = setup
+        exp_mtime   = cache.fingerprint(path_to_file, sep = ",")
+        exp_content = cache.fingerprint(path_to_file, key = "content", sep = ",")
+
+        """ EXECUTION """
+        os.utime(path_to_file, ns = (0, 0))
+
+        """ VERIFICATION """
+        assert cache.fingerprint(path_to_file, sep = ",") != exp_mtime
+        assert cache.fingerprint(path_to_file, key = "content", sep = ",") == exp_content
+        assert cache.fingerprint(path_to_file, key = "content", sep = ";") != exp_content
+
+
+    def test_fingerprint_e01(self, setup):
+        """ Test whether an unknown cache key raises a ValueError """
+
+        """ EXECUTION & VERIFICATION """
+        path_to_file, cache_dir = setup
+        with pytest.raises(ValueError):
+            cache.fingerprint(path_to_file, key = "size")
+        with pytest.raises(ValueError):
+            DataLoader(dataset = DataSet(path_to_file = path_to_file), cache_dir = cache_dir, cache_key = "size")
+
+
+    def test_zero_copy_s01(self, tmp_path):
+        """ Test whether columns without missing values are read zero-copy from an Arrow IPC file """
+
+        """ PREPARATION """
+        pytest.importorskip("pyarrow")
+        data_frame = pd.DataFrame({'price': [1500, 1200, 700], 'm2': [120.0, None, 15.0], 'city': ["Chicago", "Queens", None]})
+        columnar.write_ipc(data_frame, tmp_path / "test.arrow")
+
+        """ EXECUTION """
+        act_data_frame = columnar.read_ipc(tmp_path / "test.arrow")
+
+        """ VERIFICATION """
+        pd.testing.assert_frame_equal(act_data_frame, data_frame)
+        assert not act_data_frame["price"].to_numpy().flags.owndata
\ No newline at end of file
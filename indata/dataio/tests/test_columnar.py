@@ -0,0 +1,75 @@
+"""
+Testing the reading of columnar files
+"""
+
+import os
+import pytest
+import numpy as np
+import pandas as pd
+
+import indata.dataio.columnar as columnar
+from indata.dataio import DataLoader, DataSet, Range, NotNull
+
+
+class TestColumnar:
+    @pytest.fixture()
+    def setup(self, tmp_path):
+        """ Yields a dataframe which is stored as Parquet file with row groups of three rows and as Feather file """
+        pytest.importorskip("pyarrow")
+        data_frame = pd.DataFrame({'m2': [120, 70, 50, 15, 35, 75, np.nan], 'price': [1500, 1500, 1200, 700, 1200, 2480, 2709],
+                                   'city': ["Springfield", "Chicago", "Chicago", "New York", "New York", "New York", None]})
+        data_frame.to_parquet(tmp_path / "test.parquet", row_group_size = 3)
+        data_frame.to_feather(tmp_path / "test.feather")
+
+        yield data_frame, tmp_path
+
+
+    def test_reading_s01(self, setup):
+        """ Test whether Parquet and Feather files are detected and read with projection and predicates """
+
+        """ PREPARATION """
+        data_frame, directory = setup
+
+        for name in ("test.parquet", "test.feather"):
+            """ EXECUTION """
+            data_loader    = DataLoader(dataset = DataSet(path_to_file = os.path.join(directory, name)), memory_map = True)
+            act_data_frame = data_loader.read()
+            act_projection = data_loader.read(columns = ["city"], predicates = [Range("price", upper = 2000), NotNull("m2")])
+            act_chunks     = list(data_loader.read_chunks(chunksize = 2, columns = ["price"]))
+
+            """ VERIFICATION """
+            pd.testing.assert_frame_equal(act_data_frame, data_frame)
+            assert act_projection["city"].to_list() == ["Springfield", "Chicago", "Chicago", "New York", "New York"]
+            assert all(len(chunk) <= 2 for chunk in act_chunks)
+            pd.testing.assert_frame_equal(pd.concat(act_chunks), data_frame[["price"]])
+
+
+    def test_statistics_s01(self, setup):
+        """ Test whether the statistics of the row groups are aggregated per column """
+
+        """ PREPARATION """
+        _, directory = setup
+        data_loader  = DataLoader(dataset = DataSet(path_to_file = os.path.join(directory, "test.parquet")))
+
+        """ EXECUTION """
+        act_statistics = data_loader.read_statistics(columns = ["m2", "price", "city"])
+
+        """ VERIFICATION """
+        assert act_statistics["Count"].to_list()   == [6, 7, 6]
+        assert act_statistics["Missing"].to_list() == [1, 0, 1]
+        assert act_statistics["Min"].to_list()     == [15.0, 700, "Chicago"]
+        assert act_statistics["Max"].to_list()     == [120.0, 2709, "Springfield"]
+
+
+    def test_statistics_e01(self):
+        """ Test whether an error is raised for unknown formats and statistics of csv files """
+
+        """ PREPARATION """
+        path_to_file = os.path.join(os.path.abspath(os.path.dirname(__file__)), "test.csv")
+
+        """ EXECUTION & VERIFICATION """
+        assert columnar.detect_format("data.PQ") == "parquet"
+        with pytest.raises(ValueError):
+            DataSet(path_to_file = path_to_file, file_format = "xlsx")
+        with pytest.raises(ValueError):
+            DataLoader(dataset = DataSet(path_to_file = path_to_file)).read_statistics()
\ No newline at end of file
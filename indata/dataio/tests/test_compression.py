@@ -0,0 +1,148 @@
+"""
+Testing the decompression of compressed csv files while they are read
+"""
+
+import os
+import bz2
+import gzip
+import zlib
+import struct
+import pytest
+import tracemalloc
+import pandas as pd
+
+import indata.dataio.compression as compression
+from indata.dataio import DataLoader, DataSet, NotNull
+
+
+def bgzf_block(data: bytes) -> bytes:
+    """ A BGZF block, i.e. a gzip member with the `BC` extra field which holds the size of the block """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+    deflated   = compressor.compress(data) + compressor.flush()
+    header     = b"\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff" + struct.pack("<H", 6) + b"BC" + struct.pack("<HH", 2, len(deflated) + 25)
+
+    return header + deflated + struct.pack("<II", zlib.crc32(data), len(data))
+
+
+class TestCompression:
+    @pytest.fixture()
+    def setup(self, tmp_path):
+        """ Yields the bytes of the test data and the directory of the compressed files """
+        with open(os.path.join(os.path.abspath(os.path.dirname(__file__)), "test2.csv"), "rb") as file:
+            data = file.read()
+
+        yield data, tmp_path
+
+
+    def test_reading_s01(self, setup):
+        """ Test whether gzip and bz2 files are read like the uncompressed file """
+
+        """ PREPARATION """
+        data, tmp_path = setup
+        with open(tmp_path / "test2.csv", "wb") as file:
+            file.write(data)
+        with gzip.open(tmp_path / "test2.csv.gz", "wb") as file:
+            file.write(data)
+        with bz2.open(tmp_path / "test2.csv.bz2", "wb") as file:
+            file.write(data)
+        exp_data_frame = DataLoader(dataset = DataSet(path_to_file = tmp_path / "test2.csv")).read_csv()
+
+        for suffix in (".gz", ".bz2"):
+            """ EXECUTION """
+            data_loader    = DataLoader(dataset = DataSet(path_to_file = tmp_path / f"test2.csv{suffix}"))
+            act_data_frame = data_loader.read_csv()
+            act_chunks     = list(data_loader.read_csv_chunks(chunk_bytes = 34))
+            act_selection  = data_loader.read(columns = ["Item4"], predicates = [NotNull("Item1")])
+
+            """ VERIFICATION """
+            assert data_loader.dataset.file_format == "csv"
+            pd.testing.assert_frame_equal(act_data_frame, exp_data_frame)
+            assert len(act_chunks) == 2
+            pd.testing.assert_frame_equal(pd.concat(act_chunks), exp_data_frame)
+            assert act_selection["Item4"].to_list() == ["Hello", "Anyone"]
+
+
+    def test_reading_s02(self, setup):
+        """ Test whether the blocks of BGZF files and the frames of zstd files are decompressed in parallel """
+
+        """ PREPARATION """
+        pa   = pytest.importorskip("pyarrow")
+        data, tmp_path = setup
+        rows = (data.split(b"\n", 1)[1].rstrip(b"\n") + b"\n") * 5000
+        data = data.split(b"\n", 1)[0] + b"\n" + rows
+        with open(tmp_path / "test.csv.gz", "wb") as file:
+            file.write(b"".join(bgzf_block(data[start:start + 50_000]) for start in range(0, len(data), 50_000)) + bgzf_block(b""))
+        with open(tmp_path / "test.csv.zst", "wb") as file:
+            file.write(b"".join(pa.Codec("zstd").compress(data[start:start + 100_000], asbytes = True) for start in range(0, len(data), 100_000)))
+
+        for suffix in (".gz", ".zst"):
+            """ EXECUTION """
+            with compression.open_stream(tmp_path / f"test.csv{suffix}", compression.detect_compression(f"test.csv{suffix}"), threads = 4) as stream:
+                act_data = stream.read()
+            act_data_frame = DataLoader(dataset = DataSet(path_to_file = tmp_path / f"test.csv{suffix}"), engine = "pyarrow", workers = 4).read_csv(columns = ["Item4", "Item1"])
+
+            """ VERIFICATION """
+            assert act_data == data
+            assert list(act_data_frame.columns) == ["Item4", "Item1"] and len(act_data_frame) == 20_000
+
+
+    def test_reading_s03(self, setup):
+        """ Test whether a zstd file of a single large frame is streamed with bounded memory """
+
+        """ PREPARATION """
+        pa          = pytest.importorskip("pyarrow")
+        _, tmp_path = setup
+        data        = b"1.5,2.5,R1,Some\n" * (4 << 20)
+        with open(tmp_path / "test.csv.zst", "wb") as file:
+            file.write(pa.Codec("zstd").compress(data, asbytes = True))
+        exp_size, exp_checksum = len(data), zlib.crc32(data)
+        del data
+
+        """ EXECUTION """
+        act_size, act_checksum = 0, 0
+        tracemalloc.start()
+        with compression.open_stream(tmp_path / "test.csv.zst", "zstd", threads = 4) as stream:
+            for piece in iter(lambda: stream.read(1 << 20), b""):
+                act_size    += len(piece)
+                act_checksum = zlib.crc32(piece, act_checksum)
+        _, act_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        """ VERIFICATION """
+        assert (act_size, act_checksum) == (exp_size, exp_checksum)
+        assert act_peak < exp_size // 3
+
+
+    def test_reading_e01(self, setup):
+        """ Test whether compressed columnar files and unknown compressions are rejected """
+
+        """ PREPARATION """
+        _, tmp_path = setup
+        (tmp_path / "test.parquet.gz").touch()
+        (tmp_path / "test.csv").touch()
+
+        """ EXECUTION & VERIFICATION """
+        with pytest.raises(ValueError):
+            DataSet(path_to_file = tmp_path / "test.parquet.gz")
+        with pytest.raises(ValueError):
+            DataSet(path_to_file = tmp_path / "test.csv", compression = "rar")
+
+
+    def test_reading_e02(self, setup):
+        """ Test whether truncated zstd and BGZF files raise an error instead of blocking the reader """
+
+        """ PREPARATION """
+        pa             = pytest.importorskip("pyarrow")
+        data, tmp_path = setup
+        zstd_frames    = b"".join(pa.Codec("zstd").compress(data, asbytes = True) for _ in range(3))
+        bgzf_blocks    = bgzf_block(data) * 3 + bgzf_block(b"")
+        with open(tmp_path / "test.csv.zst", "wb") as file:
+            file.write(zstd_frames[:-5])
+        with open(tmp_path / "test.csv.gz", "wb") as file:
+            file.write(bgzf_blocks[:len(bgzf_block(data)) + 30])
+
+        for suffix in (".zst", ".gz"):
+            """ EXECUTION & VERIFICATION """
+            with pytest.raises(ValueError):
+                with compression.open_stream(tmp_path / f"test.csv{suffix}", compression.detect_compression(f"test.csv{suffix}"), threads = 4) as stream:
+                    stream.read()
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""
+Testing the parse engines of the DataLoader
+"""
+
+import os
+import pytest
+import pandas as pd
+
+import indata.dataio.engine as engines
+from indata.dataio import DataLoader, DataSet, Range
+
+
+class TestEngine:
+    @pytest.fixture()
+    def setup(self):
+        """ Yields a DataSet of the test data of this testing module """
+
+        yield DataSet(path_to_file = os.path.join(os.path.abspath(os.path.dirname(__file__)), "test2.csv"))
+
+
+    def test_reading_s01(self, setup):
+        """ Test whether pyarrow parses the same dataframe as the C parser of pandas """
+
+        """ PREPARATION """
+        pytest.importorskip("pyarrow")
+        data_loader = DataLoader(dataset = setup, engine = "pyarrow")
+
+        """ EXECUTION """
+        act_data_frame      = data_loader.read_csv()
+        act_projected_frame = data_loader.read_csv(columns = ["Item4", "Item1"], predicates = [Range("Item2", lower = 0.3)])
+
+        """ VERIFICATION """
+        pd.testing.assert_frame_equal(act_data_frame, data_loader.read_csv(engine = "c"))
+        pd.testing.assert_frame_equal(act_projected_frame, data_loader.read_csv(columns = ["Item4", "Item1"], predicates = [Range("Item2", lower = 0.3)],
+                                                                                engine = "c"))
+
+
+    def test_reading_s03(self, tmp_path):
+        """ Test whether pyarrow keeps the text of dates, times and timestamps like the C parser of pandas """
+
+        """ PREPARATION """
+        pytest.importorskip("pyarrow")
+        path_to_file = tmp_path / "timestamps.csv"
+        path_to_file.write_text("Timestamp,Date,Time,Item\n2020-01-01T10:00:00,2020-01-01,10:00:00,1\n"
+                                "2020-01-02T11:30:00,2020-01-02,11:30:00,2\n,,,3\n")
+        data_loader  = DataLoader(dataset = DataSet(path_to_file = path_to_file), engine = "pyarrow")
+
+        """ EXECUTION """
+        act_data_frame = data_loader.read_csv()
+
+        """ VERIFICATION """
+        pd.testing.assert_frame_equal(act_data_frame, data_loader.read_csv(engine = "c"))
+        assert act_data_frame["Timestamp"].tolist()[:2] == ["2020-01-01T10:00:00", "2020-01-02T11:30:00"]
+
+
+    def test_reading_s02(self, setup):
+        """ Test whether polars parses the same dataframe as the C parser of pandas """
+
+        """ PREPARATION """
+        pytest.importorskip("polars")
+        data_loader = DataLoader(dataset = setup, engine = "polars")
+
+        """ EXECUTION """
+        act_data_frame      = data_loader.read_csv()
+        act_projected_frame = data_loader.read_csv(columns = ["Item4", "Item1"], predicates = [Range("Item2", lower = 0.3)])
+
+        """ VERIFICATION """
+        pd.testing.assert_frame_equal(act_data_frame, data_loader.read_csv(engine = "c"))
+        pd.testing.assert_frame_equal(act_projected_frame, data_loader.read_csv(columns = ["Item4", "Item1"], predicates = [Range("Item2", lower = 0.3)],
+                                                                                engine = "c"))
+        with pytest.raises(ValueError):
+            data_loader.read_csv(lineterminator = ";")
+
+
+    def test_create_engine_s01(self, setup, monkeypatch):
+        """ Test whether the engine is chosen automatically based on the size of the file """
+
+        """ EXECUTION & VERIFICATION """
+        assert isinstance(engines.create_engine("auto", path_to_file = setup.path_to_file), engines.CEngine)
+
+        pytest.importorskip("pyarrow")
+        monkeypatch.setattr(engines, "AUTO_ENGINE_BYTES", 1)
+        assert isinstance(engines.create_engine("auto", path_to_file = setup.path_to_file), engines.ArrowEngine)
+        assert isinstance(engines.create_engine("auto", path_to_file = setup.path_to_file, lineterminator = ";"), engines.CEngine)
+
+
+    def test_create_engine_e01(self, setup):
+        """ Test whether an error is raised for unknown engines and unsupported line terminators """
+
+        """ EXECUTION & VERIFICATION """
+        with pytest.raises(ValueError):
+            engines.create_engine("spark", path_to_file = setup.path_to_file)
+
+        pytest.importorskip("pyarrow")
+        with pytest.raises(ValueError):
+            DataLoader(dataset = setup, engine = "pyarrow").read_csv(lineterminator = ";")
\ No newline at end of file
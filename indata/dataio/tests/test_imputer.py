@@ -0,0 +1,85 @@
+"""
+Testing the Imputer which fits its fill values on a stream of dataframes
+"""
+
+import os
+import pytest
+import numpy as np
+import pandas as pd
+
+from indata.dataio import DataLoader, DataSet, Imputer
+
+
+class TestImputer:
+    def setup_class(self):
+        path_to_file     = os.path.join(os.path.abspath(os.path.dirname(__file__)), "test2.csv")
+        self.data_loader = DataLoader(dataset = DataSet(path_to_file = path_to_file))
+        self.strategies  = {"Item1": "mean", "Item2": "median", "Item3": "mode"}
+
+
+    def test_fit_s01(self):
+        """ Test whether the fill values which are fitted on chunks are the ones of the whole dataframe """
+
+        """ PREPARATION """
+        imputer = Imputer(self.strategies)
+
+        """ EXECUTION """
+        imputer.fit(self.data_loader.read_csv_chunks(chunksize = 1))
+        act_chunks = list(self.data_loader.read_csv_chunks(chunksize = 2, transformer = imputer))
+
+        """ VERIFICATION """
+        exp_data_frame = pd.DataFrame({'Item1': [np.mean([2.2, -0.57]), 2.2, np.mean([2.2, -0.57]), -0.57],
+                                       'Item2': [0.25, 0.5, np.median([0.25, 0.5, 1.24]), 1.24],
+                                       'Item3': ["R1", "R2", "R1", "R1"],
+                                       'Item4': ["Some", "Hello", "Python", "Anyone"]})
+
+        assert imputer.values == {"Item1": pytest.approx(np.mean([2.2, -0.57])), "Item2": 0.5, "Item3": "R1"}
+        pd.testing.assert_frame_equal(pd.concat(act_chunks), exp_data_frame)
+
+
+    def test_fit_s02(self):
+        """ Test whether imputers fitted on parts of the data are merged into the imputer of the whole data """
+
+        """ PREPARATION """
+        data_frame = pd.DataFrame({'Item1': [1.0, np.nan, 3.0, 7.0, 7.0], 'Item2': [4.0, 1.0, np.nan, 2.0, 9.0],
+                                   'Item3': ["a", "b", None, "b", "a"]})
+        exp_values = Imputer(self.strategies).fit(data_frame).values
+
+        """ EXECUTION """
+        act_exact       = Imputer(self.strategies).fit(data_frame.iloc[:2]).merge(Imputer(self.strategies).fit(data_frame.iloc[2:]))
+        act_approximate = Imputer(self.strategies, approximate = True).fit(data_frame.iloc[:2])
+        act_approximate.merge(Imputer(self.strategies, approximate = True).fit(data_frame.iloc[2:]))
+
+        """ VERIFICATION """
+        assert exp_values == {"Item1": 4.5, "Item2": 3.0, "Item3": "a"}
+        assert act_exact.values == exp_values
+        assert act_approximate.values == exp_values
+
+
+    def test_persistence_s01(self, tmp_path):
+        """ Test whether a stored imputer fills the same values after it was loaded """
+
+        """ PREPARATION """
+        imputer = Imputer(self.strategies).fit(self.data_loader.read_csv())
+
+        """ EXECUTION """
+        imputer.save(tmp_path / "imputer.json")
+        act_imputer = Imputer.load(tmp_path / "imputer.json")
+
+        """ VERIFICATION """
+        assert act_imputer.values == imputer.values
+        pd.testing.assert_frame_equal(act_imputer.transform(self.data_loader.read_csv()), imputer.transform(self.data_loader.read_csv()))
+
+
+    def test_fit_e01(self):
+        """ Test whether errors are raised for unknown strategies, non-numeric columns and an unfitted imputer """
+
+        """ EXECUTION & VERIFICATION """
+        with pytest.raises(ValueError):
+            Imputer({"Item1": "max"})
+        with pytest.raises(ValueError):
+            Imputer({"Item3": "mean"}).fit(self.data_loader.read_csv())
+        with pytest.raises(KeyError):
+            Imputer({"Item5": "mode"}).fit(self.data_loader.read_csv())
+        with pytest.raises(ValueError):
+            Imputer(self.strategies).transform(self.data_loader.read_csv())
\ No newline at end of file
@@ -11,6 +11,10 @@ import indata.exception.base as exception
 from indata.dataio import (
     DataLoader, 
     DataSet, 
+    Schema,
+    Column,
+    Range,
+    NotNull,
     Transformer, 
     impute_median, 
     impute_mean, 
@@ -131,4 +135,164 @@ class TestDataLoader:
                                        'Item3': ["R1", "R2", "R1", "R1"],
                                        'Item4': ["Some", "Hello", "Cpp", "Anyone"]})
 
-        pd.testing.assert_frame_equal(act_data_frame, exp_data_frame)
\ No newline at end of file
+        pd.testing.assert_frame_equal(act_data_frame, exp_data_frame)
+
+
+    def test_transformer_s03(self):
+        """ Test if the functions on the same column are compiled into one step list and applied in order """
+
+        """ PREPARATION """
+        def add(x: pd.Series, value: int):
+            return x + value
+
+        def double(x: pd.Series):
+            return x * 2
+
+        transformer = Transformer(columns = ["Item1", "Item3", "Item1"], funcs = [add, double, add],
+                                  args    = [(1,), (10,)])
+
+        """ EXECUTION """
+        act_data_frame = transformer.transform(pd.DataFrame({'Item1': [1, 3], 'Item2': [2, 5], 'Item3': [4, 6]}))
+
+        """ VERIFICATION """
+        exp_data_frame = pd.DataFrame({'Item1': [12, 14], 'Item2': [2, 5], 'Item3': [8, 12]})
+
+        assert list(transformer.plan) == ["Item1", "Item3"]
+        assert [arguments for _, arguments in transformer.plan["Item1"]] == [(1,), (10,)]
+        pd.testing.assert_frame_equal(act_data_frame, exp_data_frame)
+
+
+    def test_transformer_e01(self):
+        """ Test if an error is raised when there are less arguments than functions which need them """
+
+        """ EXECUTION & VERIFICATION """
+        with pytest.raises(exception.DimError):
+            Transformer(columns = ["Item1", "Item2"], funcs = [replace_entries, replace_entries], args = [("Python", "Cpp")])
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_transformer_s04(self, executor):
+        """ Test if the columns transformed in a pool are the same as the serially transformed columns """
+
+        """ PREPARATION """
+        columns = ["Item1", "Item2", "Item3", "Item4"]
+        funcs   = [impute_mean, impute_median, impute_mode, replace_entries]
+        args    = [("Python", "Cpp")]
+        exp_data_frame = DataLoader(dataset = self.dataset_two).read_csv(transformer = Transformer(columns = columns, funcs = funcs, args = args))
+
+        """ EXECUTION """
+        transformer = Transformer(columns = columns, funcs = funcs, args = args, executor = executor, workers = 2)
+        with transformer:
+            act_chunks = list(DataLoader(dataset = self.dataset_two).read_csv_chunks(chunksize = 4, transformer = transformer))
+        act_data_frame = DataLoader(dataset = self.dataset_two).read_csv(transformer = transformer)
+
+        """ VERIFICATION """
+        pd.testing.assert_frame_equal(pd.concat(act_chunks), exp_data_frame)
+        pd.testing.assert_frame_equal(act_data_frame, exp_data_frame)
+
+
+    def test_transformer_e02(self):
+        """ Test if a pool reports the errors of all failing columns, a serial transformer raises the first one, and the dataframe is left unmodified """
+
+        """ PREPARATION """
+        def fail(x: pd.Series):
+            raise RuntimeError(x.name)
+
+        transformer = Transformer(columns = ["Item1", "Item2", "Item3"], funcs = [fail, impute_mean, fail], executor = "thread")
+        data_frame  = pd.DataFrame({'Item1': [1.0], 'Item2': [np.nan], 'Item3': [2.0]})
+
+        serial      = Transformer(columns = ["Item2", "Item3", "Item1"], funcs = [impute_mean, fail, fail])
+
+        """ EXECUTION """
+        with pytest.raises(exception.TransformError) as error:
+            transformer.transform(data_frame)
+        # in serial mode, the error of the first failing column is raised as it is
+        with pytest.raises(RuntimeError, match = "Item3"):
+            serial.transform(data_frame)
+
+        """ VERIFICATION """
+        assert list(error.value.errors) == ["Item1", "Item3"]
+        assert str(error.value.errors["Item3"]) == "Item3"
+        assert np.isnan(data_frame.loc[0, "Item2"])
+        with pytest.raises(ValueError):
+            Transformer(columns = ["Item1"], funcs = [impute_mean], executor = "gpu")
+
+    def test_reading_chunks_s01(self):
+        """ Test if the csv file is streamed in chunks of the requested number of rows """
+
+        """ PREPARATION """
+        data_loader = DataLoader(dataset = self.dataset)
+
+        """ EXECUTION """
+        act_chunks = list(data_loader.read_csv_chunks(chunksize = 1))
+
+        """ VERIFICATION """
+        exp_data_frame = data_loader.read_csv()
+
+        assert len(act_chunks) == 2
+        assert all(len(chunk) == 1 for chunk in act_chunks)
+        pd.testing.assert_frame_equal(pd.concat(act_chunks), exp_data_frame)
+
+
+    def test_reading_chunks_s02(self):
+        """ Test if a byte budget is translated into chunks and the transformer is applied on every chunk """
+
+        """ PREPARATION """
+        data_loader = DataLoader(dataset = self.dataset_two)
+        transformer = Transformer(columns = ["Item4"], funcs = [replace_entries], args = [("Python", "Cpp")])
+
+        """ EXECUTION """
+        act_chunks = list(data_loader.read_csv_chunks(chunk_bytes = 34, transformer = transformer))
+
+        """ VERIFICATION """
+        assert len(act_chunks) == 2
+        assert pd.concat(act_chunks)["Item4"].to_list() == ["Some", "Hello", "Cpp", "Anyone"]
+
+
+    def test_reading_chunks_e01(self):
+        """ Test if an error is raised when no chunk size is given """
+
+        """ PREPARATION """
+        data_loader = DataLoader(dataset = self.dataset)
+
+        """ EXECUTION & VERIFICATION """
+        with pytest.raises(ValueError):
+            data_loader.read_csv_chunks()
+        with pytest.raises(ValueError):
+            data_loader.read_csv_chunks(chunksize = 0)
+
+
+    def test_reading_schema_s01(self):
+        """ Test if only the columns of the schema are read with their declared types, in-memory and chunk by chunk """
+
+        """ PREPARATION """
+        schema      = Schema(columns = [Column("Item1", "float"), Column("Item3", "string")])
+        data_loader = DataLoader(dataset = DataSet(path_to_file = self.dataset_two.path_to_file, schema = schema))
+
+        """ EXECUTION """
+        act_data_frame = data_loader.read_csv()
+        act_chunks     = list(data_loader.read_csv_chunks(chunksize = 2))
+
+        """ VERIFICATION """
+        assert act_data_frame.columns.to_list() == ["Item1", "Item3"]
+        assert act_data_frame["Item1"].dtype == "float64"
+        assert act_data_frame["Item3"].dtype == "category"
+        assert act_data_frame["Item3"].to_list()[:3] == ["R1", "R2", "R1"]
+        assert all(chunk["Item3"].dtype == "category" for chunk in act_chunks)
+
+
+    def test_reading_projection_s01(self):
+        """ Test if only the projected columns of the rows which satisfy the predicates are read """
+
+        """ PREPARATION """
+        data_loader = DataLoader(dataset = self.dataset_two)
+        predicates  = [Range("Item2", lower = 0.3), NotNull("Item4")]
+
+        """ EXECUTION """
+        act_data_frame = data_loader.read_csv(columns = ["Item4"], predicates = predicates)
+        act_chunks     = list(data_loader.read_csv_chunks(chunksize = 2, columns = ["Item4", "Item1"], predicates = predicates))
+
+        """ VERIFICATION """
+        assert act_data_frame.columns.to_list() == ["Item4"]
+        assert act_data_frame["Item4"].to_list() == ["Hello", "Anyone"]
+        assert [chunk.index.to_list() for chunk in act_chunks] == [[1], [3]]
+        assert act_chunks[1].columns.to_list() == ["Item4", "Item1"]
\ No newline at end of file
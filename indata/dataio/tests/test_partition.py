@@ -0,0 +1,134 @@
+"""
+Testing datasets which are split up into many files
+"""
+
+import os
+import pytest
+import pandas as pd
+
+import indata.dataio.partition as partition
+import indata.exception.base   as exception
+from indata.dataio import DataLoader, DataSet, Equals, NotNull, Range, Transformer, impute_mean
+
+
+class TestPartition:
+    @pytest.fixture()
+    def setup(self, tmp_path):
+        """ Splits the test data into two csv files and a Hive-style layout of Parquet files """
+        data_frame = pd.read_csv(os.path.join(os.path.abspath(os.path.dirname(__file__)), "test2.csv"))
+        data_frame.iloc[:2].to_csv(tmp_path / "part-0.csv", index = False)
+        data_frame.iloc[2:].to_csv(tmp_path / "part-1.csv", index = False)
+        (tmp_path / "_SUCCESS").touch()
+
+        pytest.importorskip("pyarrow")
+        for day, rows in ((1, slice(0, 1)), (2, slice(1, 3)), (10, slice(3, 4))):
+            os.makedirs(tmp_path / "hive" / "region=eu" / f"day={day}")
+            data_frame.iloc[rows].to_parquet(tmp_path / "hive" / "region=eu" / f"day={day}" / "part-0.parquet", index = False)
+
+        yield tmp_path, data_frame
+
+
+    def test_initialisation_s01(self, setup):
+        """ Test whether the files of a glob pattern and of a Hive-style directory are found with their partition values """
+
+        """ PREPARATION """
+        tmp_path, _ = setup
+
+        """ EXECUTION """
+        act_glob = DataSet(path_to_file = tmp_path / "part-*.csv")
+        act_hive = DataSet(path_to_file = tmp_path / "hive")
+
+        """ VERIFICATION """
+        assert act_glob.partitioned and act_glob.file_format == "csv"
+        assert act_glob.partitions == [tmp_path / "part-0.csv", tmp_path / "part-1.csv"]
+        assert act_glob.partition_columns == []
+        assert act_hive.file_format == "parquet"
+        assert act_hive.partition_values == [{'region': "eu", 'day': 1}, {'region': "eu", 'day': 10}, {'region': "eu", 'day': 2}]
+        assert not DataSet(path_to_file = tmp_path / "part-0.csv").partitioned
+
+
+    def test_initialisation_e01(self, setup):
+        """ Test whether an error is raised when no file matches the pattern """
+
+        """ PREPARATION """
+        tmp_path, _ = setup
+
+        """ EXECUTION & VERIFICATION """
+        with pytest.raises(exception.PathNotFoundError):
+            DataSet(path_to_file = tmp_path / "*.json")
+
+
+    def test_reading_s01(self, setup):
+        """ Test whether the partitions are read concurrently into one dataframe, a stream of chunks and a stream of partitions """
+
+        """ PREPARATION """
+        tmp_path, exp_data_frame = setup
+        data_loader = DataLoader(dataset = DataSet(path_to_file = tmp_path / "part-*.csv"), workers = 2)
+
+        """ EXECUTION """
+        act_data_frame = data_loader.read()
+        act_chunks     = list(data_loader.read_chunks(chunksize = 1, columns = ["Item1", "Item4"], predicates = [NotNull("Item1")]))
+        act_partitions = list(data_loader.read_partitions())
+        act_imputed    = data_loader.read_csv(transformer = Transformer(columns = ["Item1"], funcs = [impute_mean]))
+
+        """ VERIFICATION """
+        pd.testing.assert_frame_equal(act_data_frame, exp_data_frame)
+        assert pd.concat(act_chunks).index.is_unique
+        assert pd.concat(act_chunks)["Item4"].to_list() == ["Hello", "Anyone"]
+        assert [len(dataframe) for dataframe in act_partitions] == [2, 2]
+        # the transformer sees all partitions at once
+        assert act_imputed["Item1"].isna().sum() == 0 and act_imputed.loc[0, "Item1"] == pytest.approx((2.2 - 0.57) / 2)
+
+
+    def test_reading_s02(self, setup):
+        """ Test whether the partition columns are added and partitions are pruned by predicates on them """
+
+        """ PREPARATION """
+        tmp_path, data_frame = setup
+        data_loader = DataLoader(dataset = DataSet(path_to_file = tmp_path / "hive"))
+
+        """ EXECUTION """
+        act_data_frame = data_loader.read(columns = ["day", "Item3"], predicates = [Range("day", lower = 2), Equals("region", "eu")])
+        act_chunks     = list(data_loader.read_chunks(chunksize = 10, columns = ["Item2", "day"], predicates = [Range("day", upper = 1)]))
+        act_statistics = data_loader.read_statistics(columns = ["Item1", "Item2"])
+
+        """ VERIFICATION """
+        assert act_data_frame.to_dict(orient = "list") == {'day': [10, 2, 2], 'Item3': [None, "R2", "R1"]}
+        assert len(act_chunks) == 1 and act_chunks[0].to_dict(orient = "list") == {'Item2': [0.25], 'day': [1]}
+        assert act_statistics.loc["Item1"].to_dict() == {'Count': 2, 'Missing': 2, 'Min': -0.57, 'Max': 2.2}
+        assert act_statistics.loc["Item2", "Count"] == 3
+
+
+    def test_reading_s03(self, setup):
+        """ Test whether an integer partition column stays integer if its key is missing for some files """
+
+        """ PREPARATION """
+        tmp_path, data_frame = setup
+        for year, rows in ((2020, slice(0, 2)), (partition.HIVE_NULL, slice(2, 3)), (2021, slice(3, 4))):
+            os.makedirs(tmp_path / "years" / f"year={year}")
+            data_frame.iloc[rows].to_parquet(tmp_path / "years" / f"year={year}" / "part-0.parquet", index = False)
+        dataset = DataSet(path_to_file = tmp_path / "years")
+
+        """ EXECUTION """
+        act_data_frame = DataLoader(dataset = dataset).read(columns = ["Item3", "year"])
+
+        """ VERIFICATION """
+        assert dataset.partition_values == [{'year': 2020}, {'year': 2021}, {'year': None}]
+        assert act_data_frame["year"].dtype == "Int64"
+        assert act_data_frame["year"].to_list() == [2020, 2020, 2021, pd.NA]
+
+
+    def test_merge_statistics_s01(self):
+        """ Test whether the bounds are unknown if they are unknown for a file which contains values """
+
+        """ PREPARATION """
+        first  = pd.DataFrame({'Count': [2, 0], 'Missing': [0, 1], 'Min': [1, None], 'Max': [3, None]}, index = ["a", "b"])
+        second = pd.DataFrame({'Count': [1, 1], 'Missing': [0, 0], 'Min': [None, 5], 'Max': [None, 5]}, index = ["a", "b"])
+
+        """ EXECUTION """
+        act_statistics = partition.merge_statistics([first, second])
+
+        """ VERIFICATION """
+        assert act_statistics.loc["a", ["Count", "Missing"]].to_list() == [3, 0]
+        assert act_statistics.loc["a", ["Min", "Max"]].isna().all()
+        assert act_statistics.loc["b"].to_dict() == {'Count': 1, 'Missing': 1, 'Min': 5, 'Max': 5}
\ No newline at end of file
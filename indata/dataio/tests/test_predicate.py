@@ -0,0 +1,46 @@
+"""
+Testing the functionality of the predicates
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from indata.dataio import Range, Equals, NotNull
+from indata.dataio.predicate import select
+
+
+class TestPredicate:
+    @classmethod
+    def setup_class(cls):
+        """ Setup of test data """
+        cls.data_frame = pd.DataFrame({'price': [1500, np.nan, 1200, 700, 2709], 'city': ["Chicago", "Queens", None, "Chicago", "Manhatten"]})
+
+
+    def test_mask_s01(self):
+        """ Test whether every predicate selects the expected rows, missing values are never selected """
+
+        """ EXECUTION & VERIFICATION """
+        assert Range("price", lower = 1000).mask(self.data_frame).to_list()              == [True, False, True, False, True]
+        assert Range("price", lower = 1000, upper = 2000).mask(self.data_frame).to_list() == [True, False, True, False, False]
+        assert Equals("city", "Chicago").mask(self.data_frame).to_list()                  == [True, False, False, True, False]
+        assert Equals("city", ["Queens", "Manhatten"]).mask(self.data_frame).to_list()    == [False, True, False, False, True]
+        assert NotNull("city").mask(self.data_frame).to_list()                            == [True, True, False, True, True]
+
+
+    def test_select_s01(self):
+        """ Test whether only the rows which satisfy all predicates are selected with their index """
+
+        """ EXECUTION """
+        act_data_frame = select(self.data_frame, [Range("price", upper = 2000), NotNull("city")])
+
+        """ VERIFICATION """
+        assert act_data_frame.index.to_list() == [0, 3]
+
+
+    def test_initialisation_e01(self):
+        """ Test whether an error is raised for a range without bounds """
+
+        """ EXECUTION & VERIFICATION """
+        with pytest.raises(ValueError):
+            Range("price")
\ No newline at end of file
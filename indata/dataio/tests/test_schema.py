@@ -0,0 +1,64 @@
+"""
+Testing the functionality of Schema and Column
+"""
+
+import pytest
+import pandas as pd
+
+from indata.dataio import Schema, Column
+
+
+class TestSchema:
+    @classmethod
+    def setup_class(cls):
+        """ Setup of test data """
+        cls.schema = Schema(columns = [Column("m2", "float"), Column("rooms", "int"), Column("city", "string"),
+                                       Column("zip", "int", categorical = True, nullable = False),
+                                       Column("sold", "datetime", date_format = "%d.%m.%Y")])
+
+
+    def test_features_s01(self):
+        """ Test whether the columns are split into continuous and categorical features """
+
+        """ EXECUTION & VERIFICATION """
+        assert self.schema.names                == ["m2", "rooms", "city", "zip", "sold"]
+        assert self.schema.continuous_features  == ["m2", "rooms"]
+        assert self.schema.categorical_features == ["city", "zip"]
+
+
+    def test_read_options_s01(self):
+        """ Test whether the schema is translated into arguments of the parser """
+
+        """ EXECUTION """
+        act_options = self.schema.read_options()
+
+        """ VERIFICATION """
+        assert act_options == {'usecols': ["m2", "rooms", "city", "zip", "sold"],
+                               'dtype': {'m2': "float64", 'rooms': "Int64", 'city': "category", 'zip': "int64"},
+                               'parse_dates': []}
+
+
+    def test_conform_s01(self):
+        """ Test whether dates with a format and unified categories are converted into their declared types """
+
+        """ PREPARATION """
+        data_frame = pd.DataFrame({'city': ["Chicago", "Queens"], 'sold': ["24.12.2022", "01.02.2023"]})
+
+        """ EXECUTION """
+        act_data_frame = self.schema.conform(data_frame)
+
+        """ VERIFICATION """
+        assert act_data_frame["city"].dtype == "category"
+        assert act_data_frame["sold"].to_list() == [pd.Timestamp(2022, 12, 24), pd.Timestamp(2023, 2, 1)]
+
+
+    def test_initialisation_e01(self):
+        """ Test whether an error is raised for unknown dtypes, misplaced date formats and duplicated columns """
+
+        """ EXECUTION & VERIFICATION """
+        with pytest.raises(ValueError):
+            Column("m2", "decimal")
+        with pytest.raises(ValueError):
+            Column("m2", "float", date_format = "%Y")
+        with pytest.raises(ValueError):
+            Schema(columns = [Column("m2", "float"), Column("m2", "int")])
\ No newline at end of file
@@ -3,13 +3,14 @@ Transform columns of a dataframe with user written callables, such that the user
 manipulate the dataframe straight away
 """
 
+import os
 import attrs
-import copy
 import pandas as pd
 
-from abc     import abstractmethod
-from typing  import Any, Callable
-from inspect import signature
+from abc                import abstractmethod
+from typing             import Any, Callable
+from inspect            import signature
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 
 import indata.exception.base as exception
 
@@ -45,6 +46,16 @@ class Transformer(IFTransformer):
     Transformer which does in-place modification of dataframes according
     to specified transformer properties
 
+    The columns, functions and arguments are compiled into a plan once, the signatures are
+    resolved and the arguments are assigned ahead of time and all functions on the same column
+    are applied one after another before the column is written back once, thus a transformer
+    can be applied on many chunks without overhead
+
+    The columns are independent of each other, thus they can be transformed concurrently in a thread pool,
+    which pays off for NumPy and pandas kernels that release the GIL, or in a process pool for pure Python
+    callables. When the transformer is entered as a context manager, the pool is created once and reused
+    for every dataframe, otherwise a pool is created per call of `transform`
+
     Methods
     -------
     transform()
@@ -53,8 +64,13 @@ class Transformer(IFTransformer):
     columns: list[str]    = attrs.field(factory = list[str])
     funcs: list[Callable] = attrs.field(factory = list[Callable])
     args: list[tuple]     = attrs.field(factory = list[tuple])
+    plan: dict[str, list] = attrs.field(factory = dict)
+    executor: str         = attrs.field(factory = str)
+    workers: int          = attrs.field(default = None)
+    _pool: Executor       = attrs.field(default = None)
 
-    def __init__(self, columns: list[str], funcs: list[Callable], args: list[tuple] = None):
+    def __init__(self, columns: list[str], funcs: list[Callable], args: list[tuple] = None, executor: str = "serial",
+                 workers: int = None):
         """
         Parameters
         ----------
@@ -64,48 +80,128 @@ class Transformer(IFTransformer):
             Functions which are applied on individual columns
         args : list[tuple], optional
             Arguments which will be given to the functions if they need additional arguments, by default None
+        executor : str, optional
+            Either "serial", "thread" or "process", with a process pool the functions and their arguments
+            have to be picklable, e.g. defined on module level, by default "serial"
+        workers : int, optional
+            Number of workers of the pool, by default None which uses the number of CPUs
 
         Raises
         ------
         exception.DimError
             Raised when the length of `columns` is not equal to the length of `funcs` since
-            i-th func will be applied on the i-th column
+            i-th func will be applied on the i-th column, or when there are less arguments
+            than functions which need additional arguments
+        ValueError
+            Raised when the kind of executor is unknown or the number of workers is not positive
         """
         if len(columns) != len(funcs):
             raise exception.DimError(f"The length of column and funcs has to match!")
-        self.columns = columns
-        self.funcs   = funcs
-        self.args    = args
+        if executor not in ("serial", "thread", "process"):
+            raise ValueError(f"Unknown executor {executor}, choose either 'serial', 'thread' or 'process'!")
+        if workers is not None and workers < 1:
+            raise ValueError("The number of workers has to be positive!")
+        self.columns  = columns
+        self.funcs    = funcs
+        self.args     = args
+        self.plan     = self.__compile()
+        self.executor = executor
+        self.workers  = workers or os.cpu_count()
+        self._pool    = None
+
+
+    def __enter__(self) -> "Transformer":
+        if self.executor == "thread":
+            self._pool = ThreadPoolExecutor(max_workers = self.workers)
+        elif self.executor == "process":
+            self._pool = ProcessPoolExecutor(max_workers = self.workers)
+
+        return self
+
+
+    def __exit__(self, *exc_info) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
         
 
     def transform(self, dataframe: pd.DataFrame) -> pd.DataFrame:
         """
-        Transforms columns in a dataframe according to user specified callables
+        Transforms columns in a dataframe according to user specified callables, the columns are written
+        back in the order of the plan once all of them are transformed, thus the result does not depend on the executor
 
         Returns
         -------
         pd.DataFrame
             The in-place modified dataframe
+
+        Raises
+        ------
+        Exception
+            In serial mode, the error of the first column whose transformation fails is raised as it is
+        exception.TransformError
+            Raised by a pool when the transformation of a column fails, it holds the error of every failed column
+
+        In both cases the dataframe is left unmodified
         """
-        if self.args != None:
-            arguments = copy.deepcopy(self.args)
-            for index, column in enumerate(self.columns):
-                sig                 = signature(self.funcs[index])
-                number_of_arguments = len(sig.parameters)
-                if number_of_arguments != 1:
-                    dataframe[column] = self.funcs[index](dataframe[column], *arguments[0])
-                    arguments.pop(0)
-                    continue
-                dataframe[column] = self.funcs[index](dataframe[column])
-            
-            return dataframe
-
-        for index, column in enumerate(self.columns):
-            dataframe[column] = self.funcs[index](dataframe[column])
+        if self.executor != "serial" and self._pool is None:
+            with self:
+                return self.transform(dataframe)
+
+        if self._pool is None:
+            transformed = {column: _apply(steps, dataframe[column]) for column, steps in self.plan.items()}
+        else:
+            futures     = {column: self._pool.submit(_run, steps, dataframe[column]) for column, steps in self.plan.items()}
+            outcomes    = {column: future.result() for column, future in futures.items()}
+            errors      = {column: error for column, (_, error) in outcomes.items() if error is not None}
+            if errors:
+                raise exception.TransformError(errors) from next(iter(errors.values()))
+            transformed = {column: values for column, (values, _) in outcomes.items()}
+        for column, values in transformed.items():
+            dataframe[column] = values
 
         return dataframe
 
 
+    def __compile(self) -> dict[str, list[tuple[Callable, tuple]]]:
+        """
+        Compiles the columns, functions and arguments into a plan, if arguments are given, the functions which
+        do not take exactly one parameter get the next arguments in order, the functions on the same column keep their order
+
+        Returns
+        -------
+        dict[str, list[tuple[Callable, tuple]]]
+            The functions and their additional arguments per column
+        """
+        arguments = list(self.args) if self.args is not None else None
+        plan      = {}
+        for column, func in zip(self.columns, self.funcs):
+            step_arguments = ()
+            if arguments is not None and len(signature(func).parameters) != 1:
+                if not arguments:
+                    raise exception.DimError(f"There are less arguments than functions which need additional arguments!")
+                step_arguments = tuple(arguments.pop(0))
+            plan.setdefault(column, []).append((func, step_arguments))
+
+        return plan
+
+
+def _apply(steps: list[tuple[Callable, tuple]], values: pd.Series) -> pd.Series:
+    """ Applies the steps of a column one after another """
+    for func, arguments in steps:
+        values = func(values, *arguments)
+
+    return values
+
+
+def _run(steps: list[tuple[Callable, tuple]], values: pd.Series) -> tuple[pd.Series, Exception]:
+    """ Applies the steps of a column in a pool, an error is returned instead of raised such that every column is reported """
+    try:
+        return _apply(steps, values), None
+    except Exception as error:
+        return None, error
+
+
 #################################################################################################
 #                              Useful Transformer Callables                                     #
 #################################################################################################
@@ -133,4 +229,4 @@ def impute_median(x: pd.DataFrame) -> pd.DataFrame:
 
 def replace_entries(x: pd.DataFrame, target_entry: Any, replace_value: Any):
     """ Replaces target entries with the choosen `replace_value` """
-    return x.apply(lambda y: replace_value if y == target_entry else y)
\ No newline at end of file
+    return x.mask(x.eq(target_entry), replace_value)
\ No newline at end of file
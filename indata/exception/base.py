@@ -29,4 +29,14 @@ class InconsistentDataTypes(Exception):
     When data types do not match with each other, an error is thrown,
     especially when dealing with dataframes
     """
-    pass
\ No newline at end of file
+    pass
+
+
+class TransformError(Exception):
+    """
+    When transformations of columns fail, the errors are kept per column
+    """
+    def __init__(self, errors: dict):
+        self.errors = errors
+        super().__init__(f"The transformation of the columns {list(errors)} failed: " +
+                         "; ".join(f"{column}: {error!r}" for column, error in errors.items()))
\ No newline at end of file
@@ -9,6 +9,12 @@ import plotly.graph_objects as go
 
 from abc import abstractmethod
 
+import indata.utils.quantile as quantile
+
+
+# marks of the quartiles, all other quantiles are annotated by their name and drawn in grey
+_QUARTILE_MARKS = {0.25: ("1st Q.", "red"), 0.5: ("median", "yellow"), 0.75: ("3rd Q.", "green")}
+
 
 #################################################################################################
 #                                 Interface DistributionPlotter                                 #
@@ -37,7 +43,7 @@ class IFDistributionPlotter:
 class ContinuousDistributionPlotter(IFDistributionPlotter):
     """
     Plots distribution of a continuous feature in form of a histogram
-    and add marks for important values like mean and median
+    and add marks for important values like mean and the quantiles
 
     Methods
     -------
@@ -48,8 +54,9 @@ class ContinuousDistributionPlotter(IFDistributionPlotter):
     data: pd.DataFrame = attrs.field(factory = pd.DataFrame)
     dqt: pd.DataFrame  = attrs.field(factory = pd.DataFrame)
     store_dir: str     = attrs.field(factory = str)
+    quantiles: tuple   = attrs.field(default = quantile.DEFAULT_QUANTILES)
 
-    def __init__(self, name: str, data: pd.DataFrame, dqt: pd.DataFrame, store_dir: str = "./"):
+    def __init__(self, name: str, data: pd.DataFrame, dqt: pd.DataFrame, store_dir: str = "./", quantiles: list[float] = None):
         """
         Parameters
         ----------
@@ -62,11 +69,15 @@ class ContinuousDistributionPlotter(IFDistributionPlotter):
             are extracted
         store_dir : str, default = "./"
             A html file containing an interactive plot is stored to `store_dir`
+        quantiles : list[float], optional
+            Quantiles which are marked, they are taken from the DQT and quantiles which are not part of
+            the DQT are computed from `data` in a single pass, by default the quartiles
         """
         self.name      = name
         self.data      = data
         self.dqt       = dqt
         self.store_dir = store_dir
+        self.quantiles = quantile.check_quantiles(quantiles or quantile.DEFAULT_QUANTILES)
 
 
     def plot(self) -> None:
@@ -78,16 +89,13 @@ class ContinuousDistributionPlotter(IFDistributionPlotter):
         if not os.path.exists(os.path.join(self.store_dir, "continuous")):
             os.mkdir(f"{self.store_dir}/continuous")
 
-        first_quantile = self.dqt["1st Qrt."][self.name]
-        mean           = self.dqt["mean"][self.name]
-        median         = self.dqt["median"][self.name]
-        third_quantile = self.dqt["3rd Qrt."][self.name]
+        mean = self.dqt["mean"][self.name]
 
         fig = go.Figure(data = [go.Histogram(x = self.data)])
-        fig.add_vline(x = first_quantile, line_dash = "dash", line_color = "red", annotation_text = "1st Q.")
         fig.add_vline(x = mean, line_dash = "dash", line_color = "orange", annotation_text = "mean")
-        fig.add_vline(x = median, line_dash = "dash", line_color = "yellow", annotation_text = "median")
-        fig.add_vline(x = third_quantile, line_dash = "dash", line_color = "green", annotation_text = "3rd Q.")
+        for q, value in self.__quantile_values().items():
+            text, color = _QUARTILE_MARKS.get(q, (quantile.quantile_name(q), "grey"))
+            fig.add_vline(x = value, line_dash = "dash", line_color = color, annotation_text = text)
         fig.update_layout(
             title       = {'font': {'size': 30}, 'text': f"{self.name} - Distribution"},
             xaxis_title = f"{self.name.lower()}",
@@ -98,6 +106,18 @@ class ContinuousDistributionPlotter(IFDistributionPlotter):
         fig.write_html(f"{self.store_dir}/continuous/{self.name}.html")
 
 
+    def __quantile_values(self) -> dict[float, float]:
+        """ The values of the quantiles, taken from the DQT where possible, the others are selected from the data in one pass """
+        names   = {q: quantile.quantile_name(q) for q in self.quantiles}
+        values  = {q: self.dqt[name][self.name] for q, name in names.items() if name in self.dqt.columns}
+        missing = [q for q in self.quantiles if q not in values]
+        if missing:
+            data = pd.to_numeric(pd.Series(self.data).dropna()).to_numpy()
+            values.update(zip(missing, quantile.exact_quantiles(data, missing)))
+
+        return {q: values[q] for q in self.quantiles}
+
+
 #################################################################################################
 #                                 CategoricalDistributionPlotter                                #
 #################################################################################################
@@ -7,6 +7,7 @@ import pandas as pd
 
 import indata.dataio.load as load
 import indata.table.dqt as dqt
+import indata.table.options as options
 import indata.utils.count as count
 import indata.plot.distribution as distribution
 
@@ -126,6 +127,28 @@ class TestDistributionPlots(unittest.TestCase):
         assert file_exists == True
 
 
+    def test_successful_plot_s03(self):
+        """ Testing whether quantiles which are not part of the DQT are computed from the data and marked """
+
+        """ PREPARATION """
+        data            = self.dataloader.read_csv()
+        analytics_table = dqt.DataQualityTable(dataloader = self.dataloader)
+        cqt, _          = analytics_table.create_table(continuous_features = ["Feature1"], categorical_features = [],
+                                                       store_json_dir = f"{self.path_to_this_mod}",
+                                                       options = options.TableOptions(quantiles = [0.05, 0.5]))
+        cdist           = distribution.ContinuousDistributionPlotter(name = "Feature1", data = data["Feature1"], dqt = cqt,
+                                                                     store_dir = f"{self.path_to_this_mod}/plots", quantiles = [0.05, 0.5, 0.95])
+
+        """ EXECUTION """
+        cdist.plot()
+
+        """ VERIFICATION """
+        with open(f"{self.path_to_this_mod}/plots/continuous/Feature1.html") as file:
+            html = file.read()
+
+        assert "P5" in html and "median" in html and "P95" in html
+
+
     def tearDown(self):
         """ Delete all the files which have been generated """
         if os.path.exists(f"{self.path_to_this_mod}/plots/continuous/Feature1.html"):
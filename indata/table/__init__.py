@@ -1 +1,3 @@
-from indata.table.dqt import DataQualityTable
\ No newline at end of file
+from indata.table.dqt import DataQualityTable
+from indata.table.metrics import Metric, register_metric, unregister_metric
+from indata.table.options import TableOptions
\ No newline at end of file
@@ -7,16 +7,30 @@ to visualize it in the first place
 """
 
 import os
+import json
 import attrs
-import pandas as pd
 import numpy as np
+import pandas as pd
 
 from abc    import abstractmethod
 from typing import Any
 
 import indata.dataio as dataio
-import indata.utils.checks as checks
-import indata.exception.base as exception
+import indata.table.stats as stats
+import indata.table.parallel as parallel
+import indata.table.validation as validate
+import indata.table.options as opts
+import indata.utils.quantile as quantile
+
+
+# number of rows per chunk which are validated at once when the data is loaded completely
+VALIDATION_CHUNKSIZE = 100_000
+# number of rows which are read in order to print the header of the data
+HEADER_ROWS          = 1000
+# name of the file next to the DQTs which holds the state of their accumulators
+STATE_FILE           = "dqt_state.json"
+# metrics which can be taken from the statistics of the row groups of a Parquet file
+FOOTER_METRICS       = ("Count", "Miss. %", "Min", "Max")
 
 
 #################################################################################################
@@ -48,21 +62,34 @@ class IFDataQualityTable:
 class DataQualityTable(IFDataQualityTable):
     """
     This class will generate a DQT based on the given
-    data which is loaded by the DataLoader
+    data which is loaded by the DataLoader, the data is not loaded before it is needed
+    and then only the columns of the features are read
     
     Methods
     -------
     print_header_info()
         Prints the features of the data
-    create_table(continuous_features: list[str], categorical_features: list[str], store_json_dir: str)
+    create_table(continuous_features: list[str], categorical_features: list[str], store_json_dir: str, options: TableOptions)
         Creates the DQT, the split into continuous and categorical features bases on the selection of the user,
         e.g. `continuous_features' is a list of feature names which match the name of the column in the data.
-        `store_json_dir` is a path to a directory where the table will be stored in json format. 
+        `store_json_dir` is a path to a directory where the table will be stored in json format, `options`
+        configure the profiling, the metrics and the stored state. 
+    update_table(store_json_dir: str)
+        Updates the DQTs inside of `store_json_dir` with the data of this instance, e.g. with rows
+        which were appended since the DQTs were created
     """
     dataloader: dataio.DataLoader = attrs.field(factory = dataio.DataLoader)
     check_consistentcy: bool      = attrs.field(factory = bool)
-
-    def __init__(self, dataloader: dataio.DataLoader, check_consistency: bool = False):
+    chunksize: int                = attrs.field(default = None)
+    chunk_bytes: int              = attrs.field(default = None)
+    validation: str               = attrs.field(factory = str)
+    sample_size: int              = attrs.field(default = 10_000)
+    columns: list[str]            = attrs.field(default = None)
+    predicates: list              = attrs.field(default = None)
+    _dataframe: pd.DataFrame      = attrs.field(default = None)
+
+    def __init__(self, dataloader: dataio.DataLoader, check_consistency: bool = False, chunksize: int = None, chunk_bytes: int = None,
+                 validation: str = "full", sample_size: int = 10_000, columns: list[str] = None, predicates: list = None):
         """
         Parameters
         ----------
@@ -71,20 +98,66 @@ class DataQualityTable(IFDataQualityTable):
         check_consistency : bool, optional
             If `check_consistency` is True, the DataFrame will be checked for inconsistencies, otherwise the program
             will continue without checking its consistency, the default is set to False
+        chunksize : int, optional
+            If given, the data is not loaded at once but streamed in chunks of `chunksize` rows when the DQT is created,
+            quantiles and cardinalities of continuous features are then approximated, by default None
+        chunk_bytes : int, optional
+            Like `chunksize`, but the chunks are sized by a rough byte budget, by default None
+        validation : str, optional
+            Strategy of the consistency check, "full" checks every row, "sample" checks a uniform sample of
+            `sample_size` rows and "fail_fast" rejects the data at its first inconsistent chunk, by default "full"
+        sample_size : int, optional
+            Number of rows which are checked for the validation strategy "sample", by default 10_000
+        columns : list[str], optional
+            Only these columns are loaded, by default None which loads all columns, if the data is streamed,
+            only the features of the DQT are read anyway
+        predicates : list[dataio.predicate.IFPredicate], optional
+            Only the rows which satisfy all predicates are profiled, e.g. `dataio.Range("price", upper = 2000)`,
+            by default None
         """
-        self.dataframe = self.__check_schema(dataloader.read_csv(), check_consistency)
+        self.dataloader         = dataloader
+        self.check_consistentcy = check_consistency
+        self.chunksize          = chunksize
+        self.chunk_bytes        = chunk_bytes
+        self.validation         = validation
+        self.sample_size        = sample_size
+        self.columns            = columns
+        self.predicates         = predicates
+        self._dataframe         = None
+
+
+    @property
+    def streaming(self) -> bool:
+        """ Whether the data is streamed in chunks instead of being loaded at once """
+        return self.chunksize is not None or self.chunk_bytes is not None
+
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        """ The whole data, it is loaded and checked at the first access, None if the data is streamed """
+        if self.streaming:
+            return None
+        if self._dataframe is None:
+            self._dataframe = self.__load(self.columns)
+
+        return self._dataframe
 
 
     def print_header_infos(self) -> None:
         """ 
-        Prints the column names of the dataframe and the types of the columns 
+        Prints the column names of the dataframe and the types of the columns, only the first
+        rows are read unless the data was loaded already
         """
-        columns    = self.dataframe.columns
-        for index in range(len(self.dataframe.loc[0])):
-            print(f"{columns[index]}:", type(self.dataframe.loc[0][index]))
+        dataframe = self._dataframe
+        if dataframe is None:
+            dataframe = next(iter(self.dataloader.read_chunks(chunksize = HEADER_ROWS, columns = self.columns)))
+        columns   = dataframe.columns
+        for index in range(len(dataframe.loc[0])):
+            print(f"{columns[index]}:", type(dataframe.loc[0][index]))
 
 
-    def create_table(self, continuous_features: list[str], categorical_features: list[str], store_json_dir: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+    def create_table(self, continuous_features: list[str] = None, categorical_features: list[str] = None, store_json_dir: str = None,
+                     options: opts.TableOptions = None) -> tuple[pd.DataFrame, pd.DataFrame]:
         """
         Creates the DQT and stores it as a json file, two json files
         be generated, one for the continous features and one for the categorical
@@ -92,174 +165,400 @@ class DataQualityTable(IFDataQualityTable):
 
         Parameters
         ----------
-        continuous_features : list[str]
+        continuous_features : list[str], optional
             The list elements should match the name of the respective column name in the dataframe, based on that, 
-            the continuous DQT will be generated for those features
-        categorical_features : list[str]
+            the continuous DQT will be generated for those features, by default None which takes the continuous
+            features of the schema of the dataset
+        categorical_features : list[str], optional
             The list elements should match the name of the respective column name in the dataframe, based on that, 
-            the categorical DQT will be generated for those features
+            the categorical DQT will be generated for those features, by default None which takes the categorical
+            features of the schema of the dataset
         store_json_dir : str
-            Path to a directory in which the two json files are stored
+            Path to a directory in which the two json files are stored, it is required
+        options : opts.TableOptions, optional
+            How the features are profiled, which metrics are reported, whether the statistics of the row groups are used,
+            whether the state is stored and by which executor the columns are profiled, by default `TableOptions()`
 
         Returns
         -------
         tuple[pd.DataFrame, pd.DataFrame]
             Two dataframes which represent the two DQTs are returned, the first
             return argument is the DQT for continuous features, the second one
-            for categorical features
+            for categorical features, a DQT without features or metrics is None
+
+        Raises
+        ------
+        ValueError
+            Raised when no directory is given in which the DQTs are stored, when the statistics of the row groups are requested
+            for a file which is no Parquet file, when the statistics are combined with predicates, when the quantiles are invalid
+            or when a metric is unknown
         """
-        # continuous data
-        dqt_cont = None
-        if continuous_features:
-            data_frame_cont = self.dataframe[continuous_features]
-            dqt_cont        = self.__create_continuous_dqt(data_frame_cont = data_frame_cont, continuous_features = continuous_features)
+        if store_json_dir is None:
+            raise ValueError("A directory in which the DQTs are stored has to be given!")
+        options = options or opts.TableOptions()
+        schema = self.dataloader.dataset.schema
+        if continuous_features is None:
+            continuous_features = schema.continuous_features if schema is not None else []
+        if categorical_features is None:
+            categorical_features = schema.categorical_features if schema is not None else []
+
+        metadata    = options.metadata
+        store_state = options.store_state
+        if self.predicates and metadata != "scan":
+            raise ValueError("The statistics of the row groups describe all rows, thus predicates require the data to be scanned!")
+        # a stored state holds sketches of constant size unless the exact quantiles are requested explicitly
+        exact = options.quantile_method == "exact" if options.quantile_method is not None else not (self.streaming or store_state)
+
+        continuous_template  = stats.ContinuousAccumulator(exact = exact, cardinality = options.cardinality, precision = options.precision,
+                                                           probabilities = options.quantiles or quantile.DEFAULT_QUANTILES)
+        categorical_template = stats.CategoricalAccumulator(top_k = options.top_k, approximate = options.approximate_modes,
+                                                            capacity = options.mode_capacity, cardinality = options.cardinality,
+                                                            precision = options.precision)
+        if options.metrics is not None:
+            continuous_template, categorical_template = self.__select_metrics(options.metrics, continuous_template, categorical_template)
+            # a DQT without any of the requested metrics is neither built nor stored
+            continuous_features  = continuous_features if continuous_template.metrics else []
+            categorical_features = categorical_features if categorical_template.metrics else []
+        statistics = None
+        if metadata != "scan":
+            statistics = self.dataloader.read_statistics(columns = list(dict.fromkeys([*continuous_features, *categorical_features])))
+        # the metrics in the layout of the DQTs, with "first" the metrics which the statistics store are not scanned
+        continuous_metrics, categorical_metrics = continuous_template.metrics, categorical_template.metrics
+        if metadata == "first":
+            continuous_template  = self.__skip_footer(continuous_template, statistics, continuous_features)
+            categorical_template = self.__skip_footer(categorical_template, statistics, categorical_features)
+        if metadata == "only":
+            dqt_cont = self.__create_footer_dqt(statistics = statistics, features = continuous_features, template = continuous_template)
+            dqt_catg = self.__create_footer_dqt(statistics = statistics, features = categorical_features, template = categorical_template)
+        else:
+            with parallel.ColumnExecutor(kind = options.executor, workers = options.workers) as column_executor:
+                if self.streaming or store_state:
+                    continuous  = {feature: continuous_template.spawn() for feature in continuous_features}
+                    categorical = {feature: categorical_template.spawn() for feature in categorical_features}
+                    self.__accumulate(continuous = continuous, categorical = categorical, column_executor = column_executor)
+                    dqt_cont = stats.to_table(continuous) if continuous_features else None
+                    dqt_catg = stats.to_table(categorical) if categorical_features else None
+                else:
+                    # only the columns of the features are read
+                    data_frame = self.__read_features([*continuous_features, *categorical_features]) if continuous_features or categorical_features else None
+
+                    # continuous data
+                    dqt_cont = None
+                    if continuous_features:
+                        data_frame_cont = data_frame[continuous_features]
+                        dqt_cont        = self.__create_dqt(data_frame = data_frame_cont, features = continuous_features, template = continuous_template,
+                                                            column_executor = column_executor)
+
+                    # categorical data
+                    dqt_catg = None
+                    if categorical_features:
+                        data_frame_catg = data_frame[categorical_features]
+                        dqt_catg        = self.__create_dqt(data_frame = data_frame_catg, features = categorical_features, template = categorical_template,
+                                                            column_executor = column_executor)
+            dqt_cont = self.__apply_footer(dqt_cont, statistics, continuous_metrics)
+            dqt_catg = self.__apply_footer(dqt_catg, statistics, categorical_metrics)
+
+        if dqt_cont is not None:
             print("The DQT for the continuous features is:", dqt_cont.head(10))
-
-        # categorical data
-        dqt_catg = None
-        if categorical_features:
-            data_frame_catg = self.dataframe[categorical_features]
-            dqt_catg        = self.__create_categorical_dqt(data_frame_catg = data_frame_catg, categorical_features = categorical_features)
+        if dqt_catg is not None:
             print("The DQT for the categorical features is:", dqt_catg.head(10))
 
-        if not os.path.exists(store_json_dir):
-            os.mkdir(store_json_dir) # pragma: no cover
-
-        if continuous_features:
-            dqt_cont.to_json(f'{store_json_dir}/dqt_cont.json')
-        if categorical_features:
-            dqt_catg.to_json(f'{store_json_dir}/dqt_catg.json')
+        tables = self.__store_tables(dqt_cont = dqt_cont, dqt_catg = dqt_catg, store_json_dir = store_json_dir)
+        if store_state:
+            self.__store_state(continuous = continuous, categorical = categorical, store_json_dir = store_json_dir)
 
-        return dqt_cont, dqt_catg
+        return tables
 
 
-    def __create_continuous_dqt(self, data_frame_cont: pd.DataFrame, continuous_features: list[str]) -> pd.DataFrame:
+    def update_table(self, store_json_dir: str, executor: str = "serial", workers: int = None) -> tuple[pd.DataFrame, pd.DataFrame]:
         """
-        Creates the DQT for the continuous features
+        Updates the DQTs inside of `store_json_dir`, which were created by `create_table` with `store_state = True`,
+        with the data of this instance, the data has to contain only the new rows, e.g. the rows or files which were
+        appended to an ABT since the DQTs were created. The features and the configuration of the metrics are taken
+        from the stored state, the refreshed DQTs and their state replace the stored ones
 
         Parameters
         ----------
-        data_frame_cont : pd.DataFrame
-            The respective subset of the original dataframe which contains
-            only the continuous features
-        continuous_features : list[str]
-            The list of names of the continuous features
+        store_json_dir : str
+            Path to the directory in which the DQTs and their state are stored
+        executor : str, optional
+            The columns are profiled concurrently by a "thread" or a "process" pool or one after another if
+            `executor` is "serial", by default "serial"
+        workers : int, optional
+            Number of workers of the pool, by default None which uses the number of CPUs
 
         Returns
         -------
-        pd.DataFrame
-            The DQT for continuous features
+        tuple[pd.DataFrame, pd.DataFrame]
+            The updated DQTs for continuous and categorical features
+
+        Raises
+        ------
+        FileNotFoundError
+            Raised when no state is stored inside of `store_json_dir`
         """
-        number_of_rows = len(data_frame_cont.index)
-        counts         = data_frame_cont.count().to_dict()
-        missing_values = data_frame_cont.isnull().sum() * 100 / number_of_rows
-        missing_values = missing_values.to_dict()
-        cardinality    = data_frame_cont.nunique(axis = 0).to_dict()
-        minima         = data_frame_cont.min(axis = 0).to_dict()
-        first_quantile = data_frame_cont.quantile(0.25).to_dict()
-        mean           = data_frame_cont.mean(axis = 0).to_dict()
-        median         = data_frame_cont.median(axis = 0).to_dict()
-        third_quantile = data_frame_cont.quantile(0.75).to_dict()
-        maxima         = data_frame_cont.max(axis = 0).to_dict()
-        standard_dev   = data_frame_cont.std(axis = 0).to_dict()
-
-        data_dict      = {'Count': counts.values(), 'Miss. %': missing_values.values(), 'Card.': cardinality.values(),
-                          'Min': minima.values(), '1st Qrt.': first_quantile.values(), 'mean': mean.values(), 'median': median.values(),
-                          '3rd Qrt.': third_quantile.values(), 'Max': maxima.values(), 'Std. Dev.': standard_dev.values()}
-
-        return pd.DataFrame(data = data_dict, index = continuous_features)
-
-
-    def __create_categorical_dqt(self, data_frame_catg: pd.DataFrame, categorical_features: list[str]) -> pd.DataFrame:
+        continuous, categorical = self.__load_state(store_json_dir)
+        delta_continuous        = {feature: accumulator.spawn() for feature, accumulator in continuous.items()}
+        delta_categorical       = {feature: accumulator.spawn() for feature, accumulator in categorical.items()}
+        with parallel.ColumnExecutor(kind = executor, workers = workers) as column_executor:
+            self.__accumulate(continuous = delta_continuous, categorical = delta_categorical, column_executor = column_executor)
+        for accumulators, delta in ((continuous, delta_continuous), (categorical, delta_categorical)):
+            for feature, accumulator in accumulators.items():
+                accumulator.merge(delta[feature])
+
+        tables = self.__store_tables(dqt_cont = stats.to_table(continuous) if continuous else None,
+                                     dqt_catg = stats.to_table(categorical) if categorical else None, store_json_dir = store_json_dir)
+        self.__store_state(continuous = continuous, categorical = categorical, store_json_dir = store_json_dir)
+
+        return tables
+
+
+    def __store_state(self, continuous: dict[str, stats.IFAccumulator], categorical: dict[str, stats.IFAccumulator], store_json_dir: str) -> None:
+        """ Stores the state of the accumulators of both DQTs as json file next to the DQTs, the file is replaced atomically """
+        state     = {'continuous': {feature: accumulator.to_dict() for feature, accumulator in continuous.items()},
+                     'categorical': {feature: accumulator.to_dict() for feature, accumulator in categorical.items()}}
+        temporary = f"{store_json_dir}/{STATE_FILE}.{os.getpid()}.tmp"
+        with open(temporary, "w") as file:
+            json.dump(state, file)
+        os.replace(temporary, f"{store_json_dir}/{STATE_FILE}")
+
+
+    def __load_state(self, store_json_dir: str) -> tuple[dict[str, stats.IFAccumulator], dict[str, stats.IFAccumulator]]:
+        """ Loads the accumulators of both DQTs which were stored by `__store_state` """
+        with open(f"{store_json_dir}/{STATE_FILE}") as file:
+            state = json.load(file)
+
+        return ({feature: stats.accumulator_from_dict(accumulator) for feature, accumulator in state['continuous'].items()},
+                {feature: stats.accumulator_from_dict(accumulator) for feature, accumulator in state['categorical'].items()})
+
+
+    def __create_footer_dqt(self, statistics: pd.DataFrame, features: list[str], template: stats.IFAccumulator) -> pd.DataFrame:
         """
-        Creates the DQT for categorical features
+        Creates the DQT for either the continuous or the categorical features from the statistics of the
+        row groups of a Parquet file, only the metrics which are stored in the statistics are filled
 
         Parameters
         ----------
-        data_frame_catg : pd.DataFrame
-            Dataframe which only contains the categorical features
-        categorical_features : list[str]
-            The names of the categorical features
+        statistics : pd.DataFrame
+            The statistics of the row groups per feature, see `DataLoader.read_statistics`
+        features : list[str]
+            The list of names of the features
+        template : stats.IFAccumulator
+            Empty accumulator which defines the metrics of the DQT
 
         Returns
         -------
         pd.DataFrame
-            The DQT with the categorical features
+            The DQT for the features, None if there are no features
+        """
+        if not features:
+            return None
+
+        rows = {feature: dict.fromkeys(template.metrics) for feature in features}
+
+        return self.__apply_footer(stats.rows_to_table(rows), statistics).infer_objects()
+
+
+    def __apply_footer(self, dqt: pd.DataFrame, statistics: pd.DataFrame, metrics: tuple[str] = None) -> pd.DataFrame:
+        """
+        Overrides 'Count', 'Miss. %', 'Min' and 'Max' of the DQT with the statistics of the row groups wherever they are stored,
+        metrics of `metrics` which were not scanned are taken from the statistics and the columns are put into the order of `metrics`
+        """
+        if dqt is None or statistics is None:
+            return dqt
+
+        footer = {metric: {} for metric in FOOTER_METRICS}
+        for feature in dqt.index:
+            count, missing, minimum, maximum = statistics.loc[feature, ["Count", "Missing", "Min", "Max"]]
+            if missing is not None and not pd.isna(missing):
+                footer['Count'][feature]   = count
+                footer['Miss. %'][feature] = missing / (count + missing) * 100 if count + missing > 0 else np.nan
+            if minimum is not None:
+                footer['Min'][feature] = minimum
+                footer['Max'][feature] = maximum
+        for metric, values in footer.items():
+            if metric in dqt.columns:
+                for feature, value in values.items():
+                    dqt.loc[feature, metric] = value
+            elif metric in (metrics or ()):
+                dqt[metric] = pd.Series(values, dtype = None if values else np.float64).reindex(dqt.index)
+
+        return dqt[list(metrics)] if metrics is not None else dqt
+
+
+    def __skip_footer(self, template: stats.IFAccumulator, statistics: pd.DataFrame, features: list[str]) -> stats.IFAccumulator:
+        """
+        Returns a template which does not compute the metrics of the footer that the statistics of the row groups store
+        for every feature, e.g. the minimum and the maximum are then not scanned
+        """
+        if not features:
+            return template
+        rows    = statistics.loc[features]
+        stored  = ["Count", "Miss. %"] if rows["Missing"].notna().all() else []
+        stored += ["Min", "Max"] if rows["Min"].notna().all() else []
+
+        return self.__with_metrics(template, [metric for metric in template.metrics if metric not in stored])
+
+
+    def __with_metrics(self, template: stats.IFAccumulator, metrics: list[str]) -> stats.IFAccumulator:
+        """ Returns an empty accumulator with the configuration of `template` which reports only `metrics` """
+        if isinstance(template, stats.ContinuousAccumulator):
+            return stats.ContinuousAccumulator(exact = template.exact, cardinality = template.method, precision = template.precision,
+                                               probabilities = template.probabilities, metrics = metrics)
+
+        return stats.CategoricalAccumulator(top_k = template.top_k, approximate = template.approximate, capacity = template.capacity,
+                                            cardinality = template.method, precision = template.precision, metrics = metrics)
+
+
+    def __select_metrics(self, metrics: list[str], continuous_template: stats.ContinuousAccumulator,
+                         categorical_template: stats.CategoricalAccumulator) -> tuple[stats.ContinuousAccumulator, stats.CategoricalAccumulator]:
         """
-        number_of_rows = len(data_frame_catg.index)
-        counts         = data_frame_catg.count().to_dict()
-        missing_values = data_frame_catg.isnull().sum() * 100 / number_of_rows
-        missing_values = missing_values.to_dict()
-        cardinality    = data_frame_catg.nunique(axis = 0).to_dict()
-
-        mode           = {}
-        mode_freq      = {}
-        mode_rel_freq  = {}
-        for column in data_frame_catg.columns:
-            mode[column]          = data_frame_catg[column].value_counts().index.to_list()[0]
-            mode_freq[column]     = data_frame_catg[column].value_counts().iloc[0]
-            mode_rel_freq[column] = data_frame_catg[column].value_counts().iloc[0] * 100 / counts[column]
-
-        second_mode          = {}
-        second_mode_freq     = {}
-        second_mode_rel_freq = {}
-        for column in data_frame_catg.columns:
-            second_mode[column]          = data_frame_catg[column].value_counts().index.to_list()[1]
-            second_mode_freq[column]     = data_frame_catg[column].value_counts().iloc[1]
-            second_mode_rel_freq[column] = data_frame_catg[column].value_counts().iloc[1] * 100 / counts[column]
-
-        data_dict = {'Count': counts.values(), 'Miss. %': missing_values.values(), 'Card.': cardinality.values(),
-                     'Mode': mode, 'Mode Freq.': mode_freq, 'Mode Freq. %': mode_rel_freq,
-                     '2nd Mode': second_mode, '2nd Mode Freq.': second_mode_freq, '2nd Mode Freq. %': second_mode_rel_freq}
-
-        return pd.DataFrame(data = data_dict, index = categorical_features)
-
-
-    def __check_schema(self, dataframe: pd.DataFrame, check_consistency: bool) -> pd.DataFrame:
+        Splits the requested metrics between the continuous and the categorical DQT, every metric goes to the DQTs
+        whose accumulators know it, and returns templates which compute only these metrics
+
+        Raises
+        ------
+        ValueError
+            Raised when a metric is known by neither of the DQTs
         """
-        Checks whether the data is consistent or not with its schema, the schema
-        is inferred based on the datatype of the zero-indexed element
+        unknown = [metric for metric in metrics if metric not in continuous_template.metrics and metric not in categorical_template.metrics]
+        if unknown:
+            raise ValueError(f"Unknown metrics {unknown}, choose from {list(dict.fromkeys([*continuous_template.metrics, *categorical_template.metrics]))}!")
+
+        return (self.__with_metrics(continuous_template, [metric for metric in metrics if metric in continuous_template.metrics]),
+                self.__with_metrics(categorical_template, [metric for metric in metrics if metric in categorical_template.metrics]))
+
+
+    def __store_tables(self, dqt_cont: pd.DataFrame, dqt_catg: pd.DataFrame, store_json_dir: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Stores the DQTs which are not None as json files inside of `store_json_dir`
+
+        Returns
+        -------
+        tuple[pd.DataFrame, pd.DataFrame]
+            The DQTs for continuous and categorical features
+        """
+        if not os.path.exists(store_json_dir):
+            os.mkdir(store_json_dir) # pragma: no cover
+
+        if dqt_cont is not None:
+            dqt_cont.to_json(f'{store_json_dir}/dqt_cont.json')
+        if dqt_catg is not None:
+            dqt_catg.to_json(f'{store_json_dir}/dqt_catg.json')
+
+        return dqt_cont, dqt_catg
+
+
+    def __accumulate(self, continuous: dict[str, stats.IFAccumulator], categorical: dict[str, stats.IFAccumulator],
+                     column_executor: parallel.ColumnExecutor) -> None:
+        """
+        Folds the data into the accumulators of both DQTs in a single pass, streamed data is read
+        chunk by chunk and every chunk is dropped after it was folded, thus only one chunk is held in memory
 
         Parameters
         ----------
-        dataframe : pd.DataFrame
-            DataFrame which needs to be checked whether it is consistent or not
-        check_consistency : bool, optional
-            If `check_consistency` is True, the DataFrame will be checked for inconsistencies, otherwise the program
-            will continue without checking its consistency, the default is set to False
+        continuous : dict[str, stats.IFAccumulator]
+            The accumulators of the continuous features
+        categorical : dict[str, stats.IFAccumulator]
+            The accumulators of the categorical features
+        column_executor : parallel.ColumnExecutor
+            Executor which accumulates the columns of a chunk
+        """
+        # only the columns of the features are parsed
+        features = list(dict.fromkeys([*continuous, *categorical]))
+        if not self.streaming:
+            if features:
+                stats.accumulate([self.__read_features(features)], continuous, categorical,
+                                 executor = column_executor if column_executor.kind != "serial" else None)
+            return
+
+        chunks    = self.dataloader.read_chunks(chunksize = self.chunksize, chunk_bytes = self.chunk_bytes, columns = features,
+                                                predicates = self.predicates)
+        validator = self.__create_validator() if self.check_consistentcy else None
+        if validator is not None:
+            chunks = validator.check(chunks)
+        try:
+            stats.accumulate(chunks, continuous, categorical, executor = column_executor if column_executor.kind != "serial" else None)
+        except ValueError:
+            # inconsistent chunks which were not rejected yet can break the accumulation, the report of the validator is raised instead
+            if validator is not None:
+                validator.validate()
+            raise
+
+
+    def __create_dqt(self, data_frame: pd.DataFrame, features: list[str], template: stats.IFAccumulator,
+                     column_executor: parallel.ColumnExecutor) -> pd.DataFrame:
+        """
+        Creates the DQT for either the continuous or the categorical features, every feature is
+        profiled in a single pass by an accumulator. For categorical features, the frequencies are
+        counted once and the modes, their frequencies and the cardinality are derived from them
+
+        Parameters
+        ----------
+        data_frame : pd.DataFrame
+            The respective subset of the original dataframe which contains only the given features
+        features : list[str]
+            The list of names of the features
+        template : stats.IFAccumulator
+            Empty accumulator which is spawned for every feature
+        column_executor : parallel.ColumnExecutor
+            Executor which profiles the columns
 
         Returns
         -------
         pd.DataFrame
-            A consistent DataFrame is returned when there are no conflicts
+            The DQT for the features
+        """
+        accumulators = {feature: template.spawn() for feature in features}
+
+        return stats.rows_to_table(column_executor.map(stats.profile_column, data_frame, accumulators))
+
+
+    def __read_features(self, features: list[str]) -> pd.DataFrame:
+        """
+        Reads only the columns of the features, unless the whole data was loaded already
 
         Raises
         ------
-            InconsistentData
-                When the Data is inconsistent, this error will be raised
-            InconsistentDataTypes
-                When the data types of each column in a dataframe is not equal, this error
-                will be raised
+        KeyError
+            Raised when a feature is not one of the selected columns
+        """
+        features = list(dict.fromkeys(features))
+        if self._dataframe is not None:
+            return self._dataframe[features]
+        if self.columns is not None and any(feature not in self.columns for feature in features):
+            raise KeyError(f"The features {[feature for feature in features if feature not in self.columns]} are not selected by the columns!")
+
+        return self.__load(features)
+
+
+    def __load(self, columns: list[str]) -> pd.DataFrame:
+        """
+        Loads the columns at once, if the consistency is checked, the data is validated while it is read,
+        thus inconsistent data is rejected before it is loaded completely
+        """
+        if not self.check_consistentcy:
+            return self.dataloader.read(columns = columns, predicates = self.predicates)
+
+        chunks    = self.dataloader.read_chunks(chunksize = VALIDATION_CHUNKSIZE, columns = columns, predicates = self.predicates)
+        dataframe = pd.concat(list(self.__create_validator().check(chunks)), ignore_index = True)
+        if self.dataloader.dataset.schema is not None:
+            # categories of the chunks can differ, thus they are unified after the concatenation
+            dataframe = self.dataloader.dataset.schema.conform(dataframe)
+
+        return dataframe
+
+
+    def __create_validator(self) -> validate.SchemaValidator:
         """
+        Creates the validator which checks whether the data is consistent or not with its schema, the schema
+        is inferred based on the datatype of the zero-indexed element, the chunks are validated with the
+        strategy `self.validation` while they are consumed
 
-        if check_consistency:
-            target_dataframe = dataframe.copy(deep = True)
-            target_dataframe.replace(' ', np.nan)
-
-            rows_with_nan_values = target_dataframe[target_dataframe.isna().any(axis = 1)]
-            if len(rows_with_nan_values) != 0:
-                raise exception.InconsistentData(f"Data seems to be inconsistent!\nThe following rows contain either NaN or missing values:\n{rows_with_nan_values.to_markdown()}")
-
-            for column in dataframe.columns:
-                target_dataframe[column] = target_dataframe[column].apply(lambda x: float(x) if checks.isNumeric(x) else x)
-                present_data_types       = target_dataframe[column].apply(lambda x: type(x)).unique()
-                if len(present_data_types) > 1:
-                    inferred_type = type(target_dataframe[column].iloc[0])
-                    if np.issubdtype(inferred_type, np.integer):
-                        inferred_type = np.integer
-                    corrupted_indices = target_dataframe[column][target_dataframe[column].apply(lambda x: not np.issubdtype(type(x), inferred_type))].index.to_list()
-                    raise exception.InconsistentDataTypes(f"Column {column} contains multiple data types and is thus inconsistent, it contains the following\
-                                                            data types: {present_data_types}! Watch out for the following lines which might cause this inconsistency:\
-                                                            {corrupted_indices}")
-
-        return dataframe
\ No newline at end of file
+        Returns
+        -------
+        validate.SchemaValidator
+            The validator, its method `check` raises InconsistentData or InconsistentDataTypes
+            when the data is inconsistent
+        """
+        return validate.SchemaValidator(strategy = self.validation, sample_size = self.sample_size)
\ No newline at end of file
@@ -0,0 +1,221 @@
+"""
+The metrics of a DQT are resolved by a registry. Every metric declares the metrics it depends on,
+thus only the requested metrics and their dependencies are computed and intermediate results, like
+the mean for the standard deviation or the sorted values for the quantiles, are shared between them.
+Besides the built-in metrics of the accumulators, custom metrics like the skewness or the number of
+zeros can be registered, they can keep a state of their own which is merged across chunks
+"""
+
+import attrs
+
+from abc    import abstractmethod
+from typing import Any, Callable
+
+
+KINDS = ("continuous", "categorical")
+
+
+#################################################################################################
+#                                      Interface Metric                                         #
+#################################################################################################
+
+class IFMetric:
+    """
+    Interface for metrics
+
+    Methods
+    -------
+    compute() Any
+        Computes the value of the metric from the values of its dependencies and its state
+    """
+
+    @abstractmethod
+    def compute(self) -> Any: # pragma: no cover
+        pass
+
+
+#################################################################################################
+#                                           Metric                                              #
+#################################################################################################
+
+@attrs.define()
+class Metric(IFMetric):
+    """
+    A custom metric of either the continuous or the categorical DQT, e.g. the number of zeros
+
+        Metric("Zeros", kind = "continuous", function = lambda row, state: state,
+               update = lambda values: int((values == 0).sum()), merge = operator.add)
+
+    Methods
+    -------
+    compute(row: dict[str, Any], state: Any)
+        Computes the value of the metric
+    """
+    name: str          = attrs.field(factory = str)
+    kind: str          = attrs.field(factory = str)
+    function: Callable = attrs.field(default = None)
+    requires: tuple    = attrs.field(factory = tuple)
+    update: Callable   = attrs.field(default = None)
+    merge: Callable    = attrs.field(default = None)
+
+    def __init__(self, name: str, kind: str, function: Callable, requires: list[str] = None, update: Callable = None, merge: Callable = None):
+        """
+        Parameters
+        ----------
+        name : str
+            Name of the metric, it is the name of its column in the DQT
+        kind : str
+            Either "continuous" or "categorical"
+        function : Callable
+            `function(row, state)` returns the value of the metric, `row` holds the values of the required metrics
+            and `state` the state which was accumulated by `update`, None if the metric has no state
+        requires : list[str], optional
+            Names of the metrics whose values are needed by `function`, they are computed even if they
+            are not reported, by default None
+        update : Callable, optional
+            `update(values)` returns the state of the metric for a chunk of the column, missing values included,
+            by default None
+        merge : Callable, optional
+            `merge(state, other)` merges the states of two chunks, without it the metric can only be computed
+            if the column is passed at once, thus neither for streamed data nor with a pool of workers, by default None
+
+        Raises
+        ------
+        ValueError
+            Raised when the kind is unknown or a merge is given without an update
+        """
+        if kind not in KINDS:
+            raise ValueError(f"Unknown kind of metric {kind}, choose either 'continuous' or 'categorical'!")
+        if merge is not None and update is None:
+            raise ValueError("A metric without an update has no state which could be merged!")
+        self.name     = name
+        self.kind     = kind
+        self.function = function
+        self.requires = tuple(requires or ())
+        self.update   = update
+        self.merge    = merge
+
+
+    @property
+    def mergeable(self) -> bool:
+        """ Whether the metric can be computed from chunks of the column """
+        return self.update is None or self.merge is not None
+
+
+    def compute(self, row: dict[str, Any], state: Any) -> Any:
+        """
+        Computes the value of the metric
+
+        Parameters
+        ----------
+        row : dict[str, Any]
+            Values of the metrics which were computed before, the required metrics included
+        state : Any
+            State which was accumulated by `update`, None if the metric has no state
+
+        Returns
+        -------
+        Any
+            The value of the metric
+        """
+        return self.function(row, state)
+
+
+#################################################################################################
+#                                          Registry                                             #
+#################################################################################################
+
+# custom metrics per kind in the order of their registration
+_REGISTRY: dict[str, dict[str, Metric]] = {kind: {} for kind in KINDS}
+
+
+def register_metric(metric: Metric, replace: bool = False) -> Metric:
+    """
+    Registers a custom metric, from then on it is part of every DQT of its kind unless the
+    metrics of the DQT are selected explicitly. Metrics with a state are accumulated inside of
+    worker processes, thus they have to be registered before a process pool is started
+
+    Parameters
+    ----------
+    metric : Metric
+        The metric
+    replace : bool, optional
+        Whether a custom metric of the same name is replaced, by default False
+
+    Returns
+    -------
+    Metric
+        The registered metric
+
+    Raises
+    ------
+    ValueError
+        Raised when a custom metric of the same name is already registered
+    """
+    if metric.name in _REGISTRY[metric.kind] and not replace:
+        raise ValueError(f"The metric {metric.name} is already registered!")
+    _REGISTRY[metric.kind][metric.name] = metric
+
+    return metric
+
+
+def unregister_metric(kind: str, name: str) -> None:
+    """ Removes a custom metric from the registry, unknown metrics are ignored """
+    _REGISTRY[kind].pop(name, None)
+
+
+def custom_metrics(kind: str) -> dict[str, Metric]:
+    """ The registered custom metrics of a kind, keyed by their names """
+    return dict(_REGISTRY[kind])
+
+
+def resolve(kind: str, names: list[str], builtins: dict[str, tuple[str, ...]]) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Resolves the requested metrics and all metrics they depend on, both in the order of the DQT,
+    the built-in metrics come first and the custom metrics follow in the order of their registration
+
+    Parameters
+    ----------
+    kind : str
+        Either "continuous" or "categorical"
+    names : list[str]
+        Names of the requested metrics, None requests all built-in and custom metrics
+    builtins : dict[str, tuple[str, ...]]
+        The built-in metrics of the accumulator in the order of the DQT, mapped to the parts of the state
+        of the accumulator which they need
+
+    Returns
+    -------
+    tuple[tuple[str, ...], tuple[str, ...]]
+        The names of the reported metrics and the names of the computed metrics
+
+    Raises
+    ------
+    ValueError
+        Raised when a metric or a dependency is unknown
+    """
+    layout = [*builtins, *(name for name in _REGISTRY[kind] if name not in builtins)]
+    if names is None:
+        names = layout
+    unknown = [name for name in names if name not in layout]
+    if unknown:
+        raise ValueError(f"Unknown {kind} metrics {unknown}, choose from {layout}!")
+
+    computed = set()
+    pending  = list(names)
+    while pending:
+        name = pending.pop()
+        if name in computed:
+            continue
+        if name not in layout:
+            raise ValueError(f"Unknown {kind} metric {name} is required by another metric!")
+        computed.add(name)
+        if name not in builtins:
+            pending.extend(_REGISTRY[kind][name].requires)
+
+    return tuple(name for name in layout if name in names), tuple(name for name in layout if name in computed)
+
+
+def parts(computed: tuple[str, ...], builtins: dict[str, tuple[str, ...]]) -> set[str]:
+    """ The parts of the state of an accumulator which are needed by the computed built-in metrics """
+    return {part for name in computed for part in builtins.get(name, ())}
\ No newline at end of file
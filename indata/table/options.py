@@ -0,0 +1,109 @@
+"""
+The options of a DQT bundle how the features are profiled, which metrics are reported, where the
+statistics come from and whether the state of the accumulators is kept, thus `create_table` only
+takes the features and the directory of the DQTs besides them
+"""
+
+import attrs
+
+
+METADATA_MODES   = ("scan", "first", "only")
+QUANTILE_METHODS = (None, "exact", "kll")
+
+
+#################################################################################################
+#                                       TableOptions                                            #
+#################################################################################################
+
+@attrs.define()
+class TableOptions:
+    """
+    Options of `DataQualityTable.create_table`
+
+        options = TableOptions(quantiles = [0.05, 0.5, 0.95], metrics = ["Miss. %", "median", "Mode"], executor = "thread")
+        dqt_cont, dqt_catg = analytics_table.create_table(store_json_dir = "./", options = options)
+    """
+    top_k: int              = attrs.field(default = 2)
+    approximate_modes: bool = attrs.field(factory = bool)
+    mode_capacity: int      = attrs.field(default = 1000)
+    cardinality: str        = attrs.field(default = None)
+    precision: int          = attrs.field(default = 14)
+    quantiles: list[float]  = attrs.field(default = None)
+    quantile_method: str    = attrs.field(default = None)
+    metrics: list[str]      = attrs.field(default = None)
+    metadata: str           = attrs.field(default = "scan")
+    store_state: bool       = attrs.field(factory = bool)
+    executor: str           = attrs.field(default = "serial")
+    workers: int            = attrs.field(default = None)
+
+    def __init__(self, top_k: int = 2, approximate_modes: bool = False, mode_capacity: int = 1000, cardinality: str = None,
+                 precision: int = 14, quantiles: list[float] = None, quantile_method: str = None, metrics: list[str] = None,
+                 metadata: str = "scan", store_state: bool = False, executor: str = "serial", workers: int = None):
+        """
+        Parameters
+        ----------
+        top_k : int, optional
+            Number of modes which are reported for each categorical feature, by default 2
+        approximate_modes : bool, optional
+            If True, modes and cardinality of categorical features are estimated with bounded memory by a Space-Saving
+            and a HyperLogLog sketch, a reported mode frequency overestimates the true one by at most
+            `Count / mode_capacity`, by default False
+        mode_capacity : int, optional
+            Number of counters of the Space-Saving sketch per categorical feature, by default 1000
+        cardinality : str, optional
+            Estimator for 'Card.', either "exact" or "hll" for a HyperLogLog sketch of `2^precision` bytes per feature with a
+            standard error of `1.04 / sqrt(2^precision)`, by default None which computes it exactly unless the data is streamed
+            or `approximate_modes` is True
+        precision : int, optional
+            Precision of the HyperLogLog sketches between 4 and 18, by default 14
+        quantiles : list[float], optional
+            Quantiles of the continuous features which are reported, e.g. `[0.01, 0.05, 0.5, 0.95, 0.99]`, the quartiles
+            are named '1st Qrt.', 'median' and '3rd Qrt.', all others by their percentile like 'P5', by default the quartiles
+        quantile_method : str, optional
+            Either "exact", which retains the values of the continuous features and selects all quantiles in one pass, or
+            "kll" for a KLL sketch of constant memory, by default None which is "kll" if the data is streamed or the state is stored
+            and "exact" otherwise
+        metrics : list[str], optional
+            The metrics which are reported, e.g. `["Count", "Miss. %"]`, a metric belongs to the DQTs which know it, only these
+            metrics and the metrics they depend on are computed, a DQT which knows none of them is neither built nor stored, see
+            `metrics.register_metric` for custom metrics, by default None which reports all built-in and registered metrics
+        metadata : str, optional
+            Only for Parquet files, with "first" the metrics 'Count', 'Miss. %', 'Min' and 'Max' are taken from the statistics
+            of the row groups wherever they are stored and the data is scanned for all others, metrics which are stored for every
+            feature are not computed by the scan, with "only" the DQTs are created from the statistics of the row groups without
+            scanning the data at all and all other metrics are left empty, both cannot be combined with predicates since the
+            statistics describe all rows, by default "scan" which computes every metric from the data
+        store_state : bool, optional
+            If True, the state of the accumulators is stored next to the DQTs, such that the DQTs can be updated
+            by `update_table` with new data only, the quantiles and the cardinality of continuous features are then tracked by KLL and
+            HyperLogLog sketches unless `quantile_method` is "exact", whose state holds every continuous value, by default False
+        executor : str, optional
+            The columns are profiled concurrently by a "thread" or a "process" pool or one after another if
+            `executor` is "serial", numeric columns are handed to worker processes through shared memory,
+            by default "serial"
+        workers : int, optional
+            Number of workers of the pool, by default None which uses the number of CPUs
+
+        Raises
+        ------
+        ValueError
+            Raised when `metadata` or `quantile_method` is unknown or when the state is requested although the data is not scanned
+        """
+        if metadata not in METADATA_MODES:
+            raise ValueError(f"Unknown metadata mode {metadata}, choose either 'scan', 'first' or 'only'!")
+        if store_state and metadata != "scan":
+            raise ValueError("The state of the accumulators can only be stored if the data is scanned!")
+        if quantile_method not in QUANTILE_METHODS:
+            raise ValueError(f"Unknown quantile method {quantile_method}, choose either 'exact' or 'kll'!")
+        self.top_k             = top_k
+        self.approximate_modes = approximate_modes
+        self.mode_capacity     = mode_capacity
+        self.cardinality       = cardinality
+        self.precision         = precision
+        self.quantiles         = quantiles
+        self.quantile_method   = quantile_method
+        self.metrics           = metrics
+        self.metadata          = metadata
+        self.store_state       = store_state
+        self.executor          = executor
+        self.workers           = workers
\ No newline at end of file
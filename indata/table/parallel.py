@@ -0,0 +1,181 @@
+"""
+The statistics of a DQT are independent per column, thus the columns can be profiled
+concurrently. The ColumnExecutor distributes the columns of a dataframe onto a thread pool
+or a process pool, numeric columns are handed to worker processes through shared memory
+instead of being pickled
+"""
+
+import os
+import attrs
+import numpy as np
+import pandas as pd
+
+from abc                import abstractmethod
+from typing             import Any, Callable, Optional
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing    import shared_memory
+
+import indata.table.stats as stats
+
+
+#################################################################################################
+#                                 Interface ColumnExecutor                                      #
+#################################################################################################
+
+class IFColumnExecutor:
+    """
+    Interface for the ColumnExecutor
+
+    Methods
+    -------
+    map()
+        Applies a function on every selected column of a dataframe
+    """
+
+    @abstractmethod
+    def map(self): # pragma: no cover
+        pass
+
+
+#################################################################################################
+#                                      ColumnExecutor                                           #
+#################################################################################################
+
+@attrs.define()
+class ColumnExecutor(IFColumnExecutor):
+    """
+    Applies a function on the columns of a dataframe, either serially, in a thread pool or
+    in a process pool. The pool is created once when the executor is entered as a context manager
+    and reused for every call of `map`
+
+    Methods
+    -------
+    map(function: Callable, dataframe: pd.DataFrame, accumulators: dict[str, IFAccumulator])
+        Applies `function` on every accumulator and its column of the dataframe
+    """
+    kind: str      = attrs.field(factory = str)
+    workers: int   = attrs.field(default = None)
+    _pool: Executor = attrs.field(default = None)
+
+    def __init__(self, kind: str = "serial", workers: int = None):
+        """
+        Parameters
+        ----------
+        kind : str, optional
+            Either "serial", "thread" or "process", by default "serial"
+        workers : int, optional
+            Number of workers of the pool, by default None which uses the number of CPUs
+
+        Raises
+        ------
+        ValueError
+            Raised when the kind of executor is unknown or the number of workers is not positive
+        """
+        if kind not in ("serial", "thread", "process"):
+            raise ValueError(f"Unknown executor {kind}, choose either 'serial', 'thread' or 'process'!")
+        if workers is not None and workers < 1:
+            raise ValueError("The number of workers has to be positive!")
+        self.kind    = kind
+        self.workers = workers or os.cpu_count()
+        self._pool   = None
+
+
+    def __enter__(self) -> "ColumnExecutor":
+        if self.kind == "thread":
+            self._pool = ThreadPoolExecutor(max_workers = self.workers)
+        elif self.kind == "process":
+            self._pool = ProcessPoolExecutor(max_workers = self.workers)
+
+        return self
+
+
+    def __exit__(self, *exc_info) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+    def map(self, function: Callable, dataframe: pd.DataFrame, accumulators: dict[str, stats.IFAccumulator]) -> dict[str, Any]:
+        """
+        Applies `function(accumulator, column)` on every accumulator and the column of the same name,
+        for a process pool, `function` has to be defined on module level, e.g. `stats.profile_column`
+
+        Parameters
+        ----------
+        function : Callable
+            Function which receives an accumulator and a column
+        dataframe : pd.DataFrame
+            Dataframe which contains the columns
+        accumulators : dict[str, IFAccumulator]
+            Accumulators keyed by the name of their column
+
+        Returns
+        -------
+        dict[str, Any]
+            The return values of `function` keyed by the name of the column, in the order of `accumulators`
+        """
+        if self._pool is None:
+            return {feature: function(accumulator, dataframe[feature]) for feature, accumulator in accumulators.items()}
+        if isinstance(self._pool, ThreadPoolExecutor):
+            return _gather(self._pool, {feature: (function, accumulator, dataframe[feature]) for feature, accumulator in accumulators.items()})
+
+        blocks = []
+        try:
+            tasks = {}
+            for feature, accumulator in accumulators.items():
+                shared = _share(dataframe[feature])
+                if shared is None:
+                    tasks[feature] = (function, accumulator, dataframe[feature])
+                    continue
+                blocks.append(shared[0])
+                tasks[feature] = (_attach, function, accumulator, shared[1])
+            return _gather(self._pool, tasks)
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+
+#################################################################################################
+#                                         Helpers                                               #
+#################################################################################################
+
+def _gather(pool: Executor, tasks: dict[str, tuple]) -> dict[str, Any]:
+    """ Submits all tasks to the pool and collects the results in the order of the tasks """
+    futures = {feature: pool.submit(*task) for feature, task in tasks.items()}
+
+    return {feature: future.result() for feature, future in futures.items()}
+
+
+def _share(column: pd.Series) -> Optional[tuple[shared_memory.SharedMemory, tuple]]:
+    """
+    Copies a numeric column into a shared memory block, returns None if the
+    column holds Python objects which cannot be shared
+
+    Returns
+    -------
+    Optional[tuple[shared_memory.SharedMemory, tuple]]
+        The shared memory block and the description of the column which is needed to attach to it
+    """
+    values = column.to_numpy()
+    if values.dtype.hasobject:
+        return None
+    block = shared_memory.SharedMemory(create = True, size = max(1, values.nbytes))
+    np.ndarray(values.shape, dtype = values.dtype, buffer = block.buf)[:] = values
+
+    return block, (block.name, values.dtype.str, len(values), column.name)
+
+
+def _attach(function: Callable, accumulator: stats.IFAccumulator, description: tuple) -> Any:
+    """ Runs inside of a worker process, it attaches to the shared memory block of a column and applies `function` on it """
+    name, dtype, length, column_name = description
+    block = shared_memory.SharedMemory(name = name)
+    try:
+        values = np.ndarray((length,), dtype = np.dtype(dtype), buffer = block.buf)
+        result = function(accumulator, pd.Series(values, name = column_name, copy = False))
+        # the block can only be closed once no view on it is left
+        del values
+    finally:
+        block.close()
+
+    return result
\ No newline at end of file
@@ -0,0 +1,772 @@
+"""
+Accumulators collect all statistics of a DQT in a single pass over the data. The state
+of an accumulator can be merged with the state of another accumulator, thus a DQT can be
+built from a chunked or a parallel read of the data
+"""
+
+import attrs
+import base64
+import numpy as np
+import pandas as pd
+
+from abc    import abstractmethod
+from typing import Any, Iterable
+
+import indata.utils.sketch   as sketch
+import indata.utils.quantile as quantile
+import indata.table.metrics  as registry
+
+
+# parts of the state of an accumulator which the built-in metrics need, the quantiles need the part "distribution"
+CONTINUOUS_METRICS  = {'Count': (), 'Miss. %': (), 'Card.': ("cardinality",), 'Min': ("extrema",), 'mean': ("moments",),
+                       'Max': ("extrema",), 'Std. Dev.': ("moments",)}
+CATEGORICAL_METRICS = {'Count': (), 'Miss. %': (), 'Card.': ("cardinality",)}
+
+
+#################################################################################################
+#                                    Interface Accumulator                                      #
+#################################################################################################
+
+class IFAccumulator:
+    """
+    Interface for accumulators
+    An accumulator is updated with chunks of a single column and returns
+    the row of the DQT which belongs to this column
+
+    Methods
+    -------
+    update()
+        Adds a chunk of a column to the accumulator
+    merge()
+        Merges the state of another accumulator into this one
+    result() dict[str, Any]
+        Returns the statistics of the column
+    spawn() IFAccumulator
+        Returns an empty accumulator with the same configuration
+    to_dict() dict[str, Any]
+        Serializes the state of the accumulator into a json compatible dictionary
+    """
+
+    @abstractmethod
+    def update(self): # pragma: no cover
+        pass
+
+
+    @abstractmethod
+    def spawn(self) -> "IFAccumulator": # pragma: no cover
+        pass
+
+
+    @abstractmethod
+    def merge(self): # pragma: no cover
+        pass
+
+
+    @abstractmethod
+    def result(self) -> dict[str, Any]: # pragma: no cover
+        pass
+
+
+    @abstractmethod
+    def to_dict(self) -> dict[str, Any]: # pragma: no cover
+        pass
+
+
+#################################################################################################
+#                                   ContinuousAccumulator                                       #
+#################################################################################################
+
+@attrs.define()
+class ContinuousAccumulator(IFAccumulator):
+    """
+    Accumulates the statistics of a continuous feature, mean and variance are
+    accumulated with Welford's algorithm and merged with the formula of Chan et al.
+
+    In exact mode, the non-missing values are retained such that quantiles and the
+    cardinality are exact, otherwise they are estimated with a KLL and a HyperLogLog sketch
+    which need a constant amount of memory. The cardinality estimator can also be chosen
+    independently of the mode. All requested quantiles are computed from a single selection
+    pass over the values or a single sort of the sketch
+
+    Only the parts of the state which are needed by the requested metrics are accumulated,
+    see `metrics.resolve`, custom metrics keep their own states in `custom`
+
+    Methods
+    -------
+    update(values: pd.Series)
+        Adds a chunk of the column to the accumulator
+    spawn()
+        Returns an empty accumulator with the same configuration
+    merge(other: ContinuousAccumulator)
+        Merges another accumulator into this one
+    result()
+        Returns the statistics in the layout of the continuous DQT
+    to_dict()
+        Serializes the state of the accumulator, it is restored by `accumulator_from_dict`
+    """
+    exact: bool                    = attrs.field(factory = bool)
+    count: int                     = attrs.field(factory = int)
+    missing: int                   = attrs.field(factory = int)
+    minimum: Any                   = attrs.field(default = None)
+    maximum: Any                   = attrs.field(default = None)
+    mean: float                    = attrs.field(factory = float)
+    m2: float                      = attrs.field(factory = float)
+    values: list[np.ndarray]       = attrs.field(factory = list)
+    quantiles: sketch.IFSketch     = attrs.field(default = None)
+    method: str                    = attrs.field(default = None)
+    precision: int                 = attrs.field(factory = int)
+    cardinality: sketch.IFSketch   = attrs.field(default = None)
+    probabilities: tuple[float]    = attrs.field(default = quantile.DEFAULT_QUANTILES)
+    metrics: tuple[str]            = attrs.field(factory = tuple)
+    computed: tuple[str]           = attrs.field(factory = tuple)
+    parts: set[str]                = attrs.field(factory = set)
+    custom: dict[str, Any]         = attrs.field(factory = dict)
+
+    def __init__(self, exact: bool = False, cardinality: str = None, precision: int = 14,
+                 probabilities: tuple[float] = quantile.DEFAULT_QUANTILES, metrics: list[str] = None):
+        """
+        Parameters
+        ----------
+        exact : bool, optional
+            If `exact` is True, quantiles and cardinality are computed exactly by retaining the values,
+            otherwise they are approximated by sketches, by default False
+        cardinality : str, optional
+            Estimator of the cardinality, either "exact" or "hll", by default None which
+            means "exact" in exact mode and "hll" otherwise
+        precision : int, optional
+            Precision of the HyperLogLog sketch, by default 14
+        probabilities : tuple[float], optional
+            The quantiles which are reported, by default the quartiles
+        metrics : list[str], optional
+            The metrics which are reported, by default None which reports all built-in and registered metrics
+        """
+        self.probabilities = quantile.check_quantiles(probabilities)
+        self.metrics, self.computed = registry.resolve("continuous", metrics, self.builtins)
+        self.parts         = registry.parts(self.computed, self.builtins)
+        self.exact         = exact
+        self.count         = 0
+        self.missing       = 0
+        self.minimum       = None
+        self.maximum       = None
+        self.mean          = 0.0
+        self.m2            = 0.0
+        self.values        = []
+        self.quantiles     = sketch.QuantileSketch() if not exact and "distribution" in self.parts else None
+        self.method        = cardinality or ("exact" if exact else "hll")
+        self.precision     = precision
+        # in exact mode, the exact cardinality is derived from the retained values
+        self.cardinality   = None
+        if "cardinality" in self.parts and not self.__derived_cardinality:
+            self.cardinality = sketch.cardinality_estimator(self.method, precision)
+        self.custom        = {}
+
+
+    @property
+    def builtins(self) -> dict[str, tuple[str, ...]]:
+        """ The built-in metrics in the order of the DQT mapped to the parts of the state which they need """
+        names  = [quantile.quantile_name(q) for q in self.probabilities]
+        lower  = len([q for q in self.probabilities if q < 0.5])
+        layout = ['Count', 'Miss. %', 'Card.', 'Min', *names[:lower], 'mean', *names[lower:], 'Max', 'Std. Dev.']
+
+        return {name: CONTINUOUS_METRICS.get(name, ("distribution",)) for name in layout}
+
+
+    @property
+    def __derived_cardinality(self) -> bool:
+        """ Whether the exact cardinality is derived from the retained values """
+        return self.exact and self.method == "exact"
+
+
+    @property
+    def __retains_values(self) -> bool:
+        """ Whether the values are retained, either for the exact quantiles or the exact cardinality """
+        return self.exact and ("distribution" in self.parts or ("cardinality" in self.parts and self.__derived_cardinality))
+
+
+    def update(self, values: pd.Series) -> None:
+        """
+        Adds a chunk of the column to the accumulator
+
+        Parameters
+        ----------
+        values : pd.Series
+            A chunk of the continuous feature
+        """
+        present = values.dropna()
+        if present.dtype == object:
+            present = pd.to_numeric(present)
+        present = present.to_numpy()
+
+        other         = self.spawn()
+        other.missing = len(values) - len(present)
+        if len(present) > 0:
+            other.count = len(present)
+            if "extrema" in self.parts:
+                other.minimum = present.min()
+                other.maximum = present.max()
+            if "moments" in self.parts:
+                other.mean = float(np.mean(present))
+                other.m2   = float(np.sum((present - other.mean) ** 2))
+            if self.__retains_values:
+                other.values.append(present)
+            if other.quantiles is not None:
+                other.quantiles.update(present)
+            if other.cardinality is not None:
+                # chunks of the same column might be parsed as integers or as floats
+                other.cardinality.update(present.astype(np.float64))
+        self.merge(other)
+        _update_custom(self, "continuous", values)
+
+
+    def spawn(self) -> "ContinuousAccumulator":
+        """ Returns an empty accumulator with the same configuration """
+        return ContinuousAccumulator(exact = self.exact, cardinality = self.method, precision = self.precision, probabilities = self.probabilities,
+                                     metrics = self.metrics)
+
+
+    def merge(self, other: "ContinuousAccumulator") -> "ContinuousAccumulator":
+        """
+        Merges another accumulator into this one
+
+        Parameters
+        ----------
+        other : ContinuousAccumulator
+            Accumulator which has seen another part of the column
+
+        Returns
+        -------
+        ContinuousAccumulator
+            The accumulator itself, such that merges can be chained
+        """
+        if other.exact != self.exact or other.method != self.method or other.probabilities != self.probabilities or other.metrics != self.metrics:
+            raise ValueError("Accumulators with different modes, cardinality estimators, quantiles or metrics cannot be merged!")
+
+        count = self.count + other.count
+        if count > 0:
+            delta     = other.mean - self.mean
+            self.mean = self.mean + delta * other.count / count
+            self.m2   = self.m2 + other.m2 + delta ** 2 * self.count * other.count / count
+        self.minimum  = _reduce(min, self.minimum, other.minimum)
+        self.maximum  = _reduce(max, self.maximum, other.maximum)
+        self.count    = count
+        self.missing += other.missing
+        self.values.extend(other.values)
+        if self.quantiles is not None:
+            self.quantiles.merge(other.quantiles)
+        if self.cardinality is not None:
+            self.cardinality.merge(other.cardinality)
+        _merge_custom(self, "continuous", other)
+
+        return self
+
+
+    def result(self) -> dict[str, Any]:
+        """
+        Returns the statistics in the layout of the continuous DQT
+
+        Returns
+        -------
+        dict[str, Any]
+            Maps the name of the DQT column to its value
+        """
+        number_of_rows = self.count + self.missing
+        names          = set(self.computed)
+        quantiles      = [q for q in self.probabilities if quantile.quantile_name(q) in names]
+        values         = np.concatenate(self.values) if self.values else np.empty(0)
+        if self.__derived_cardinality and "Card." in names:
+            # the exact cardinality needs the sorted values anyway, then the quantiles are read off directly
+            values = np.sort(values)
+        if self.exact:
+            quantiles = quantile.exact_quantiles(values, quantiles, presorted = self.__derived_cardinality and "Card." in names)
+        elif quantiles:
+            quantiles = self.quantiles.quantiles(quantiles)
+
+        row = {'Count': self.count,
+               'Miss. %': self.missing * 100 / number_of_rows if number_of_rows > 0 else np.nan,
+               'Min': self.minimum if self.minimum is not None else np.nan,
+               'mean': self.mean if self.count > 0 else np.nan,
+               'Max': self.maximum if self.maximum is not None else np.nan,
+               'Std. Dev.': np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan}
+        if "Card." in names:
+            row['Card.'] = self.cardinality.estimate() if self.cardinality is not None else (int(np.count_nonzero(np.diff(values)) + 1) if len(values) > 0 else 0)
+        row.update(zip([quantile.quantile_name(q) for q in self.probabilities if quantile.quantile_name(q) in names], quantiles))
+
+        return _custom_result(self, "continuous", row)
+
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serializes the state of the accumulator into a json compatible dictionary, in exact mode
+        the retained values are part of the state, thus its size grows with the number of rows. The
+        states of custom metrics have to be json compatible themselves
+
+        Returns
+        -------
+        dict[str, Any]
+            The state of the accumulator
+        """
+        values = np.concatenate(self.values) if self.values else np.empty(0)
+
+        return {'kind': "continuous", 'exact': self.exact, 'method': self.method, 'precision': self.precision,
+                'probabilities': list(self.probabilities), 'metrics': list(self.metrics), 'custom': self.custom,
+                'count': self.count, 'missing': self.missing, 'minimum': _to_python(self.minimum),
+                'maximum': _to_python(self.maximum), 'mean': self.mean, 'm2': self.m2, 'dtype': values.dtype.str,
+                'values': base64.b64encode(values.tobytes()).decode("ascii"),
+                'quantiles': self.quantiles.to_dict() if self.quantiles is not None else None,
+                'cardinality': self.cardinality.to_dict() if self.cardinality is not None else None}
+
+
+    @staticmethod
+    def from_dict(state: dict[str, Any]) -> "ContinuousAccumulator":
+        """
+        Restores an accumulator which was serialized by `to_dict`
+
+        Parameters
+        ----------
+        state : dict[str, Any]
+            The state of the accumulator
+
+        Returns
+        -------
+        ContinuousAccumulator
+            The restored accumulator
+        """
+        accumulator         = ContinuousAccumulator(exact = state['exact'], cardinality = state['method'], precision = state['precision'],
+                                                    probabilities = state['probabilities'], metrics = state['metrics'])
+        accumulator.count   = state['count']
+        accumulator.missing = state['missing']
+        accumulator.minimum = state['minimum']
+        accumulator.maximum = state['maximum']
+        accumulator.mean    = state['mean']
+        accumulator.m2      = state['m2']
+        accumulator.custom  = state['custom']
+        values              = np.frombuffer(base64.b64decode(state['values']), dtype = np.dtype(state['dtype'])).copy()
+        accumulator.values  = [values] if len(values) > 0 else []
+        if state['quantiles'] is not None:
+            accumulator.quantiles = sketch.QuantileSketch.from_dict(state['quantiles'])
+        if state['cardinality'] is not None:
+            accumulator.cardinality = sketch.cardinality_from_dict(state['cardinality'])
+
+        return accumulator
+
+
+#################################################################################################
+#                                  CategoricalAccumulator                                       #
+#################################################################################################
+
+@attrs.define()
+class CategoricalAccumulator(IFAccumulator):
+    """
+    Accumulates the statistics of a categorical feature, the frequencies of all
+    categories are counted once per chunk and merged across chunks. Modes, their
+    frequencies and the cardinality are all derived from these frequencies
+
+    In approximate mode, the frequencies are tracked by a Space-Saving sketch with `capacity`
+    counters and the cardinality by a HyperLogLog sketch, thus the memory does not depend on
+    the number of categories. A reported mode frequency then overestimates the true one by
+    at most `Count / capacity`. The cardinality estimator can also be chosen independently of the mode
+
+    Only the parts of the state which are needed by the requested metrics are accumulated,
+    see `metrics.resolve`, custom metrics keep their own states in `custom`
+
+    Methods
+    -------
+    update(values: pd.Series)
+        Adds a chunk of the column to the accumulator
+    spawn()
+        Returns an empty accumulator with the same configuration
+    merge(other: CategoricalAccumulator)
+        Merges another accumulator into this one
+    result()
+        Returns the statistics in the layout of the categorical DQT
+    to_dict()
+        Serializes the state of the accumulator, it is restored by `accumulator_from_dict`
+    """
+    top_k: int                   = attrs.field(factory = int)
+    approximate: bool            = attrs.field(factory = bool)
+    capacity: int                = attrs.field(factory = int)
+    count: int                   = attrs.field(factory = int)
+    missing: int                 = attrs.field(factory = int)
+    frequencies: pd.Series       = attrs.field(factory = pd.Series)
+    modes: sketch.SpaceSaving    = attrs.field(default = None)
+    method: str                  = attrs.field(default = None)
+    precision: int               = attrs.field(factory = int)
+    cardinality: sketch.IFSketch = attrs.field(default = None)
+    metrics: tuple[str]          = attrs.field(factory = tuple)
+    computed: tuple[str]         = attrs.field(factory = tuple)
+    parts: set[str]              = attrs.field(factory = set)
+    custom: dict[str, Any]       = attrs.field(factory = dict)
+
+    def __init__(self, top_k: int = 2, approximate: bool = False, capacity: int = 1000, cardinality: str = None, precision: int = 14,
+                 metrics: list[str] = None):
+        """
+        Parameters
+        ----------
+        top_k : int, optional
+            Number of modes which are reported, by default 2
+        approximate : bool, optional
+            If `approximate` is True, modes and cardinality are estimated by sketches, by default False
+        capacity : int, optional
+            Number of counters of the Space-Saving sketch in approximate mode, by default 1000
+        cardinality : str, optional
+            Estimator of the cardinality, either "exact" or "hll", by default None which means
+            "hll" in approximate mode, otherwise the cardinality is derived from the exact frequencies
+        precision : int, optional
+            Precision of the HyperLogLog sketch, by default 14
+        metrics : list[str], optional
+            The metrics which are reported, by default None which reports all built-in and registered metrics
+        """
+        if top_k < 1:
+            raise ValueError("At least one mode has to be reported!")
+        self.top_k       = top_k
+        self.method      = cardinality or ("hll" if approximate else None)
+        self.metrics, self.computed = registry.resolve("categorical", metrics, self.builtins)
+        self.parts       = registry.parts(self.computed, self.builtins)
+        self.approximate = approximate
+        self.count       = 0
+        self.missing     = 0
+        self.frequencies = pd.Series(dtype = np.int64)
+        self.capacity    = capacity
+        self.modes       = sketch.SpaceSaving(capacity = max(capacity, top_k)) if approximate and "frequencies" in self.parts else None
+        self.precision   = precision
+        self.cardinality = sketch.cardinality_estimator(self.method, precision) if self.method and "cardinality" in self.parts else None
+        self.custom      = {}
+
+
+    @property
+    def builtins(self) -> dict[str, tuple[str, ...]]:
+        """ The built-in metrics in the order of the DQT mapped to the parts of the state which they need """
+        builtins = dict(CATEGORICAL_METRICS)
+        if self.method is None:
+            # the cardinality is derived from the exact frequencies
+            builtins['Card.'] = ("frequencies",)
+        for rank in range(1, self.top_k + 1):
+            name = mode_name(rank)
+            builtins.update({name: ("frequencies",), f"{name} Freq.": ("frequencies",), f"{name} Freq. %": ("frequencies",)})
+
+        return builtins
+
+
+    def update(self, values: pd.Series) -> None:
+        """
+        Adds a chunk of the column to the accumulator
+
+        Parameters
+        ----------
+        values : pd.Series
+            A chunk of the categorical feature
+        """
+        present       = values.dropna()
+        self.count   += len(present)
+        self.missing += len(values) - len(present)
+        if self.cardinality is not None:
+            self.cardinality.update(present)
+        if self.modes is not None:
+            self.modes.update(present)
+        elif "frequencies" in self.parts:
+            self.__merge_frequencies(sketch.value_counts(present))
+        _update_custom(self, "categorical", values)
+
+
+    def spawn(self) -> "CategoricalAccumulator":
+        """ Returns an empty accumulator with the same configuration """
+        return CategoricalAccumulator(top_k = self.top_k, approximate = self.approximate, capacity = self.capacity,
+                                      cardinality = self.method, precision = self.precision, metrics = self.metrics)
+
+
+    def merge(self, other: "CategoricalAccumulator") -> "CategoricalAccumulator":
+        """
+        Merges another accumulator into this one, categories keep the order of their
+        first appearance
+
+        Parameters
+        ----------
+        other : CategoricalAccumulator
+            Accumulator which has seen another part of the column
+
+        Returns
+        -------
+        CategoricalAccumulator
+            The accumulator itself, such that merges can be chained
+        """
+        if other.approximate != self.approximate or other.method != self.method or other.metrics != self.metrics:
+            raise ValueError("Accumulators with different modes, cardinality estimators or metrics cannot be merged!")
+
+        if self.cardinality is not None:
+            self.cardinality.merge(other.cardinality)
+        if self.modes is not None:
+            self.modes.merge(other.modes)
+        else:
+            self.__merge_frequencies(other.frequencies)
+        self.count   += other.count
+        self.missing += other.missing
+        _merge_custom(self, "categorical", other)
+
+        return self
+
+
+    def __merge_frequencies(self, frequencies: pd.Series) -> None:
+        """ Adds `frequencies` to the frequencies of the accumulator """
+        if len(self.frequencies) == 0:
+            self.frequencies = frequencies
+        elif len(frequencies) > 0:
+            self.frequencies = pd.concat([self.frequencies, frequencies]).groupby(level = 0, sort = False).sum()
+
+
+    def result(self) -> dict[str, Any]:
+        """
+        Returns the statistics in the layout of the categorical DQT, if a feature has
+        less than `top_k` categories, the missing modes are reported as None with a frequency of 0
+
+        Returns
+        -------
+        dict[str, Any]
+            Maps the name of the DQT column to its value
+        """
+        if self.modes is not None:
+            frequencies = self.modes.top(self.top_k)
+        else:
+            frequencies = self.frequencies.nlargest(self.top_k, keep = "first")
+        cardinality = self.cardinality.estimate() if self.cardinality is not None else len(self.frequencies)
+        number_of_rows = self.count + self.missing
+        modes          = frequencies.index.to_list() + [None] * (self.top_k - len(frequencies))
+        counts         = frequencies.to_list() + [0] * (self.top_k - len(frequencies))
+
+        result = {'Count': self.count,
+                  'Miss. %': self.missing * 100 / number_of_rows if number_of_rows > 0 else np.nan,
+                  'Card.': cardinality}
+        for rank, (mode, count) in enumerate(zip(modes, counts), start = 1):
+            name                      = mode_name(rank)
+            result[name]              = mode
+            result[f"{name} Freq."]   = count
+            result[f"{name} Freq. %"] = count * 100 / self.count if self.count > 0 else np.nan
+
+        return _custom_result(self, "categorical", result)
+
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serializes the state of the accumulator into a json compatible dictionary, the categories
+        and the states of custom metrics have to be json compatible themselves, e.g. strings or numbers
+
+        Returns
+        -------
+        dict[str, Any]
+            The state of the accumulator
+        """
+        return {'kind': "categorical", 'top_k': self.top_k, 'approximate': self.approximate, 'capacity': self.capacity,
+                'method': self.method, 'precision': self.precision, 'metrics': list(self.metrics), 'custom': self.custom,
+                'count': self.count, 'missing': self.missing,
+                'categories': self.frequencies.index.tolist(), 'frequencies': self.frequencies.tolist(),
+                'modes': self.modes.to_dict() if self.modes is not None else None,
+                'cardinality': self.cardinality.to_dict() if self.cardinality is not None else None}
+
+
+    @staticmethod
+    def from_dict(state: dict[str, Any]) -> "CategoricalAccumulator":
+        """
+        Restores an accumulator which was serialized by `to_dict`
+
+        Parameters
+        ----------
+        state : dict[str, Any]
+            The state of the accumulator
+
+        Returns
+        -------
+        CategoricalAccumulator
+            The restored accumulator
+        """
+        accumulator             = CategoricalAccumulator(top_k = state['top_k'], approximate = state['approximate'], capacity = state['capacity'],
+                                                         cardinality = state['method'], precision = state['precision'], metrics = state['metrics'])
+        accumulator.count       = state['count']
+        accumulator.missing     = state['missing']
+        accumulator.custom      = state['custom']
+        accumulator.frequencies = pd.Series(state['frequencies'], index = pd.Index(state['categories'], dtype = object), dtype = np.int64)
+        if state['modes'] is not None:
+            accumulator.modes = sketch.SpaceSaving.from_dict(state['modes'])
+        if state['cardinality'] is not None:
+            accumulator.cardinality = sketch.cardinality_from_dict(state['cardinality'])
+
+        return accumulator
+
+
+def accumulator_from_dict(state: dict[str, Any]) -> IFAccumulator:
+    """
+    Restores an accumulator which was serialized by its `to_dict` method
+
+    Parameters
+    ----------
+    state : dict[str, Any]
+        The state of the accumulator
+
+    Returns
+    -------
+    IFAccumulator
+        The restored accumulator
+    """
+    if state['kind'] == "continuous":
+        return ContinuousAccumulator.from_dict(state)
+
+    return CategoricalAccumulator.from_dict(state)
+
+
+def mode_name(rank: int) -> str:
+    """
+    Name of the DQT column which holds the mode of the given rank,
+    e.g. 'Mode', '2nd Mode', '3rd Mode', '4th Mode'
+
+    Parameters
+    ----------
+    rank : int
+        Rank of the mode, starting at 1
+
+    Returns
+    -------
+    str
+        The column name
+    """
+    if rank == 1:
+        return "Mode"
+    suffix = "th" if 10 <= rank % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(rank % 10, "th")
+
+    return f"{rank}{suffix} Mode"
+
+
+#################################################################################################
+#                                       Profiling                                               #
+#################################################################################################
+
+def profile_column(accumulator: IFAccumulator, column: pd.Series) -> dict[str, Any]:
+    """ Updates the accumulator with the whole column and returns its row of the DQT """
+    accumulator.update(column)
+
+    return accumulator.result()
+
+
+def update_column(accumulator: IFAccumulator, column: pd.Series) -> IFAccumulator:
+    """ Updates the accumulator with `column` and returns it, a worker process returns its updated copy """
+    accumulator.update(column)
+
+    return accumulator
+
+
+def accumulate(chunks: Iterable[pd.DataFrame], *accumulators: dict[str, IFAccumulator], executor: Any = None) -> None:
+    """
+    Folds a stream of dataframes into the accumulators in a single pass
+
+    Parameters
+    ----------
+    chunks : Iterable[pd.DataFrame]
+        Stream of dataframes, e.g. from `DataLoader.read_csv_chunks`
+    *accumulators : dict[str, IFAccumulator]
+        Groups of accumulators keyed by the name of their feature, e.g. one group for the
+        continuous and one for the categorical features
+    executor : parallel.ColumnExecutor, optional
+        If given, the columns of every chunk are accumulated concurrently by the executor into empty accumulators
+        which are merged afterwards, thus only empty accumulators are sent to the workers, by default None
+    """
+    for chunk in chunks:
+        for group in accumulators:
+            if executor is None:
+                for feature, accumulator in group.items():
+                    accumulator.update(chunk[feature])
+                continue
+            partials = {feature: accumulator.spawn() for feature, accumulator in group.items()}
+            for feature, partial in executor.map(update_column, chunk, partials).items():
+                group[feature].merge(partial)
+
+
+def to_table(accumulators: dict[str, IFAccumulator]) -> pd.DataFrame:
+    """
+    Turns accumulators into a DQT, one row per feature
+
+    Parameters
+    ----------
+    accumulators : dict[str, IFAccumulator]
+        Accumulators keyed by the name of the feature
+
+    Returns
+    -------
+    pd.DataFrame
+        The DQT
+    """
+    return rows_to_table({feature: accumulator.result() for feature, accumulator in accumulators.items()})
+
+
+def rows_to_table(rows: dict[str, dict[str, Any]]) -> pd.DataFrame:
+    """
+    Turns the results of accumulators into a DQT, one row per feature
+
+    Parameters
+    ----------
+    rows : dict[str, dict[str, Any]]
+        Results of the accumulators keyed by the name of the feature
+
+    Returns
+    -------
+    pd.DataFrame
+        The DQT
+    """
+    return pd.DataFrame(data = list(rows.values()), index = list(rows.keys()))
+
+
+def _update_custom(accumulator: IFAccumulator, kind: str, values: pd.Series) -> None:
+    """ Folds a chunk of the column into the states of the computed custom metrics of the accumulator """
+    metrics = registry.custom_metrics(kind)
+    for name in accumulator.computed:
+        if name in metrics and metrics[name].update is not None:
+            _fold_custom(accumulator, metrics[name], metrics[name].update(values))
+
+
+def _merge_custom(accumulator: IFAccumulator, kind: str, other: IFAccumulator) -> None:
+    """ Merges the states of the custom metrics of another accumulator into the accumulator """
+    metrics = registry.custom_metrics(kind)
+    for name, state in other.custom.items():
+        _fold_custom(accumulator, metrics[name], state)
+
+
+def _fold_custom(accumulator: IFAccumulator, metric: registry.Metric, state: Any) -> None:
+    """ Merges a state into the state of a custom metric, a metric without a merge can only be folded once """
+    if metric.name not in accumulator.custom:
+        accumulator.custom[metric.name] = state
+        return
+    if not metric.mergeable:
+        raise ValueError(f"The metric {metric.name} cannot be merged, thus it cannot be computed from chunks of a column!")
+
+    accumulator.custom[metric.name] = metric.merge(accumulator.custom[metric.name], state)
+
+
+def _custom_result(accumulator: IFAccumulator, kind: str, row: dict[str, Any]) -> dict[str, Any]:
+    """ Computes the custom metrics after their dependencies and returns the reported metrics of the row """
+    metrics = registry.custom_metrics(kind)
+
+    def compute(name: str) -> None:
+        if name in row:
+            return
+        for dependency in metrics[name].requires:
+            compute(dependency)
+        row[name] = metrics[name].compute(row, accumulator.custom.get(name))
+
+    for name in accumulator.computed:
+        compute(name)
+
+    return {name: row[name] for name in accumulator.metrics}
+
+
+def _to_python(value: Any) -> Any:
+    """ Converts a numpy scalar into the equivalent Python scalar, such that it is json compatible """
+    if isinstance(value, np.generic):
+        return value.item()
+
+    return value
+
+
+def _reduce(function, first: Any, second: Any) -> Any:
+    """ Applies `function` on both arguments while ignoring arguments which are None """
+    if first is None:
+        return second
+    if second is None:
+        return first
+
+    return function(first, second)
\ No newline at end of file
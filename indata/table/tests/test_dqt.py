@@ -2,15 +2,22 @@
 
 import os
 import sys
+import json
 import pytest
 import unittest
+import tempfile
 import pandas as pd
-from io import StringIO
+from io            import StringIO
+from unittest.mock import patch
 
 
 import indata.exception.base as exception
 import indata.dataio.load as load
+import indata.dataio.schema as schema
+import indata.dataio.predicate as predicate
 import indata.table.dqt as dqt
+import indata.table.options as options
+import indata.table.stats as stats
 
 
 class TestDQT(unittest.TestCase):
@@ -67,6 +74,29 @@ class TestDQT(unittest.TestCase):
                                             "price: <class 'numpy.int64'>\n"
 
 
+    def test_dqt_printing_s02(self):
+        """ Test whether the DQTs are printed when the data is streamed or the state is stored """
+
+        """ PREPARATION """
+        features = {'continuous_features': ["m2", "price"], 'categorical_features': ["city"], 'store_json_dir': f"{self.path_to_this_mod}"}
+
+        """ EXECUTION """
+        capture_output = StringIO()
+        sys.stdout     = capture_output
+        dqt.DataQualityTable(dataloader = self.dataloader, chunksize = 2).create_table(**features)
+        streamed_output = capture_output.getvalue()
+        with tempfile.TemporaryDirectory() as directory:
+            dqt.DataQualityTable(dataloader = self.dataloader).create_table(**{**features, 'store_json_dir': directory},
+                                                                          options = options.TableOptions(store_state = True))
+        stored_output = capture_output.getvalue()[len(streamed_output):]
+        sys.stdout    = sys.__stdout__
+
+        """ VERIFICATION """
+        for output in (streamed_output, stored_output):
+            assert "The DQT for the continuous features is:" in output
+            assert "The DQT for the categorical features is:" in output
+
+
     def test_dqt_generation_s01(self):
         """ Test with a dummy test file if the dqt table is correct and valid """
 
@@ -121,6 +151,356 @@ class TestDQT(unittest.TestCase):
         pd.testing.assert_frame_equal(act_dqt_catg, exp_dqt_catg)
 
 
+    def test_dqt_generation_s03(self):
+        """ Test whether a DQT built from streamed chunks equals the DQT built from the whole dataframe """
+
+        """ PREPARATION """
+        data_quality_table  = dqt.DataQualityTable(dataloader = self.dataloader_two)
+        streamed_dqt_table  = dqt.DataQualityTable(dataloader = self.dataloader_two, chunksize = 2)
+        continuous_features = ["m2", "number_of_rooms", "price"]
+
+        """ EXECUTION """
+        act_dqt_cont, act_dqt_catg = streamed_dqt_table.create_table(continuous_features = continuous_features,
+                                                                     categorical_features = ["city"],
+                                                                     store_json_dir = f"{self.path_to_this_mod}")
+
+        """ VERIFICATION """
+        exp_dqt_cont, exp_dqt_catg = data_quality_table.create_table(continuous_features = continuous_features,
+                                                                     categorical_features = ["city"],
+                                                                     store_json_dir = f"{self.path_to_this_mod}")
+
+        # chunks without missing values are parsed as integers, thus only the values are compared
+        assert streamed_dqt_table.dataframe is None
+        pd.testing.assert_frame_equal(act_dqt_cont, exp_dqt_cont, check_dtype = False)
+        pd.testing.assert_frame_equal(act_dqt_catg, exp_dqt_catg)
+
+
+    def test_dqt_generation_s04(self):
+        """ Test whether more than two modes are reported when requested """
+
+        """ PREPARATION """
+        data_quality_table = dqt.DataQualityTable(dataloader = self.dataloader)
+
+        """ EXECUTION """
+        _, act_dqt_catg = data_quality_table.create_table(continuous_features = [], categorical_features = ["city"],
+                                                          store_json_dir = f"{self.path_to_this_mod}",
+                                                          options = options.TableOptions(top_k = 4))
+
+        """ VERIFICATION """
+        exp_dqt_catg = pd.DataFrame({'Count': [4], 'Miss. %': [0.0], 'Card.': [3],
+                                     'Mode': ["Chicago"], 'Mode Freq.': [2], 'Mode Freq. %': [50.0],
+                                     '2nd Mode': ["Springfield"], '2nd Mode Freq.': [1], '2nd Mode Freq. %': [25.0],
+                                     '3rd Mode': ["New York"], '3rd Mode Freq.': [1], '3rd Mode Freq. %': [25.0],
+                                     '4th Mode': [None], '4th Mode Freq.': [0], '4th Mode Freq. %': [0.0]},
+                                     index = ["city"])
+
+        pd.testing.assert_frame_equal(act_dqt_catg, exp_dqt_catg)
+
+
+    def test_dqt_generation_s05(self):
+        """ Test whether the cardinality can be estimated by HyperLogLog sketches """
+
+        """ PREPARATION """
+        data_quality_table = dqt.DataQualityTable(dataloader = self.dataloader_two)
+
+        """ EXECUTION """
+        act_dqt_cont, act_dqt_catg = data_quality_table.create_table(continuous_features = ["m2", "number_of_rooms", "price"],
+                                                                     categorical_features = ["city", "district"],
+                                                                     store_json_dir = f"{self.path_to_this_mod}",
+                                                                     options = options.TableOptions(cardinality = "hll", precision = 12))
+
+        """ VERIFICATION """
+        assert act_dqt_cont["Card."].to_list() == [6, 4, 5]
+        assert act_dqt_catg["Card."].to_list() == [3, 5]
+
+
+    def test_dqt_generation_s06(self):
+        """ Test whether profiling the columns in a process pool yields the same DQTs """
+
+        """ PREPARATION """
+        data_quality_table = dqt.DataQualityTable(dataloader = self.dataloader_two)
+        features           = {'continuous_features': ["m2", "number_of_rooms", "price"], 'categorical_features': ["city", "district"],
+                              'store_json_dir': f"{self.path_to_this_mod}"}
+
+        """ EXECUTION """
+        act_dqt_cont, act_dqt_catg = data_quality_table.create_table(**features, options = options.TableOptions(executor = "process", workers = 2))
+
+        """ VERIFICATION """
+        exp_dqt_cont, exp_dqt_catg = data_quality_table.create_table(**features)
+
+        pd.testing.assert_frame_equal(act_dqt_cont, exp_dqt_cont)
+        pd.testing.assert_frame_equal(act_dqt_catg, exp_dqt_catg)
+
+
+    def test_dqt_generation_s07(self):
+        """ Test whether the features are split by the schema of the dataset, categories and nullable integers yield the same DQTs """
+
+        """ PREPARATION """
+        data_schema        = schema.Schema(columns = [schema.Column("m2", "float"), schema.Column("number_of_rooms", "int"),
+                                                      schema.Column("city", "string"), schema.Column("district", "category"),
+                                                      schema.Column("price", "int", nullable = False)])
+        dataloader         = load.DataLoader(dataset = load.DataSet(path_to_file = self.path_to_test_file_two, schema = data_schema))
+        data_quality_table = dqt.DataQualityTable(dataloader = dataloader)
+
+        """ EXECUTION """
+        act_dqt_cont, act_dqt_catg = data_quality_table.create_table(store_json_dir = f"{self.path_to_this_mod}")
+
+        """ VERIFICATION """
+        exp_dqt_cont, exp_dqt_catg = dqt.DataQualityTable(dataloader = self.dataloader_two).create_table(continuous_features = ["m2", "number_of_rooms", "price"],
+                                                                                                          categorical_features = ["city", "district"],
+                                                                                                          store_json_dir = f"{self.path_to_this_mod}")
+
+        pd.testing.assert_frame_equal(act_dqt_cont, exp_dqt_cont, check_dtype = False)
+        pd.testing.assert_frame_equal(act_dqt_catg, exp_dqt_catg)
+
+
+    def test_dqt_generation_s08(self):
+        """ Test whether only the rows which satisfy the predicates are profiled, in-memory and streamed """
+
+        """ PREPARATION """
+        predicates = [predicate.Range("price", upper = 2000), predicate.NotNull("city")]
+        features   = {'continuous_features': ["m2", "price"], 'categorical_features': ["city"], 'store_json_dir': f"{self.path_to_this_mod}"}
+
+        """ EXECUTION """
+        act_dqt_cont, act_dqt_catg = dqt.DataQualityTable(dataloader = self.dataloader_two, predicates = predicates).create_table(**features)
+        str_dqt_cont, str_dqt_catg = dqt.DataQualityTable(dataloader = self.dataloader_two, predicates = predicates, chunksize = 2).create_table(**features)
+
+        """ VERIFICATION """
+        assert act_dqt_cont.loc["price", "Count"] == 5
+        assert act_dqt_cont.loc["price", "Max"]   == 1500
+        assert act_dqt_catg.loc["city", "Count"]  == 5
+        pd.testing.assert_frame_equal(str_dqt_catg, act_dqt_catg)
+        assert str_dqt_cont.loc["price", "Count"] == 5
+
+
+    def test_dqt_generation_s09(self):
+        """ Test whether count, missing values, minimum and maximum are taken from the statistics of a Parquet file """
+
+        """ PREPARATION """
+        pytest.importorskip("pyarrow")
+        features = {'continuous_features': ["m2", "price"], 'categorical_features': ["city"], 'store_json_dir': f"{self.path_to_this_mod}"}
+        with tempfile.TemporaryDirectory() as directory:
+            path_to_file = os.path.join(directory, "test2.parquet")
+            pd.read_csv(self.path_to_test_file_two).to_parquet(path_to_file, row_group_size = 3)
+            dataloader   = load.DataLoader(dataset = load.DataSet(path_to_file = path_to_file))
+
+            """ EXECUTION """
+            scanned_parts = []
+            update        = stats.ContinuousAccumulator.update
+            def record(accumulator, values):
+                scanned_parts.append(set(accumulator.parts))
+                update(accumulator, values)
+            with patch.object(stats.ContinuousAccumulator, "update", autospec = True, side_effect = record):
+                act_dqt_cont, act_dqt_catg = dqt.DataQualityTable(dataloader = dataloader).create_table(**features, options = options.TableOptions(metadata = "first"))
+            quick_dqt_cont, quick_dqt_catg = dqt.DataQualityTable(dataloader = dataloader, chunksize = 2).create_table(**features, options = options.TableOptions(metadata = "only"))
+
+        """ VERIFICATION """
+        exp_dqt_cont, exp_dqt_catg = dqt.DataQualityTable(dataloader = self.dataloader_two).create_table(**features)
+
+        pd.testing.assert_frame_equal(act_dqt_cont, exp_dqt_cont)
+        pd.testing.assert_frame_equal(act_dqt_catg, exp_dqt_catg)
+        metrics = ["Count", "Miss. %", "Min", "Max"]
+        pd.testing.assert_frame_equal(quick_dqt_cont[metrics], exp_dqt_cont[metrics], check_dtype = False)
+        pd.testing.assert_frame_equal(quick_dqt_catg[metrics[:2]], exp_dqt_catg[metrics[:2]])
+        assert quick_dqt_cont["median"].isna().all()
+        # the minimum and the maximum are stored in the statistics, thus they are not scanned
+        assert scanned_parts and all("extrema" not in parts for parts in scanned_parts)
+
+
+    def test_dqt_generation_s10(self):
+        """ Test whether a DQT which is updated with appended rows equals the DQT of all rows, the state holds sketches unless exact quantiles are requested """
+
+        """ PREPARATION """
+        features   = {'continuous_features': ["m2", "price"], 'categorical_features': ["city", "district"]}
+        data_frame = pd.read_csv(self.path_to_test_file)
+        with tempfile.TemporaryDirectory() as directory:
+            data_frame.iloc[:2].to_csv(os.path.join(directory, "history.csv"), index = False)
+            data_frame.iloc[2:].to_csv(os.path.join(directory, "delta.csv"), index = False)
+            history = load.DataLoader(dataset = load.DataSet(path_to_file = os.path.join(directory, "history.csv")))
+            delta   = load.DataLoader(dataset = load.DataSet(path_to_file = os.path.join(directory, "delta.csv")))
+            dqt.DataQualityTable(dataloader = history).create_table(**features, store_json_dir = directory, options = options.TableOptions(store_state = True))
+
+            """ EXECUTION """
+            act_dqt_cont, act_dqt_catg = dqt.DataQualityTable(dataloader = delta, chunksize = 1).update_table(store_json_dir = directory)
+            stored_dqt_cont            = pd.read_json(os.path.join(directory, "dqt_cont.json"))
+            with open(os.path.join(directory, dqt.STATE_FILE)) as file:
+                sketch_state = json.load(file)['continuous']['m2']
+            dqt.DataQualityTable(dataloader = history).create_table(**features, store_json_dir = directory,
+                                                                    options = options.TableOptions(store_state = True, quantile_method = "exact"))
+            with open(os.path.join(directory, dqt.STATE_FILE)) as file:
+                exact_state = json.load(file)['continuous']['m2']
+
+        """ VERIFICATION """
+        exp_dqt_cont, exp_dqt_catg = dqt.DataQualityTable(dataloader = self.dataloader).create_table(**features, store_json_dir = f"{self.path_to_this_mod}")
+
+        pd.testing.assert_frame_equal(act_dqt_cont, exp_dqt_cont)
+        pd.testing.assert_frame_equal(act_dqt_catg, exp_dqt_catg)
+        assert stored_dqt_cont.loc["m2", "Count"] == 4
+        assert not sketch_state['exact'] and sketch_state['values'] == "" and sketch_state['quantiles'] is not None
+        assert sketch_state['cardinality']['method'] == "hll"
+        assert exact_state['exact'] and exact_state['values'] != ""
+
+
+    def test_dqt_generation_s11(self):
+        """ Test whether the requested quantiles are reported, either exactly or by a KLL sketch """
+
+        """ PREPARATION """
+        features   = {'continuous_features': ["m2", "price"], 'categorical_features': [], 'store_json_dir': f"{self.path_to_this_mod}"}
+        data_frame = self.dataloader.read_csv()
+
+        """ EXECUTION """
+        act_dqt_cont, _ = dqt.DataQualityTable(dataloader = self.dataloader).create_table(**features, options = options.TableOptions(quantiles = [0.05, 0.5, 0.95]))
+        kll_dqt_cont, _ = dqt.DataQualityTable(dataloader = self.dataloader).create_table(**features, options = options.TableOptions(quantiles = [0.05, 0.5, 0.95],
+                                                                                                                                     quantile_method = "kll"))
+
+        """ VERIFICATION """
+        assert list(act_dqt_cont.columns) == ["Count", "Miss. %", "Card.", "Min", "P5", "mean", "median", "P95", "Max", "Std. Dev."]
+        for feature in features['continuous_features']:
+            assert act_dqt_cont.loc[feature, "P5"]     == data_frame[feature].quantile(0.05)
+            assert act_dqt_cont.loc[feature, "median"] == data_frame[feature].median()
+            assert act_dqt_cont.loc[feature, "P95"]    == data_frame[feature].quantile(0.95)
+        # the sketch was not compacted, thus its quantiles are exact as well
+        pd.testing.assert_frame_equal(kll_dqt_cont.drop(columns = "Card."), act_dqt_cont.drop(columns = "Card."))
+
+
+    def test_dqt_generation_s12(self):
+        """ Test whether only the requested metrics are reported """
+
+        """ PREPARATION """
+        features = {'continuous_features': ["m2", "price"], 'categorical_features': ["city"], 'store_json_dir': f"{self.path_to_this_mod}"}
+
+        """ EXECUTION """
+        act_dqt_cont, act_dqt_catg = dqt.DataQualityTable(dataloader = self.dataloader).create_table(**features, options = options.TableOptions(metrics = ["Miss. %", "median", "Mode"]))
+
+        """ VERIFICATION """
+        exp_dqt_cont, exp_dqt_catg = dqt.DataQualityTable(dataloader = self.dataloader).create_table(**features)
+
+        pd.testing.assert_frame_equal(act_dqt_cont, exp_dqt_cont[["Miss. %", "median"]])
+        pd.testing.assert_frame_equal(act_dqt_catg, exp_dqt_catg[["Miss. %", "Mode"]])
+        with pytest.raises(ValueError):
+            dqt.DataQualityTable(dataloader = self.dataloader).create_table(**features, options = options.TableOptions(metrics = ["Kurtosis"]))
+
+
+    def test_dqt_generation_s13(self):
+        """ Test whether the data is neither loaded nor checked before the DQT is created and then only the features are read """
+
+        """ PREPARATION """
+        data_quality_table = dqt.DataQualityTable(dataloader = self.dataloader_three, check_consistency = True)
+
+        """ EXECUTION """
+        _, act_dqt_catg = data_quality_table.create_table(categorical_features = ["surname", "job"], store_json_dir = f"{self.path_to_this_mod}")
+
+        """ VERIFICATION """
+        assert data_quality_table._dataframe is None
+        assert act_dqt_catg["Count"].to_list() == [5, 5]
+        # the column 'name' is inconsistent, but it is not one of the features
+        with pytest.raises(exception.InconsistentDataTypes):
+            data_quality_table.create_table(categorical_features = ["name"], store_json_dir = f"{self.path_to_this_mod}")
+
+
+    def test_dqt_generation_s14(self):
+        """ Test whether the statistics of the partitions of a dataset are merged into the DQT of the whole data """
+
+        """ PREPARATION """
+        features   = {'continuous_features': ["m2", "number_of_rooms", "price"], 'categorical_features': ["city"],
+                      'store_json_dir': f"{self.path_to_this_mod}"}
+        data_frame = pd.read_csv(self.path_to_test_file_two)
+        with tempfile.TemporaryDirectory() as directory:
+            for index, start in enumerate(range(0, len(data_frame), 3)):
+                data_frame.iloc[start:start + 3].to_csv(os.path.join(directory, f"part-{index}.csv"), index = False)
+            dataloader = load.DataLoader(dataset = load.DataSet(path_to_file = os.path.join(directory, "part-*.csv")), workers = 2)
+
+            """ EXECUTION """
+            act_dqt_cont, act_dqt_catg = dqt.DataQualityTable(dataloader = dataloader).create_table(**features)
+            act_streamed_cont, _       = dqt.DataQualityTable(dataloader = dataloader, chunksize = 2).create_table(**features, options = options.TableOptions(executor = "thread"))
+
+        """ VERIFICATION """
+        exp_dqt_cont, exp_dqt_catg = dqt.DataQualityTable(dataloader = self.dataloader_two).create_table(**features)
+
+        pd.testing.assert_frame_equal(act_dqt_cont, exp_dqt_cont)
+        pd.testing.assert_frame_equal(act_dqt_catg, exp_dqt_catg)
+        pd.testing.assert_frame_equal(act_streamed_cont, exp_dqt_cont, check_dtype = False)
+
+
+    def test_dqt_generation_s15(self):
+        """ Test whether the statistics of the partition columns of a Hive-partitioned Parquet dataset are derived from their values """
+
+        """ PREPARATION """
+        pytest.importorskip("pyarrow")
+        features   = {'continuous_features': ["price", "month"], 'categorical_features': ["city", "region"], 'store_json_dir': f"{self.path_to_this_mod}"}
+        data_frame = pd.read_csv(self.path_to_test_file_two)[["price", "city"]]
+        with tempfile.TemporaryDirectory() as directory:
+            for month, region, start in ((1, "north", 0), (2, "north", 3), (3, "south", 6)):
+                os.makedirs(os.path.join(directory, f"month={month}", f"region={region}"))
+                data_frame.iloc[start:start + 3].to_parquet(os.path.join(directory, f"month={month}", f"region={region}", "part-0.parquet"))
+            dataloader = load.DataLoader(dataset = load.DataSet(path_to_file = directory))
+
+            """ EXECUTION """
+            exp_dqt_cont, exp_dqt_catg     = dqt.DataQualityTable(dataloader = dataloader).create_table(**features)
+            act_dqt_cont, act_dqt_catg     = dqt.DataQualityTable(dataloader = dataloader).create_table(**features, options = options.TableOptions(metadata = "first"))
+            quick_dqt_cont, quick_dqt_catg = dqt.DataQualityTable(dataloader = dataloader).create_table(**features, options = options.TableOptions(metadata = "only"))
+
+        """ VERIFICATION """
+        pd.testing.assert_frame_equal(act_dqt_cont, exp_dqt_cont, check_dtype = False)
+        pd.testing.assert_frame_equal(act_dqt_catg, exp_dqt_catg, check_dtype = False)
+        assert quick_dqt_cont.loc["month", ["Count", "Min", "Max"]].to_list() == [len(data_frame), 1, 3]
+        assert quick_dqt_catg.loc["region", "Count"] == len(data_frame) and quick_dqt_catg.loc["region", "Miss. %"] == 0
+
+
+    def test_dqt_generation_s16(self):
+        """ Test whether a DQT which knows none of the requested metrics is neither built nor stored """
+
+        """ PREPARATION """
+        features = {'continuous_features': ["m2", "price"], 'categorical_features': ["city"]}
+
+        """ EXECUTION """
+        with tempfile.TemporaryDirectory() as directory:
+            act_dqt_cont, act_dqt_catg = dqt.DataQualityTable(dataloader = self.dataloader).create_table(**features, store_json_dir = directory,
+                                                                                                         options = options.TableOptions(metrics = ["mean", "median"], store_state = True))
+            act_files                  = sorted(os.listdir(directory))
+            upd_dqt_cont, upd_dqt_catg = dqt.DataQualityTable(dataloader = self.dataloader, chunksize = 2).update_table(store_json_dir = directory)
+
+        """ VERIFICATION """
+        assert act_dqt_catg is None and upd_dqt_catg is None
+        assert "dqt_catg.json" not in act_files and "dqt_cont.json" in act_files
+        assert act_dqt_cont.columns.to_list() == ["mean", "median"] and upd_dqt_cont["mean"].to_list() == act_dqt_cont["mean"].to_list()
+
+
+    def test_dqt_update_e01(self):
+        """ Test whether a DQT cannot be updated without a stored state """
+
+        """ EXECUTION & VERIFICATION """
+        with tempfile.TemporaryDirectory() as directory:
+            with pytest.raises(FileNotFoundError):
+                dqt.DataQualityTable(dataloader = self.dataloader).update_table(store_json_dir = directory)
+        with pytest.raises(ValueError):
+            dqt.DataQualityTable(dataloader = self.dataloader).create_table(continuous_features = ["m2"], store_json_dir = f"{self.path_to_this_mod}",
+                                                                            options = options.TableOptions(metadata = "first", store_state = True))
+
+
+    def test_dqt_generation_e01(self):
+        """ Test whether the statistics of the row groups cannot be combined with predicates """
+
+        """ EXECUTION & VERIFICATION """
+        data_quality_table = dqt.DataQualityTable(dataloader = self.dataloader_two, predicates = [predicate.NotNull("price")])
+        for metadata in ("first", "only"):
+            with pytest.raises(ValueError):
+                data_quality_table.create_table(continuous_features = ["price"], store_json_dir = f"{self.path_to_this_mod}",
+                                                options = options.TableOptions(metadata = metadata))
+
+
+    def test_options_e01(self):
+        """ Test whether unknown options or a state without scanning the data are rejected """
+
+        """ EXECUTION & VERIFICATION """
+        with pytest.raises(ValueError):
+            options.TableOptions(metadata = "footer")
+        with pytest.raises(ValueError):
+            options.TableOptions(quantile_method = "tdigest")
+        with pytest.raises(ValueError):
+            options.TableOptions(metadata = "only", store_state = True)
+
+
     def test_dqt_consistency_check_e01(self):
         """Check if inconsistencies in data can be found, in this check we will check
         for data with missing values and/or values which are NaN
@@ -128,7 +508,7 @@ class TestDQT(unittest.TestCase):
 
         """ EXECUTION & VERIFICATION """
         with pytest.raises(exception.InconsistentData):
-            dqt.DataQualityTable(dataloader = self.dataloader_two, check_consistency = True)
+            dqt.DataQualityTable(dataloader = self.dataloader_two, check_consistency = True).dataframe
 
             
     def test_dqt_consistency_check_e02(self):
@@ -138,7 +518,20 @@ class TestDQT(unittest.TestCase):
 
         """ EXECUTION & VERIFICATION """
         with pytest.raises(exception.InconsistentDataTypes):
-            dqt.DataQualityTable(dataloader = self.dataloader_three, check_consistency = True)
+            dqt.DataQualityTable(dataloader = self.dataloader_three, check_consistency = True).dataframe
+
+
+    def test_dqt_consistency_check_e03(self):
+        """Check if inconsistencies are found with every validation strategy while the data is streamed
+        """
+
+        """ EXECUTION & VERIFICATION """
+        for strategy in ("full", "sample", "fail_fast"):
+            data_quality_table = dqt.DataQualityTable(dataloader = self.dataloader_three, check_consistency = True, chunksize = 2,
+                                                      validation = strategy)
+            with pytest.raises(exception.InconsistentDataTypes):
+                data_quality_table.create_table(continuous_features = ["income per year"], categorical_features = ["name"],
+                                                store_json_dir = f"{self.path_to_this_mod}")
 
 
     def tearDown(self):
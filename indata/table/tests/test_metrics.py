@@ -0,0 +1,80 @@
+"""Testing the registry of the metrics of the data quality table"""
+
+import operator
+import pytest
+import numpy as np
+import pandas as pd
+
+
+import indata.table.stats as stats
+import indata.table.metrics as metrics
+
+
+class TestMetrics:
+    @classmethod
+    def setup_class(cls):
+        """ Setup of test data """
+        cls.data_frame = pd.DataFrame({'m2': [120, 0, np.nan, 50, 0, 60, 70],
+                                       'city': ["Springfield", "Chicago", "Chicago", None, "New York", "New York", "New York"]})
+
+
+    def teardown_method(self):
+        """ Removes the custom metrics, such that they do not leak into other tests """
+        for kind in metrics.KINDS:
+            for name in metrics.custom_metrics(kind):
+                metrics.unregister_metric(kind, name)
+
+
+    def test_resolve_s01(self):
+        """ Test whether only the requested metrics and their parts of the state are computed """
+
+        """ EXECUTION """
+        accumulator = stats.ContinuousAccumulator(exact = True, metrics = ["Std. Dev.", "Miss. %"])
+        accumulator.update(self.data_frame["m2"])
+
+        """ VERIFICATION """
+        assert accumulator.metrics == ("Miss. %", "Std. Dev.")
+        assert accumulator.parts   == {"moments"}
+        assert accumulator.values  == [] and accumulator.minimum is None and accumulator.cardinality is None
+        assert accumulator.result() == {'Miss. %': 100 / 7, 'Std. Dev.': self.data_frame["m2"].std()}
+
+
+    def test_register_s01(self):
+        """ Test whether custom metrics are accumulated over chunks and can depend on other metrics """
+
+        """ PREPARATION """
+        metrics.register_metric(metrics.Metric("Zeros", kind = "continuous", function = lambda row, state: state,
+                                               update = lambda values: int((values == 0).sum()), merge = operator.add))
+        metrics.register_metric(metrics.Metric("Coef. of Var.", kind = "continuous", requires = ["mean", "Std. Dev."],
+                                               function = lambda row, state: row["Std. Dev."] / row["mean"]))
+        accumulator = stats.ContinuousAccumulator(metrics = ["Count", "Zeros", "Coef. of Var."])
+
+        """ EXECUTION """
+        stats.accumulate(np.array_split(self.data_frame, 3), {"m2": accumulator})
+
+        """ VERIFICATION """
+        column = self.data_frame["m2"]
+        assert accumulator.parts    == {"moments"}
+        assert accumulator.result() == pytest.approx({'Count': 6, 'Zeros': 2, 'Coef. of Var.': column.std() / column.mean()})
+        assert "Zeros" in stats.ContinuousAccumulator().metrics
+
+
+    def test_register_e01(self):
+        """ Test whether unknown metrics, duplicates and merges of metrics without a merge raise a ValueError """
+
+        """ PREPARATION """
+        metrics.register_metric(metrics.Metric("Longest", kind = "categorical", function = lambda row, state: state,
+                                               update = lambda values: values.dropna().str.len().max()))
+
+        """ EXECUTION & VERIFICATION """
+        with pytest.raises(ValueError):
+            stats.ContinuousAccumulator(metrics = ["Kurtosis"])
+        with pytest.raises(ValueError):
+            metrics.register_metric(metrics.Metric("Longest", kind = "categorical", function = len))
+        with pytest.raises(ValueError):
+            metrics.Metric("Zeros", kind = "ordinal", function = len)
+        accumulator = stats.CategoricalAccumulator(metrics = ["Longest"])
+        accumulator.update(self.data_frame["city"])
+        assert accumulator.result() == {'Longest': 11}
+        with pytest.raises(ValueError):
+            accumulator.update(self.data_frame["city"])
\ No newline at end of file
@@ -0,0 +1,89 @@
+"""Testing the concurrent profiling of columns"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+
+import indata.table.stats as stats
+import indata.table.parallel as parallel
+
+
+class TestColumnExecutor:
+    @classmethod
+    def setup_class(cls):
+        """ Setup of test data """
+        cls.data_frame = pd.DataFrame({'m2': [120, 70, np.nan, 50, 15, 60, 70],
+                                       'price': [1500, 1500, 1200, 700, 2709, 1990, 1700],
+                                       'city': ["Springfield", "Chicago", "Chicago", None, "New York", "New York", "New York"]})
+
+
+    def accumulators(self) -> dict:
+        """ Fresh accumulators for every feature of the test data """
+        return {'m2': stats.ContinuousAccumulator(exact = True),
+                'price': stats.ContinuousAccumulator(),
+                'city': stats.CategoricalAccumulator()}
+
+
+    def test_map_s01(self):
+        """ Test whether threads and processes profile the columns like the serial executor """
+
+        """ PREPARATION """
+        with parallel.ColumnExecutor() as executor:
+            exp_rows = executor.map(stats.profile_column, self.data_frame, self.accumulators())
+
+        for kind in ("thread", "process"):
+            """ EXECUTION """
+            with parallel.ColumnExecutor(kind = kind, workers = 2) as executor:
+                act_rows = executor.map(stats.profile_column, self.data_frame, self.accumulators())
+
+            """ VERIFICATION """
+            assert list(act_rows.keys()) == ["m2", "price", "city"]
+            pd.testing.assert_frame_equal(stats.rows_to_table(act_rows), stats.rows_to_table(exp_rows))
+
+
+    def test_map_s02(self):
+        """ Test whether partial accumulators of worker processes can be merged over chunks """
+
+        """ PREPARATION """
+        accumulators = self.accumulators()
+
+        """ EXECUTION """
+        with parallel.ColumnExecutor(kind = "process", workers = 2) as executor:
+            stats.accumulate(np.array_split(self.data_frame, 3), accumulators, executor = executor)
+
+        """ VERIFICATION """
+        exp_accumulators = self.accumulators()
+        stats.accumulate([self.data_frame], exp_accumulators)
+
+        pd.testing.assert_frame_equal(stats.to_table(accumulators), stats.to_table(exp_accumulators))
+
+
+    def test_map_s03(self):
+        """ Test whether only empty accumulators are sent to the workers and the accumulated state stays in the parent """
+
+        """ PREPARATION """
+        accumulators = self.accumulators()
+        sent_counts  = []
+        class Recorder(parallel.ColumnExecutor):
+            def map(self, function, dataframe, partials):
+                sent_counts.extend(partial.count for partial in partials.values())
+                return super().map(function, dataframe, partials)
+
+        """ EXECUTION """
+        with Recorder(kind = "thread", workers = 2) as executor:
+            stats.accumulate(np.array_split(self.data_frame, 3), accumulators, executor = executor)
+
+        """ VERIFICATION """
+        assert len(sent_counts) == 9 and not any(sent_counts)
+        assert accumulators["price"].count == 7
+
+
+    def test_initialisation_e01(self):
+        """ Test whether an error is raised for unknown executors or an invalid number of workers """
+
+        """ EXECUTION & VERIFICATION """
+        with pytest.raises(ValueError):
+            parallel.ColumnExecutor(kind = "cluster")
+        with pytest.raises(ValueError):
+            parallel.ColumnExecutor(kind = "thread", workers = 0)
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""Testing the accumulators behind the data quality table"""
+
+import json
+import pytest
+import numpy as np
+import pandas as pd
+
+
+import indata.table.stats as stats
+
+
+class TestAccumulators:
+    @classmethod
+    def setup_class(cls):
+        """ Setup of test data """
+        cls.data_frame = pd.DataFrame({'m2': [120, 70, np.nan, 50, 15, 60, 70],
+                                       'city': ["Springfield", "Chicago", "Chicago", None, "New York", "New York", "New York"]})
+
+
+    def test_continuous_s01(self):
+        """ Test whether an accumulator over chunks equals the statistics of pandas """
+
+        """ PREPARATION """
+        accumulator = stats.ContinuousAccumulator(exact = True)
+
+        """ EXECUTION """
+        for chunk in np.array_split(self.data_frame, 3):
+            accumulator.update(chunk["m2"])
+        act_result = accumulator.result()
+
+        """ VERIFICATION """
+        column = self.data_frame["m2"]
+        assert act_result["Count"]   == 6
+        assert act_result["Card."]   == 5
+        assert act_result["Min"]     == column.min()
+        assert act_result["Max"]     == column.max()
+        assert act_result["median"]  == column.median()
+        assert act_result["3rd Qrt."] == column.quantile(0.75)
+        assert act_result["mean"]      == pytest.approx(column.mean())
+        assert act_result["Std. Dev."] == pytest.approx(column.std())
+        assert act_result["Miss. %"]   == pytest.approx(100 / 7)
+
+
+    def test_continuous_s02(self):
+        """ Test whether approximate accumulators of disjoint chunks can be merged """
+
+        """ PREPARATION """
+        first  = stats.ContinuousAccumulator()
+        second = stats.ContinuousAccumulator()
+
+        """ EXECUTION """
+        first.update(self.data_frame["m2"].iloc[:3])
+        second.update(self.data_frame["m2"].iloc[3:])
+        act_result = first.merge(second).result()
+
+        """ VERIFICATION """
+        column = self.data_frame["m2"]
+        assert act_result["Count"]     == 6
+        assert act_result["Card."]     == 5
+        assert act_result["median"]    == column.median()
+        assert act_result["Std. Dev."] == pytest.approx(column.std())
+
+
+    def test_continuous_e01(self):
+        """ Test whether exact and approximate accumulators cannot be merged """
+
+        """ EXECUTION & VERIFICATION """
+        with pytest.raises(ValueError):
+            stats.ContinuousAccumulator(exact = True).merge(stats.ContinuousAccumulator())
+
+
+    def test_categorical_s01(self):
+        """ Test whether the modes are derived from the merged frequencies """
+
+        """ PREPARATION """
+        chunks = np.array_split(self.data_frame, 3)
+
+        accumulators = {"city": stats.CategoricalAccumulator()}
+
+        """ EXECUTION """
+        stats.accumulate(chunks, accumulators)
+        act_result = accumulators["city"].result()
+
+        """ VERIFICATION """
+        assert act_result["Count"]          == 6
+        assert act_result["Card."]          == 3
+        assert act_result["Mode"]           == "New York"
+        assert act_result["Mode Freq."]     == 3
+        assert act_result["2nd Mode"]       == "Chicago"
+        assert act_result["2nd Mode Freq."] == 2
+
+
+    def test_categorical_s02(self):
+        """ Test whether a feature with a single category is reported without failing """
+
+        """ PREPARATION """
+        accumulator = stats.CategoricalAccumulator()
+
+        """ EXECUTION """
+        accumulator.update(pd.Series(["Chicago", "Chicago", None]))
+        act_result = accumulator.result()
+
+        """ VERIFICATION """
+        assert act_result["Card."]            == 1
+        assert act_result["Mode"]             == "Chicago"
+        assert act_result["Mode Freq. %"]     == 100.0
+        assert act_result["2nd Mode"]         is None
+        assert act_result["2nd Mode Freq."]   == 0
+        assert act_result["2nd Mode Freq. %"] == 0.0
+
+
+    def test_mode_name_s01(self):
+        """ Test whether the column names of the modes are ordinal numbers """
+
+        """ EXECUTION & VERIFICATION """
+        assert [stats.mode_name(rank) for rank in (1, 2, 3, 4, 11, 12, 21, 22)] == \
+               ["Mode", "2nd Mode", "3rd Mode", "4th Mode", "11th Mode", "12th Mode", "21st Mode", "22nd Mode"]
+
+
+    def test_categorical_s03(self):
+        """ Test whether approximate accumulators report the modes of the merged chunks """
+
+        """ PREPARATION """
+        chunks = np.array_split(self.data_frame, 3)
+
+        accumulators = {"city": stats.CategoricalAccumulator(approximate = True, capacity = 2)}
+
+        """ EXECUTION """
+        stats.accumulate(chunks, accumulators)
+        act_result = accumulators["city"].result()
+
+        """ VERIFICATION """
+        assert act_result["Count"]      == 6
+        assert act_result["Card."]      == 3
+        assert act_result["Mode"]       == "New York"
+        assert 3 <= act_result["Mode Freq."] <= 3 + 6 / 2
+
+
+    def test_serialization_s01(self):
+        """ Test whether restored accumulators can be updated with the remaining chunks """
+
+        """ PREPARATION """
+        chunks = np.array_split(self.data_frame, 3)
+        for continuous, categorical in ((stats.ContinuousAccumulator(exact = True), stats.CategoricalAccumulator()),
+                                        (stats.ContinuousAccumulator(), stats.CategoricalAccumulator(approximate = True, capacity = 2))):
+            accumulators = {"m2": continuous, "city": categorical}
+            stats.accumulate(chunks[:2], accumulators)
+
+            """ EXECUTION """
+            restored = {feature: stats.accumulator_from_dict(json.loads(json.dumps(accumulator.to_dict())))
+                        for feature, accumulator in accumulators.items()}
+            stats.accumulate(chunks[2:], restored)
+            stats.accumulate(chunks[2:], accumulators)
+
+            """ VERIFICATION """
+            pd.testing.assert_frame_equal(stats.to_table(restored), stats.to_table(accumulators))
\ No newline at end of file
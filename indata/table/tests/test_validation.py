@@ -0,0 +1,88 @@
+"""Testing the validation strategies of the schema"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+
+import indata.table.validation as validation
+import indata.exception.base as exception
+
+
+class TestSchemaValidator:
+    @classmethod
+    def setup_class(cls):
+        """ Setup of test data """
+        cls.data_frame = pd.DataFrame({'name': ["John", "Stella", "Sophie", "973", "Maynard", "Anna"],
+                                       'income': ["30457", "43899", "27499", "36589", "Craftsman", "31000"]})
+
+
+    def chunks(self, data_frame: pd.DataFrame, consumed: list) -> iter:
+        """ Yields chunks of two rows and records which chunks were consumed """
+        for start in range(0, len(data_frame), 2):
+            consumed.append(start)
+            yield data_frame.iloc[start:start + 2]
+
+
+    def test_validation_s01(self):
+        """ Test whether the full validation reports the inconsistencies of all chunks """
+
+        """ PREPARATION """
+        validator = validation.SchemaValidator(strategy = "full")
+        consumed  = []
+
+        """ EXECUTION & VERIFICATION """
+        with pytest.raises(exception.InconsistentDataTypes):
+            list(validator.check(self.chunks(self.data_frame, consumed)))
+
+        assert consumed == [0, 2, 4]
+        assert validator.mixed == {'name': (["str", "float"], [3]), 'income': (["str", "float"], [4])}
+
+
+    def test_validation_s02(self):
+        """ Test whether the fail fast validation stops at the first inconsistent chunk """
+
+        """ PREPARATION """
+        validator = validation.SchemaValidator(strategy = "fail_fast")
+        consumed  = []
+
+        """ EXECUTION & VERIFICATION """
+        with pytest.raises(exception.InconsistentDataTypes):
+            list(validator.check(self.chunks(self.data_frame, consumed)))
+
+        assert consumed == [0, 2]
+        assert validator.mixed == {'name': (["str", "float"], [3])}
+
+
+    def test_validation_s03(self):
+        """ Test whether a uniform sample of rows is validated, missing values are reported with their rows """
+
+        """ PREPARATION """
+        data_frame = pd.DataFrame({'value': np.arange(1000, dtype = float)})
+        data_frame.loc[[10, 500], 'value'] = np.nan
+        validator  = validation.SchemaValidator(strategy = "sample", sample_size = 1000)
+        consumed   = []
+
+        """ EXECUTION & VERIFICATION """
+        with pytest.raises(exception.InconsistentData):
+            list(validator.check(self.chunks(data_frame, consumed)))
+
+        assert validator.missing == {'value': [10, 500]}
+
+        # a small sample can miss the inconsistent rows, but it is a sample of all chunks
+        validator = validation.SchemaValidator(strategy = "sample", sample_size = 50, seed = 1)
+        for chunk in self.chunks(data_frame, []):
+            validator.update(chunk)
+
+        assert len(validator.sample) == 50
+        assert validator.sample.index.max() > 500
+
+
+    def test_validation_e01(self):
+        """ Test whether an error is raised for an unknown strategy or an invalid sample size """
+
+        """ EXECUTION & VERIFICATION """
+        with pytest.raises(ValueError):
+            validation.SchemaValidator(strategy = "partial")
+        with pytest.raises(ValueError):
+            validation.SchemaValidator(strategy = "sample", sample_size = 0)
\ No newline at end of file
@@ -0,0 +1,210 @@
+"""
+The schema of the data can be validated with different strategies, either every row is
+checked, only a uniform sample of rows is checked, or the validation stops at the first
+inconsistent chunk. The SchemaValidator consumes the data chunk by chunk, thus the data
+does not need to be loaded at once in order to be rejected
+"""
+
+import attrs
+import numpy as np
+import pandas as pd
+
+from abc    import abstractmethod
+from typing import Iterable, Iterator
+
+import indata.utils.checks as checks
+import indata.exception.base as exception
+
+
+STRATEGIES = ("full", "sample", "fail_fast")
+
+
+#################################################################################################
+#                                 Interface SchemaValidator                                     #
+#################################################################################################
+
+class IFSchemaValidator:
+    """
+    Interface for the SchemaValidator
+
+    Methods
+    -------
+    update()
+        Inspects the next chunk of the data
+    validate()
+        Raises an error if the inspected data is inconsistent
+    """
+
+    @abstractmethod
+    def update(self): # pragma: no cover
+        pass
+
+
+    @abstractmethod
+    def validate(self): # pragma: no cover
+        pass
+
+
+#################################################################################################
+#                                      SchemaValidator                                          #
+#################################################################################################
+
+@attrs.define()
+class SchemaValidator(IFSchemaValidator):
+    """
+    Validates the schema of data which is passed chunk by chunk, the expected kind of every column,
+    see `checks.infer_kinds`, is inferred from its first present entry. Missing values and entries of another
+    kind are collected per column together with their row indices
+
+    Methods
+    -------
+    update(chunk: pd.DataFrame)
+        Inspects a chunk, or adds it to the sample of rows for the strategy "sample"
+    validate()
+        Raises an error if any inspected row is inconsistent
+    check(chunks: Iterable[pd.DataFrame])
+        Passes the chunks through while validating them
+    """
+    strategy: str                            = attrs.field(factory = str)
+    sample_size: int                         = attrs.field(default = 10_000)
+    seed: int                                = attrs.field(default = 0)
+    expected: dict[str, str]                 = attrs.field(factory = dict)
+    missing: dict[str, list]                 = attrs.field(factory = dict)
+    mixed: dict[str, tuple[list[str], list]] = attrs.field(factory = dict)
+    sample: pd.DataFrame                     = attrs.field(default = None)
+    keys: np.ndarray                         = attrs.field(default = None)
+    _rng: np.random.Generator                = attrs.field(default = None)
+
+    def __init__(self, strategy: str = "full", sample_size: int = 10_000, seed: int = 0):
+        """
+        Parameters
+        ----------
+        strategy : str, optional
+            "full" checks every row and reports all inconsistencies once the data is consumed, "sample" checks
+            a uniform sample of `sample_size` rows and "fail_fast" stops at the first inconsistent chunk, by default "full"
+        sample_size : int, optional
+            Number of rows which are sampled for the strategy "sample", by default 10_000
+        seed : int, optional
+            Seed for the sampling of rows, by default 0
+
+        Raises
+        ------
+        ValueError
+            Raised when the strategy is unknown or the sample size is not positive
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown validation strategy {strategy}, choose one of {STRATEGIES}!")
+        if sample_size < 1:
+            raise ValueError("The sample size has to be positive!")
+        self.strategy    = strategy
+        self.sample_size = sample_size
+        self.seed        = seed
+        self.expected    = {}
+        self.missing     = {}
+        self.mixed       = {}
+        self.sample      = None
+        self.keys        = None
+        self._rng        = np.random.default_rng(seed)
+
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """
+        Inspects the next chunk of the data
+
+        Parameters
+        ----------
+        chunk : pd.DataFrame
+            The next chunk, its index should continue the index of the previous chunk
+
+        Raises
+        ------
+        InconsistentData, InconsistentDataTypes
+            Raised for the strategy "fail_fast" as soon as the chunk is inconsistent
+        """
+        unknown = [column for column in chunk.columns if column not in self.expected]
+        if unknown:
+            self.expected.update(checks.first_kinds(chunk[unknown]))
+
+        if self.strategy == "sample":
+            self.__reservoir(chunk)
+            return
+
+        self.__inspect(chunk)
+        if self.strategy == "fail_fast":
+            self.validate()
+
+
+    def validate(self) -> None:
+        """
+        Raises an error if any inspected row is inconsistent, missing values are reported before
+        entries of an unexpected kind
+
+        Raises
+        ------
+        InconsistentData
+            When the data contains missing values
+        InconsistentDataTypes
+            When a column contains entries of multiple kinds
+        """
+        if self.sample is not None:
+            self.__inspect(self.sample.sort_index())
+            self.sample, self.keys = None, None
+
+        if self.missing:
+            raise exception.InconsistentData(f"Data seems to be inconsistent!\nThe following rows contain either NaN or missing values per column:\n{self.missing}")
+
+        if self.mixed:
+            details = "\n".join(f"Column {column} contains the data types {kinds}, watch out for the following lines: {indices}"
+                                for column, (kinds, indices) in self.mixed.items())
+            raise exception.InconsistentDataTypes(f"Columns {list(self.mixed)} contain multiple data types and are thus inconsistent!\n{details}")
+
+
+    def check(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """
+        Passes the chunks through while validating them, the validation is completed
+        once the last chunk was consumed
+
+        Parameters
+        ----------
+        chunks : Iterable[pd.DataFrame]
+            The chunks of the data
+
+        Returns
+        -------
+        Iterator[pd.DataFrame]
+            The unmodified chunks
+        """
+        for chunk in chunks:
+            self.update(chunk)
+            yield chunk
+        self.validate()
+
+
+    def __inspect(self, dataframe: pd.DataFrame) -> None:
+        """ Collects the missing values and the entries of unexpected kinds of the dataframe """
+        for column, indices in checks.find_missing(dataframe).items():
+            self.missing.setdefault(column, []).extend(indices)
+
+        for column, (kinds, indices) in checks.find_mixed_types(dataframe, expected = self.expected).items():
+            present, offending = self.mixed.setdefault(column, ([], []))
+            present.extend(kind for kind in kinds if kind not in present)
+            offending.extend(indices)
+
+
+    def __reservoir(self, chunk: pd.DataFrame) -> None:
+        """
+        Keeps a uniform sample of rows without replacement, every row gets a random key and
+        the rows with the `sample_size` smallest keys are kept
+        """
+        keys = self._rng.random(len(chunk))
+        if self.keys is not None and len(self.keys) == self.sample_size:
+            candidates  = keys < self.keys.max()
+            chunk, keys = chunk[candidates], keys[candidates]
+
+        sample = chunk if self.sample is None else pd.concat([self.sample, chunk])
+        keys   = keys if self.keys is None else np.concatenate([self.keys, keys])
+        if len(keys) > self.sample_size:
+            keep         = np.argpartition(keys, self.sample_size)[:self.sample_size]
+            sample, keys = sample.iloc[keep], keys[keep]
+
+        self.sample, self.keys = sample, keys
\ No newline at end of file
@@ -2,6 +2,12 @@
 Functions specialised on checking specific conditions
 """
 
+import numpy as np
+import pandas as pd
+
+# inferred dtypes of object columns on which the `.str` accessor is available
+_STRING_DTYPES = ("string", "empty", "mixed", "mixed-integer")
+
 def isNumeric(x: str) -> bool:
     """
     Checks whether a string is numeric
@@ -26,4 +32,162 @@ def isNumeric(x: str) -> bool:
 
     if x.isdigit() or (x.replace('.', '', 1).isdigit() and x.count('.') < 2):
         return True
-    return False
\ No newline at end of file
+    return False
+
+
+def missing_mask(column: pd.Series) -> pd.Series:
+    """
+    Vectorized mask of the missing entries of a column, besides NaN and None,
+    strings which consist of whitespaces only are treated as missing
+
+    Parameters
+    ----------
+    column : pd.Series
+        Column which should be checked
+
+    Returns
+    -------
+    pd.Series
+        Boolean mask which is `True` for every missing entry
+    """
+    mask = column.isna()
+    if column.dtype == object and pd.api.types.infer_dtype(column, skipna = True) in _STRING_DTYPES:
+        mask |= column.str.strip().eq("").fillna(False).astype(bool)
+
+    return mask
+
+
+def dtype_kind(dtype: np.dtype) -> str:
+    """
+    Kind of all entries of a column with a non-object dtype, see `infer_kinds`
+
+    Parameters
+    ----------
+    dtype : np.dtype
+        The dtype of the column
+
+    Returns
+    -------
+    str
+        "float" for numeric dtypes, otherwise the name of the dtype
+    """
+    if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+        return "float"
+    return dtype.name
+
+
+def infer_kinds(column: pd.Series) -> pd.Series:
+    """
+    Vectorized inference of the kind of every present entry of a column, numbers
+    and numeric strings are of kind "float", other strings of kind "str" and all other
+    objects are named by their type, e.g. "date"
+
+    Parameters
+    ----------
+    column : pd.Series
+        Column whose entries are classified, missing entries are dropped
+
+    Returns
+    -------
+    pd.Series
+        The kind of every present entry, indexed like the column
+    """
+    present = column[~missing_mask(column)]
+    if present.dtype != object:
+        return pd.Series(dtype_kind(present.dtype), index = present.index, dtype = object)
+
+    numeric   = pd.to_numeric(present, errors = "coerce").notna().to_numpy()
+    is_string = np.zeros(len(present), dtype = bool)
+    if pd.api.types.infer_dtype(present, skipna = True) in _STRING_DTYPES:
+        is_string = present.str.len().notna().to_numpy()
+    # bools are numbers to `to_numeric`, but not to the schema
+    is_bool   = present.map(type).eq(bool).to_numpy() if not is_string.all() else np.zeros(len(present), dtype = bool)
+    numeric  &= ~is_bool
+
+    kinds = pd.Series(np.where(numeric, "float", np.where(is_string, "str", None)), index = present.index, dtype = object)
+    other = kinds.isna()
+    if other.any():
+        kinds[other] = present[other].map(lambda x: type(x).__name__)
+
+    return kinds
+
+
+def find_missing(dataframe: pd.DataFrame) -> dict[str, list]:
+    """
+    Finds the missing entries of every column of a dataframe without copying it
+
+    Parameters
+    ----------
+    dataframe : pd.DataFrame
+        Dataframe which should be checked
+
+    Returns
+    -------
+    dict[str, list]
+        The row indices of the missing entries per column, only columns with missing entries are listed
+    """
+    missing = {}
+    for column in dataframe.columns:
+        mask = missing_mask(dataframe[column])
+        if mask.any():
+            missing[column] = dataframe.index[mask.to_numpy()].to_list()
+
+    return missing
+
+
+def find_mixed_types(dataframe: pd.DataFrame, expected: dict[str, str] = None) -> dict[str, tuple[list[str], list]]:
+    """
+    Finds the columns of a dataframe which contain entries of multiple kinds, see `infer_kinds`,
+    the kind of the first present entry is expected for the whole column
+
+    Parameters
+    ----------
+    dataframe : pd.DataFrame
+        Dataframe which should be checked
+    expected : dict[str, str], optional
+        Expected kind per column, e.g. the kinds of a previous chunk, overrides the kind of the first
+        present entry, by default None
+
+    Returns
+    -------
+    dict[str, tuple[list[str], list]]
+        For every inconsistent column, the kinds which are present and the row indices
+        of the entries which differ from the expected kind
+    """
+    expected = expected or {}
+    mixed    = {}
+    for column in dataframe.columns:
+        dtype = dataframe[column].dtype
+        if dtype != object and (column not in expected or dtype_kind(dtype) == expected[column]):
+            continue
+        kinds = infer_kinds(dataframe[column])
+        if len(kinds) == 0:
+            continue
+        mismatch = kinds.ne(expected.get(column, kinds.iloc[0])).to_numpy()
+        if mismatch.any():
+            mixed[column] = (kinds.unique().tolist(), kinds.index[mismatch].to_list())
+
+    return mixed
+
+
+def first_kinds(dataframe: pd.DataFrame) -> dict[str, str]:
+    """
+    Infers the kind of the first present entry of every column, see `infer_kinds`
+
+    Parameters
+    ----------
+    dataframe : pd.DataFrame
+        Dataframe whose columns are inspected
+
+    Returns
+    -------
+    dict[str, str]
+        The kind per column, columns without present entries are left out
+    """
+    kinds = {}
+    for column in dataframe.columns:
+        present = dataframe[column][~missing_mask(dataframe[column])].head(1)
+        if len(present) != 0:
+            kinds[column] = infer_kinds(present).iloc[0]
+
+    return kinds
\ No newline at end of file
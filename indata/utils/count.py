@@ -4,9 +4,11 @@ in this module
 """
 
 import numpy as np
+import pandas as pd
 
-from typing import Tuple
+from typing import Any, Tuple
 
+import indata.utils.sketch as sketch
 import indata.exception.base as exception
 
 
@@ -21,7 +23,7 @@ class Categories:
     
     Methods
     -------
-    count(data: list)
+    count(data: list, approximate: bool, capacity: int, sort: bool, top_k: int)
         `data` should be 1d-array-like and should contain categorical features,
         `count` will count how many features per feature are in `data`
     """
@@ -30,15 +32,31 @@ class Categories:
 
 
     @staticmethod
-    def count(data: list) -> dict[Tuple[int, str], int]:
+    def count(data: Any, approximate: bool = False, capacity: int = 1000, sort: bool = False, top_k: int = None) -> dict[Tuple[int, str], int]:
         """
         Counts the number of categorical features which are present
-        in `data`
+        in `data`, the counting is vectorized, NumPy arrays and pandas Series are
+        counted in place without being copied, Arrow arrays are counted by the Arrow kernels
+        and only their distinct values are converted, missing values of Arrow arrays are ignored
 
         Parameters
         ----------
         data : 1d-array-like
-            `data` contains categorical features 
+            `data` contains categorical features, either a list, a NumPy array, a pandas Series
+            (also of categorical dtype) or a pyarrow Array/ChunkedArray
+        approximate : bool, optional
+            If True, only the `capacity` most frequent features are counted by a Space-Saving sketch
+            which needs a bounded amount of memory, a count overestimates the true count by at most
+            `len(data) / capacity` and every feature which is more frequent than that is guaranteed to be
+            part of the result, missing values are ignored, the chunks of Arrow arrays are converted and counted one after
+            another, by default False
+        capacity : int, optional
+            Number of counters of the Space-Saving sketch, by default 1000
+        sort : bool, optional
+            If True, the features are sorted by their count in descending order, otherwise they keep the
+            order of their first appearance, by default False
+        top_k : int, optional
+            If given, only the `top_k` most frequent features are returned, by default None
 
         Returns
         -------
@@ -53,16 +71,70 @@ class Categories:
             DimError
                 If the dimension of `data` is not `1`, this error will be raised
         """
-        if isinstance(data, list):
-            data = np.array(data)
-            if len(data.shape) != 1:
+        if type(data).__module__.startswith("pyarrow"):
+            counts = Categories.__count_arrow(data, capacity = capacity if approximate else None)
+        else:
+            data = Categories.__as_series(data)
+            if approximate:
+                heavy_hitters = sketch.SpaceSaving(capacity = capacity)
+                heavy_hitters.update(data)
+                counts = heavy_hitters.counts
+            else:
+                counts = data.value_counts(sort = False, dropna = False)
+                if isinstance(data.dtype, pd.CategoricalDtype):
+                    # unobserved categories are part of the counts of a categorical
+                    counts = counts[counts > 0]
+
+        if top_k is not None:
+            counts = counts.nlargest(top_k, keep = "first")
+        elif sort:
+            counts = counts.sort_values(ascending = False, kind = "stable")
+
+        return counts.to_dict()
+
+
+    @staticmethod
+    def __as_series(data: Any) -> pd.Series:
+        """
+        Wraps 1d-array-like data into a pandas Series, NumPy arrays and Series are not copied
+
+        Raises
+        ------
+            DimError
+                If the dimension of `data` is not `1`, this error will be raised
+        """
+        if isinstance(data, pd.Series):
+            return data
+        if isinstance(data, np.ndarray):
+            if data.ndim != 1:
                 raise exception.DimError(f"Data needs to be one-dimensional!")
+            return pd.Series(data, copy = False)
+
+        series = pd.Series(data, dtype = None if len(data) > 0 else object)
+        if pd.api.types.infer_dtype(series, skipna = True) == "mixed" and series.map(pd.api.types.is_list_like).any():
+            raise exception.DimError(f"Data needs to be one-dimensional!")
+
+        return series
+
+
+    @staticmethod
+    def __count_arrow(data: Any, capacity: int = None) -> pd.Series:
+        """
+        Counts the values of a pyarrow Array or ChunkedArray with the Arrow compute kernels, only the distinct values are
+        converted, if `capacity` is given, the chunks are converted one after another and counted by a Space-Saving sketch
+        instead, in both cases nulls and NaNs are ignored
+        """
+        import pyarrow.compute as pc
+
+        if capacity is not None:
+            heavy_hitters = sketch.SpaceSaving(capacity = capacity)
+            for chunk in getattr(data, "chunks", [data]):
+                heavy_hitters.update(chunk.drop_null().to_pandas())
+            return heavy_hitters.counts
 
-        hash = {}
-        for datapoint in data:
-            if datapoint in hash:
-                hash[datapoint] += 1
-                continue
-            hash[datapoint] = 1
+        counts = pc.value_counts(data)
+        # the nulls are dropped before the conversion, such that integers are not converted to floats
+        counts = counts.filter(pc.is_valid(counts.field("values")))
+        counts = pd.Series(counts.field("counts").to_numpy(zero_copy_only = False), index = pd.Index(counts.field("values").to_pandas()))
 
-        return hash
\ No newline at end of file
+        return counts[counts.index.notna()]
\ No newline at end of file
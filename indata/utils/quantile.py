@@ -0,0 +1,101 @@
+"""
+Quantiles of a column are computed together, all requested quantiles are selected in a
+single partition of the values instead of sorting the values once per quantile
+"""
+
+import numpy as np
+
+from typing import Iterable
+
+
+# quantiles which are reported by default, the quartiles
+DEFAULT_QUANTILES = (0.25, 0.5, 0.75)
+# names of the quartiles in the DQT, all other quantiles are named by their percentile
+_QUARTILE_NAMES   = {0.25: "1st Qrt.", 0.5: "median", 0.75: "3rd Qrt."}
+
+
+def check_quantiles(quantiles: Iterable[float]) -> tuple[float, ...]:
+    """
+    Checks the requested quantiles and returns them in ascending order without duplicates
+
+    Parameters
+    ----------
+    quantiles : Iterable[float]
+        Quantiles between 0 and 1
+
+    Returns
+    -------
+    tuple[float, ...]
+        The sorted quantiles
+
+    Raises
+    ------
+    ValueError
+        Raised when no quantile is requested or a quantile is not between 0 and 1
+    """
+    quantiles = tuple(sorted(set(float(q) for q in quantiles)))
+    if not quantiles:
+        raise ValueError("At least one quantile has to be requested!")
+    if quantiles[0] < 0 or quantiles[-1] > 1:
+        raise ValueError("Quantiles have to be between 0 and 1!")
+
+    return quantiles
+
+
+def quantile_name(q: float) -> str:
+    """
+    Name of the DQT column which holds the `q`-quantile, the quartiles keep their names
+    '1st Qrt.', 'median' and '3rd Qrt.', all other quantiles are named by their percentile, e.g. 'P5' or 'P99.9'
+
+    Parameters
+    ----------
+    q : float
+        Quantile between 0 and 1
+
+    Returns
+    -------
+    str
+        The column name
+    """
+    if q in _QUARTILE_NAMES:
+        return _QUARTILE_NAMES[q]
+
+    return f"P{round(q * 100, 6):g}"
+
+
+def exact_quantiles(values: np.ndarray, quantiles: Iterable[float], presorted: bool = False) -> list[float]:
+    """
+    Computes all quantiles of the values in a single selection pass, the quantiles are linearly
+    interpolated between the closest ranks, just like numpy and pandas do it
+
+    Parameters
+    ----------
+    values : np.ndarray
+        1d-array of numeric values without NaN
+    quantiles : Iterable[float]
+        Quantiles between 0 and 1
+    presorted : bool, optional
+        If the values are already sorted, the quantiles are read off directly, by default False
+
+    Returns
+    -------
+    list[float]
+        The quantiles in the order in which they were requested, NaN if there are no values
+    """
+    quantiles = np.asarray(list(quantiles), dtype = np.float64)
+    if len(values) == 0:
+        return [np.nan] * len(quantiles)
+
+    position = quantiles * (len(values) - 1)
+    lower    = np.floor(position).astype(np.int64)
+    upper    = np.ceil(position).astype(np.int64)
+    if not presorted:
+        # one partition places every needed rank at its sorted position
+        values = np.partition(values, np.unique(np.concatenate([lower, upper])))
+    below = values[lower].astype(np.float64)
+    above = values[upper].astype(np.float64)
+    # interpolates from the closer rank to keep the rounding of numpy
+    weight = position - lower
+    result = np.where(weight < 0.5, below + (above - below) * weight, above - (above - below) * (1 - weight))
+
+    return result.tolist()
\ No newline at end of file
@@ -0,0 +1,714 @@
+"""
+Sketches are small, mergeable summaries of a stream of values which answer
+questions like 'what is the median' or 'how many distinct values are there'
+approximately, without holding the stream in memory
+"""
+
+import attrs
+import base64
+import numpy as np
+import pandas as pd
+
+from abc    import abstractmethod
+from typing import Any, Iterable
+
+import indata.utils.quantile as quantile
+
+
+#################################################################################################
+#                                      Interface Sketch                                         #
+#################################################################################################
+
+class IFSketch:
+    """
+    Interface for sketches
+    A sketch consumes a stream of values batch by batch and can be merged with
+    another sketch of the same kind which has seen a different part of the stream
+
+    Methods
+    -------
+    update()
+        Adds a batch of values to the sketch
+    merge()
+        Merges another sketch into this one
+    """
+
+    @abstractmethod
+    def update(self): # pragma: no cover
+        pass
+
+
+    @abstractmethod
+    def merge(self): # pragma: no cover
+        pass
+
+
+#################################################################################################
+#                                      QuantileSketch                                           #
+#################################################################################################
+
+@attrs.define()
+class QuantileSketch(IFSketch):
+    """
+    KLL sketch for approximate quantiles of numeric values. The sketch keeps a hierarchy of
+    compactors, an item on level `h` represents `2^h` items of the stream. As long as no compaction
+    happened, the quantiles are exact.
+
+    Methods
+    -------
+    update(values: np.ndarray)
+        Adds a batch of numeric values to the sketch
+    merge(other: QuantileSketch)
+        Merges another quantile sketch into this one
+    quantile(q: float)
+        Returns the approximate `q`-quantile of all values seen so far
+    quantiles(qs: Iterable[float])
+        Returns several approximate quantiles at once
+    """
+    k: int                    = attrs.field(factory = int)
+    levels: list[np.ndarray]  = attrs.field(factory = list)
+    seed: int                 = attrs.field(factory = int)
+    _rng: np.random.Generator = attrs.field(default = None)
+
+    def __init__(self, k: int = 200, seed: int = 0):
+        """
+        Parameters
+        ----------
+        k : int, optional
+            Capacity of the top compactor, the rank error shrinks roughly with `1/k`, by default 200
+        seed : int, optional
+            Seed for the random offsets of the compactions, by default 0
+        """
+        if k < 2:
+            raise ValueError("The capacity k of the sketch has to be at least 2!")
+        self.k      = k
+        self.seed   = seed
+        self.levels = [np.empty(0, dtype = np.float64)]
+        self._rng   = np.random.default_rng(seed)
+
+
+    @property
+    def count(self) -> int:
+        """ Number of values which were added to the sketch """
+        return int(sum(len(level) << height for height, level in enumerate(self.levels)))
+
+
+    def update(self, values: np.ndarray) -> None:
+        """
+        Adds a batch of numeric values to the sketch, NaN values are ignored
+
+        Parameters
+        ----------
+        values : np.ndarray
+            1d-array of numeric values
+        """
+        values = np.asarray(values, dtype = np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.__compress()
+
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """
+        Merges another quantile sketch into this one
+
+        Parameters
+        ----------
+        other : QuantileSketch
+            Sketch which has seen another part of the stream
+
+        Returns
+        -------
+        QuantileSketch
+            The sketch itself, such that merges can be chained
+        """
+        for height, level in enumerate(other.levels):
+            if height == len(self.levels):
+                self.levels.append(np.empty(0, dtype = np.float64))
+            self.levels[height] = np.concatenate([self.levels[height], level])
+        self.__compress()
+
+        return self
+
+
+    def quantile(self, q: float) -> float:
+        """
+        Returns the approximate `q`-quantile, as long as the sketch was not compacted
+        the quantile is exact and linearly interpolated, just like pandas does it
+
+        Parameters
+        ----------
+        q : float
+            Quantile between 0 and 1
+
+        Returns
+        -------
+        float
+            The `q`-quantile or NaN if the sketch is empty
+        """
+        return self.quantiles([q])[0]
+
+
+    def quantiles(self, qs: Iterable[float]) -> list[float]:
+        """
+        Returns several approximate quantiles from a single sort of the items of the sketch
+
+        Parameters
+        ----------
+        qs : Iterable[float]
+            Quantiles between 0 and 1
+
+        Returns
+        -------
+        list[float]
+            The quantiles in the requested order, NaN if the sketch is empty
+        """
+        qs = list(qs)
+        if self.count == 0:
+            return [np.nan] * len(qs)
+        if len(self.levels) == 1:
+            return quantile.exact_quantiles(self.levels[0], qs)
+
+        items   = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 1 << height, dtype = np.int64) for height, level in enumerate(self.levels)])
+        order   = np.argsort(items, kind = "stable")
+        ranks   = np.cumsum(weights[order])
+        indices = np.searchsorted(ranks, np.asarray(qs, dtype = np.float64) * ranks[-1], side = "left")
+
+        return items[order][np.minimum(indices, len(items) - 1)].astype(np.float64).tolist()
+
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serializes the sketch into a json compatible dictionary, the state of the random
+        generator is kept such that a restored sketch compacts like the original one
+
+        Returns
+        -------
+        dict[str, Any]
+            The state of the sketch
+        """
+        return {'k': self.k, 'seed': self.seed, 'levels': [level.tolist() for level in self.levels],
+                'rng': self._rng.bit_generator.state}
+
+
+    @staticmethod
+    def from_dict(state: dict[str, Any]) -> "QuantileSketch":
+        """
+        Restores a sketch which was serialized by `to_dict`
+
+        Parameters
+        ----------
+        state : dict[str, Any]
+            The state of the sketch
+
+        Returns
+        -------
+        QuantileSketch
+            The restored sketch
+        """
+        quantile_sketch        = QuantileSketch(k = state['k'], seed = state['seed'])
+        quantile_sketch.levels = [np.asarray(level, dtype = np.float64) for level in state['levels']]
+        quantile_sketch._rng.bit_generator.state = state['rng']
+
+        return quantile_sketch
+
+
+    def __capacity(self, height: int) -> int:
+        """ Capacity of the compactor on level `height`, lower levels get geometrically smaller """
+        depth = len(self.levels) - height - 1
+
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+
+    def __compress(self) -> None:
+        """
+        Compacts the lowest level which is full into the next level, until the sketch fits
+        into its overall capacity again
+        """
+        while sum(len(level) for level in self.levels) > sum(self.__capacity(height) for height in range(len(self.levels))):
+            height = next(height for height, level in enumerate(self.levels) if len(level) >= self.__capacity(height))
+            if height + 1 == len(self.levels):
+                self.levels.append(np.empty(0, dtype = np.float64))
+            level     = np.sort(self.levels[height])
+            # an odd item stays on its level, the rest is halved with a random offset
+            even      = len(level) - len(level) % 2
+            offset    = int(self._rng.integers(2))
+            self.levels[height]     = level[even:]
+            self.levels[height + 1] = np.concatenate([self.levels[height + 1], level[:even][offset::2]])
+
+
+#################################################################################################
+#                                       HyperLogLog                                             #
+#################################################################################################
+
+@attrs.define()
+class HyperLogLog(IFSketch):
+    """
+    HyperLogLog sketch for the approximate number of distinct values. The standard error
+    of the estimate is roughly `1.04 / sqrt(2^precision)`, e.g. 0.8% for a precision of 14
+    while the sketch only needs `2^precision` bytes
+
+    Methods
+    -------
+    update(values: np.ndarray)
+        Adds a batch of values to the sketch
+    merge(other: HyperLogLog)
+        Merges another HyperLogLog sketch with the same precision into this one
+    estimate()
+        Returns the estimated number of distinct values
+    """
+    precision: int        = attrs.field(factory = int)
+    registers: np.ndarray = attrs.field(factory = lambda: np.empty(0, dtype = np.uint8))
+
+    def __init__(self, precision: int = 14):
+        """
+        Parameters
+        ----------
+        precision : int, optional
+            Number of bits which are used to address the registers, has to be between 4 and 18, by default 14
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError("The precision of a HyperLogLog sketch has to be between 4 and 18!")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype = np.uint8)
+
+
+    def update(self, values: np.ndarray) -> None:
+        """
+        Adds a batch of values to the sketch, missing values are ignored
+
+        Parameters
+        ----------
+        values : np.ndarray
+            1d-array of hashable values
+        """
+        values = pd.Series(values, copy = False).dropna()
+        if len(values) == 0:
+            return
+        hashes = pd.util.hash_array(values.to_numpy())
+        bits   = np.uint64(64 - self.precision)
+        index  = (hashes >> bits).astype(np.int64)
+        rest   = hashes & np.uint64((1 << (64 - self.precision)) - 1)
+        rho    = (int(bits) - _bit_length(rest) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rho)
+
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """
+        Merges another sketch into this one
+
+        Parameters
+        ----------
+        other : HyperLogLog
+            Sketch which has seen another part of the stream
+
+        Returns
+        -------
+        HyperLogLog
+            The sketch itself, such that merges can be chained
+
+        Raises
+        ------
+        ValueError
+            Raised when the precisions of both sketches differ
+        """
+        if other.precision != self.precision:
+            raise ValueError("Only HyperLogLog sketches with the same precision can be merged!")
+        np.maximum(self.registers, other.registers, out = self.registers)
+
+        return self
+
+
+    def estimate(self) -> int:
+        """
+        Estimates the number of distinct values, small cardinalities are estimated
+        with linear counting
+
+        Returns
+        -------
+        int
+            Estimated number of distinct values
+        """
+        m        = len(self.registers)
+        alpha    = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros    = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros > 0:
+            estimate = m * np.log(m / zeros)
+
+        return int(round(estimate))
+
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serializes the sketch into a json compatible dictionary
+
+        Returns
+        -------
+        dict[str, Any]
+            The state of the sketch
+        """
+        return {'method': "hll", 'precision': self.precision,
+                'registers': base64.b64encode(self.registers.tobytes()).decode("ascii")}
+
+
+    @staticmethod
+    def from_dict(state: dict[str, Any]) -> "HyperLogLog":
+        """
+        Restores a sketch which was serialized by `to_dict`
+
+        Parameters
+        ----------
+        state : dict[str, Any]
+            The state of the sketch
+
+        Returns
+        -------
+        HyperLogLog
+            The restored sketch
+        """
+        hyperloglog           = HyperLogLog(precision = state['precision'])
+        hyperloglog.registers = np.frombuffer(base64.b64decode(state['registers']), dtype = np.uint8).copy()
+
+        return hyperloglog
+
+
+#################################################################################################
+#                                    ExactCardinality                                           #
+#################################################################################################
+
+@attrs.define()
+class ExactCardinality(IFSketch):
+    """
+    Counts the distinct values exactly by keeping them, it shares the interface of
+    HyperLogLog such that both can be used interchangeably
+
+    Methods
+    -------
+    update(values: np.ndarray)
+        Adds a batch of values
+    merge(other: ExactCardinality)
+        Merges the distinct values of another instance into this one
+    estimate()
+        Returns the number of distinct values
+    """
+    values: np.ndarray = attrs.field(factory = lambda: np.empty(0, dtype = object))
+
+    def __init__(self):
+        self.values = np.empty(0, dtype = object)
+
+
+    def update(self, values: np.ndarray) -> None:
+        """
+        Adds a batch of values, missing values are ignored
+
+        Parameters
+        ----------
+        values : np.ndarray
+            1d-array of hashable values
+        """
+        values      = pd.Series(values, copy = False).dropna().unique()
+        self.values = pd.unique(np.concatenate([self.values, np.asarray(values, dtype = object)]))
+
+
+    def merge(self, other: "ExactCardinality") -> "ExactCardinality":
+        """
+        Merges the distinct values of another instance into this one
+
+        Parameters
+        ----------
+        other : ExactCardinality
+            Instance which has seen another part of the stream
+
+        Returns
+        -------
+        ExactCardinality
+            The instance itself, such that merges can be chained
+        """
+        self.update(other.values)
+
+        return self
+
+
+    def estimate(self) -> int:
+        """ Returns the number of distinct values """
+        return len(self.values)
+
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serializes the distinct values into a json compatible dictionary
+
+        Returns
+        -------
+        dict[str, Any]
+            The state of the instance
+        """
+        return {'method': "exact", 'values': pd.Series(self.values, dtype = object).tolist()}
+
+
+    @staticmethod
+    def from_dict(state: dict[str, Any]) -> "ExactCardinality":
+        """
+        Restores an instance which was serialized by `to_dict`
+
+        Parameters
+        ----------
+        state : dict[str, Any]
+            The state of the instance
+
+        Returns
+        -------
+        ExactCardinality
+            The restored instance
+        """
+        exact_cardinality = ExactCardinality()
+        exact_cardinality.update(np.asarray(state['values'], dtype = object))
+
+        return exact_cardinality
+
+
+def cardinality_estimator(method: str = "hll", precision: int = 14) -> IFSketch:
+    """
+    Creates an estimator for the number of distinct values
+
+    Parameters
+    ----------
+    method : str, optional
+        Either "exact", which keeps all distinct values, or "hll", which uses a HyperLogLog
+        sketch of `2^precision` bytes, by default "hll"
+    precision : int, optional
+        Precision of the HyperLogLog sketch, by default 14
+
+    Returns
+    -------
+    IFSketch
+        An estimator with the methods `update`, `merge`, `estimate` and `to_dict`
+
+    Raises
+    ------
+    ValueError
+        Raised when the method is unknown
+    """
+    if method == "exact":
+        return ExactCardinality()
+    if method == "hll":
+        return HyperLogLog(precision = precision)
+    raise ValueError(f"Unknown cardinality method {method}, choose either 'exact' or 'hll'!")
+
+
+def cardinality_from_dict(state: dict[str, Any]) -> IFSketch:
+    """
+    Restores a cardinality estimator which was serialized by its `to_dict` method
+
+    Parameters
+    ----------
+    state : dict[str, Any]
+        The state of the estimator
+
+    Returns
+    -------
+    IFSketch
+        The restored estimator
+    """
+    if state['method'] == "exact":
+        return ExactCardinality.from_dict(state)
+
+    return HyperLogLog.from_dict(state)
+
+
+#################################################################################################
+#                                       SpaceSaving                                             #
+#################################################################################################
+
+@attrs.define()
+class SpaceSaving(IFSketch):
+    """
+    Space-Saving sketch for the most frequent values (heavy hitters) of a stream. The sketch
+    keeps at most `capacity` counters, thus its memory does not grow with the number of distinct values.
+
+    Error bounds for a stream of `n` values: every reported count overestimates the true count by
+    at most `n / capacity` (the exact bound per value is given by its error), and every value whose
+    true count exceeds `n / capacity` is guaranteed to be reported. Counts of streams with
+    at most `capacity` distinct values are exact.
+
+    Methods
+    -------
+    update(values: np.ndarray)
+        Adds a batch of values to the sketch
+    merge(other: SpaceSaving)
+        Merges another Space-Saving sketch into this one
+    top(k: int)
+        Returns the `k` most frequent values with their estimated counts
+    """
+    capacity: int      = attrs.field(factory = int)
+    count: int         = attrs.field(factory = int)
+    counts: pd.Series  = attrs.field(factory = pd.Series)
+    errors: pd.Series  = attrs.field(factory = pd.Series)
+
+    def __init__(self, capacity: int = 1000):
+        """
+        Parameters
+        ----------
+        capacity : int, optional
+            Maximal number of counters, by default 1000
+        """
+        if capacity < 1:
+            raise ValueError("The capacity of a Space-Saving sketch has to be positive!")
+        self.capacity = capacity
+        self.count    = 0
+        self.counts   = pd.Series(dtype = np.int64)
+        self.errors   = pd.Series(dtype = np.int64)
+
+
+    def update(self, values: np.ndarray, batch_size: int = 1 << 16) -> None:
+        """
+        Adds values to the sketch, missing values are ignored. The values are counted exactly
+        in batches of `batch_size` which are merged into the sketch one after another, thus at most
+        `capacity + batch_size` counters exist at any time
+
+        Parameters
+        ----------
+        values : np.ndarray
+            1d-array of hashable values
+        batch_size : int, optional
+            Number of values which are counted at once, by default 65536
+        """
+        values = pd.Series(values, copy = False)
+        for start in range(0, len(values), batch_size):
+            counts = value_counts(values.iloc[start:start + batch_size])
+            # the counts of a batch are exact, thus a value which is missing in the batch has a count of 0
+            self.__combine(counts, pd.Series(0, index = counts.index, dtype = np.int64), floor = 0)
+            self.count += int(counts.sum())
+
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        """
+        Merges another sketch into this one, a value which is not tracked by a full sketch is
+        assumed to have the smallest count of that sketch, afterwards only the `capacity`
+        largest counters are kept
+
+        Parameters
+        ----------
+        other : SpaceSaving
+            Sketch which has seen another part of the stream
+
+        Returns
+        -------
+        SpaceSaving
+            The sketch itself, such that merges can be chained
+        """
+        self.__combine(other.counts, other.errors, floor = other.__floor())
+        self.count += other.count
+
+        return self
+
+
+    def top(self, k: int) -> pd.Series:
+        """
+        Returns the `k` most frequent values
+
+        Parameters
+        ----------
+        k : int
+            Number of values
+
+        Returns
+        -------
+        pd.Series
+            Estimated counts indexed by the values, sorted in descending order
+        """
+        return self.counts.nlargest(k, keep = "first")
+
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serializes the counters into a json compatible dictionary
+
+        Returns
+        -------
+        dict[str, Any]
+            The state of the sketch
+        """
+        return {'capacity': self.capacity, 'count': self.count, 'values': self.counts.index.tolist(),
+                'counts': self.counts.tolist(), 'errors': self.errors.tolist()}
+
+
+    @staticmethod
+    def from_dict(state: dict[str, Any]) -> "SpaceSaving":
+        """
+        Restores a sketch which was serialized by `to_dict`
+
+        Parameters
+        ----------
+        state : dict[str, Any]
+            The state of the sketch
+
+        Returns
+        -------
+        SpaceSaving
+            The restored sketch
+        """
+        space_saving        = SpaceSaving(capacity = state['capacity'])
+        space_saving.count  = state['count']
+        space_saving.counts = pd.Series(state['counts'], index = pd.Index(state['values'], dtype = object), dtype = np.int64)
+        space_saving.errors = pd.Series(state['errors'], index = space_saving.counts.index, dtype = np.int64)
+
+        return space_saving
+
+
+    def __combine(self, counts: pd.Series, errors: pd.Series, floor: int) -> None:
+        """ Adds counters to the sketch, `floor` bounds the count of a value which is not among them, only the `capacity` largest counters are kept """
+        keys        = self.counts.index.append(counts.index).unique()
+        own_floor   = self.__floor()
+        counts      = self.counts.reindex(keys, fill_value = own_floor) + counts.reindex(keys, fill_value = floor)
+        errors      = self.errors.reindex(keys, fill_value = own_floor) + errors.reindex(keys, fill_value = floor)
+        self.counts = counts.nlargest(self.capacity, keep = "first")
+        self.errors = errors[self.counts.index]
+
+
+    def __floor(self) -> int:
+        """ Upper bound for the count of a value which is not tracked by the sketch """
+        if len(self.counts) < self.capacity:
+            return 0
+
+        return int(self.counts.min())
+
+
+def value_counts(values: pd.Series) -> pd.Series:
+    """
+    Counts the present values in the order of their first appearance, categorical values
+    are counted by their codes and unused categories are left out
+
+    Parameters
+    ----------
+    values : pd.Series
+        1d-array of hashable values
+
+    Returns
+    -------
+    pd.Series
+        The count per value
+    """
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        return values.value_counts(sort = False)
+
+    codes  = values.cat.codes.to_numpy()
+    codes  = codes[codes >= 0]
+    first  = pd.unique(codes)
+    counts = np.bincount(codes, minlength = len(values.cat.categories))[first]
+
+    return pd.Series(counts, index = values.cat.categories[first], name = values.name, dtype = np.int64)
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """ Vectorized `int.bit_length` for unsigned integers below `2^63` """
+    exponent = np.frexp(values.astype(np.float64))[1].astype(np.int64)
+    # the conversion to float64 might round up to the next power of two
+    power    = np.left_shift(np.uint64(1), np.maximum(exponent - 1, 0).astype(np.uint64))
+    exponent = exponent - ((values < power) & (values > 0))
+
+    return exponent
\ No newline at end of file
@@ -1,6 +1,8 @@
 """Testing the functionality of the checking tools"""
 
 import pytest 
+import datetime
+import pandas as pd
 
 
 import indata.utils.checks as checks
@@ -45,4 +47,37 @@ class TestChecking:
 
         """ EXEUCTION & VERIFICATION """
         with pytest.raises(TypeError):
-            checks.isNumeric(example)
\ No newline at end of file
+            checks.isNumeric(example)
+
+
+    def test_missing_values_s01(self):
+        """Test whether NaN, None and blank strings are found as missing values per column
+        """
+
+        """ PREPARATION """
+        dataframe = pd.DataFrame({'name': ["John", " ", "Stella", None], 'income': [30457, 43899, float("nan"), 27499],
+                                  'job': ["Trucker", "Cashier", "Teacher", "Craftsman"]})
+
+        """ EXECUTION """
+        act_missing = checks.find_missing(dataframe)
+
+        """ VERIFICATION """
+        assert act_missing == {'name': [1, 3], 'income': [2]}
+        assert checks.missing_mask(dataframe["name"]).to_list() == [False, True, False, True]
+
+
+    def test_mixed_types_s01(self):
+        """Test whether columns with entries of multiple kinds are found together with the offending rows
+        """
+
+        """ PREPARATION """
+        dataframe = pd.DataFrame({'name': ["John", "973", "Stella"], 'income': ["30457", "43899.5", "Craftsman"],
+                                  'job': ["Trucker", "Cashier", "Teacher"], 'date': [datetime.date(2020, 1, 1), "2020-01-02", True]})
+
+        """ EXECUTION """
+        act_mixed = checks.find_mixed_types(dataframe)
+
+        """ VERIFICATION """
+        assert act_mixed == {'name': (["str", "float"], [1]), 'income': (["float", "str"], [2]),
+                             'date': (["date", "str", "bool"], [1, 2])}
+        assert checks.infer_kinds(pd.Series([1.5, 2.0])).to_list() == ["float", "float"]
\ No newline at end of file
@@ -1,6 +1,8 @@
 """Testing the functionality of the counting tools"""
 
 import pytest 
+import numpy as np
+import pandas as pd
 
 
 import indata.utils.count as count
@@ -32,6 +34,104 @@ class TestCountingCategories:
         assert act_result_two == exp_result_two
 
 
+    def test_counting_s02(self):
+        """Test whether the approximate counting finds the most frequent features
+        """
+
+        """ EXECUTION """
+        act_result_one = count.Categories.count(data = self.test_data_one, approximate = True, capacity = 2)
+        act_result_two = count.Categories.count(data = self.test_data_two, approximate = True)
+
+        """ VERIFICATION """
+        assert list(act_result_one.keys())[0] == "ant"
+        assert len(act_result_one)            == 2
+        assert act_result_two == {0: 3, 1: 3}
+
+
+    def test_counting_s03(self):
+        """Test whether arrays, series and categoricals are counted like lists
+        """
+
+        """ PREPARATION """
+        exp_result = {'dog': 2, 'ant': 3, 'bee': 1, 'cat': 1}
+
+        """ EXECUTION """
+        act_result_array       = count.Categories.count(data = np.array(self.test_data_one))
+        act_result_series      = count.Categories.count(data = pd.Series(self.test_data_one))
+        act_result_categorical = count.Categories.count(data = pd.Series(self.test_data_one, dtype = "category").cat.add_categories(["eel"]))
+
+        """ VERIFICATION """
+        assert act_result_array       == exp_result
+        assert act_result_series      == exp_result
+        assert act_result_categorical == exp_result
+
+
+    def test_counting_s04(self):
+        """Test whether the counts can be sorted or reduced to the most frequent features
+        """
+
+        """ EXECUTION """
+        act_result_sorted = count.Categories.count(data = self.test_data_one, sort = True)
+        act_result_top    = count.Categories.count(data = self.test_data_one, top_k = 2)
+
+        """ VERIFICATION """
+        assert list(act_result_sorted.items()) == [('ant', 3), ('dog', 2), ('bee', 1), ('cat', 1)]
+        assert list(act_result_top.items())    == [('ant', 3), ('dog', 2)]
+
+
+    def test_counting_s05(self):
+        """Test whether Arrow arrays are counted with the Arrow kernels
+        """
+
+        """ PREPARATION """
+        pa = pytest.importorskip("pyarrow")
+
+        """ EXECUTION """
+        act_result_array   = count.Categories.count(data = pa.array(self.test_data_one))
+        act_result_chunked = count.Categories.count(data = pa.chunked_array([self.test_data_two[:3], self.test_data_two[3:]]))
+
+        """ VERIFICATION """
+        assert act_result_array   == {'dog': 2, 'ant': 3, 'bee': 1, 'cat': 1}
+        assert act_result_chunked == {0: 3, 1: 3}
+
+
+    def test_counting_s06(self):
+        """Test whether Arrow arrays are counted by the Space-Saving sketch if the counts are approximate
+        """
+
+        """ PREPARATION """
+        pa     = pytest.importorskip("pyarrow")
+        values = ["ant", "dog", "ant", None, "bee", "ant", "cat", "dog", "eel"]
+
+        """ EXECUTION """
+        act_result_exact  = count.Categories.count(data = pa.chunked_array([values[:4], values[4:]]), approximate = True, capacity = 10)
+        act_result_sketch = count.Categories.count(data = pa.chunked_array([values[:4], values[4:]]), approximate = True, capacity = 2)
+
+        """ VERIFICATION """
+        assert act_result_exact == count.Categories.count(data = values, approximate = True, capacity = 10)
+        assert act_result_exact == {'ant': 3, 'dog': 2, 'bee': 1, 'cat': 1, 'eel': 1}
+        assert len(act_result_sketch) == 2 and act_result_sketch['ant'] >= 3
+
+
+    def test_counting_s07(self):
+        """Test whether nulls and NaNs of Arrow arrays are ignored by the exact and the approximate counts
+        """
+
+        """ PREPARATION """
+        pa      = pytest.importorskip("pyarrow")
+        numbers = pa.chunked_array([pa.array([1.5, float("nan"), None], from_pandas = False), pa.array([1.5, 2.5, None])])
+        labels  = pa.chunked_array([[3, None, 3], [1, None]])
+
+        """ EXECUTION """
+        act_result_numbers = [count.Categories.count(data = numbers, approximate = approximate) for approximate in (False, True)]
+        act_result_labels  = [count.Categories.count(data = labels, approximate = approximate) for approximate in (False, True)]
+
+        """ VERIFICATION """
+        assert act_result_numbers == [{1.5: 2, 2.5: 1}] * 2
+        assert act_result_labels  == [{3: 2, 1: 1}] * 2
+        assert all(isinstance(label, int) for label in act_result_labels[0])
+
+
     def test_counting_e01(self):
         """Test whether an error is raised when the wrong dimension of data
         is given by the user
@@ -42,4 +142,6 @@ class TestCountingCategories:
 
         """ EXECUTION & VERIFICATION """
         with pytest.raises(exception.DimError):
-            count.Categories.count(data = test_data)
\ No newline at end of file
+            count.Categories.count(data = test_data)
+        with pytest.raises(exception.DimError):
+            count.Categories.count(data = np.array(test_data))
\ No newline at end of file
@@ -0,0 +1,52 @@
+"""Testing the computation of quantiles"""
+
+import pytest
+import numpy as np
+
+
+import indata.utils.quantile as quantile
+
+
+class TestQuantile:
+    @classmethod
+    def setup_class(cls):
+        """ Setup of test data """
+        cls.rng  = np.random.default_rng(3)
+        cls.data = cls.rng.normal(size = 10_001)
+
+
+    def test_exact_quantiles_s01(self):
+        """ Test whether quantiles from a single selection pass equal the quantiles of numpy """
+
+        """ PREPARATION """
+        quantiles = [0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99, 0.0, 1.0]
+
+        """ EXECUTION """
+        act_quantiles = quantile.exact_quantiles(self.data.copy(), quantiles)
+        act_sorted    = quantile.exact_quantiles(np.sort(self.data), quantiles, presorted = True)
+        act_integers  = quantile.exact_quantiles(np.array([120, 70, 50, 15]), [0.25, 0.5, 0.75])
+
+        """ VERIFICATION """
+        assert act_quantiles == np.quantile(self.data, quantiles).tolist()
+        assert act_sorted    == act_quantiles
+        assert act_integers  == [41.25, 60.0, 82.5]
+        assert np.isnan(quantile.exact_quantiles(np.empty(0), [0.5])).all()
+
+
+    def test_quantile_name_s01(self):
+        """ Test whether the quartiles keep their names and all other quantiles are named by their percentile """
+
+        """ EXECUTION & VERIFICATION """
+        assert [quantile.quantile_name(q) for q in (0.25, 0.5, 0.75, 0.01, 0.95, 0.999)] == \
+               ["1st Qrt.", "median", "3rd Qrt.", "P1", "P95", "P99.9"]
+
+
+    def test_check_quantiles_e01(self):
+        """ Test whether invalid quantiles raise a ValueError """
+
+        """ EXECUTION & VERIFICATION """
+        assert quantile.check_quantiles([0.75, 0.25, 0.75]) == (0.25, 0.75)
+        with pytest.raises(ValueError):
+            quantile.check_quantiles([])
+        with pytest.raises(ValueError):
+            quantile.check_quantiles([0.5, 1.5])
\ No newline at end of file
@@ -0,0 +1,229 @@
+"""Testing the functionality of the sketches"""
+
+import json
+import pytest
+import numpy as np
+
+
+import indata.utils.sketch as sketch
+
+
+class TestQuantileSketch:
+    @classmethod
+    def setup_class(cls):
+        """ Setup of test data """
+        cls.rng  = np.random.default_rng(42)
+        cls.data = cls.rng.normal(size = 200_000)
+
+
+    def test_quantile_s01(self):
+        """ Test whether the quantiles are exact as long as the sketch was not compacted """
+
+        """ PREPARATION """
+        quantile_sketch = sketch.QuantileSketch()
+
+        """ EXECUTION """
+        quantile_sketch.update(np.array([15, 120, 70, 50, np.nan]))
+
+        """ VERIFICATION """
+        assert quantile_sketch.count == 4
+        assert quantile_sketch.quantile(0.25) == 41.25
+        assert quantile_sketch.quantile(0.5)  == 60.0
+
+
+    def test_quantile_s02(self):
+        """ Test whether merged sketches over chunks stay within the rank error bound """
+
+        """ PREPARATION """
+        first  = sketch.QuantileSketch()
+        second = sketch.QuantileSketch()
+        for chunk in np.array_split(self.data, 20):
+            first.update(chunk[: len(chunk) // 2])
+            second.update(chunk[len(chunk) // 2 :])
+
+        """ EXECUTION """
+        merged = first.merge(second)
+
+        """ VERIFICATION """
+        sorted_data = np.sort(self.data)
+        assert merged.count == len(self.data)
+        for q in (0.05, 0.25, 0.5, 0.75, 0.95):
+            rank = np.searchsorted(sorted_data, merged.quantile(q)) / len(self.data)
+            assert abs(rank - q) < 0.02
+
+
+    def test_serialization_s01(self):
+        """ Test whether a restored sketch continues like the original one """
+
+        """ PREPARATION """
+        quantile_sketch = sketch.QuantileSketch(k = 20)
+        quantile_sketch.update(self.data[:1000])
+
+        """ EXECUTION """
+        restored = sketch.QuantileSketch.from_dict(json.loads(json.dumps(quantile_sketch.to_dict())))
+        restored.update(self.data[1000:2000])
+        quantile_sketch.update(self.data[1000:2000])
+
+        """ VERIFICATION """
+        assert restored.count == quantile_sketch.count == 2000
+        assert [restored.quantile(q) for q in (0.25, 0.5, 0.75)] == [quantile_sketch.quantile(q) for q in (0.25, 0.5, 0.75)]
+
+
+    def test_quantile_e01(self):
+        """ Test whether an error is raised for an invalid capacity """
+
+        """ EXECUTION & VERIFICATION """
+        with pytest.raises(ValueError):
+            sketch.QuantileSketch(k = 1)
+
+
+
+class TestHyperLogLog:
+    def test_estimate_s01(self):
+        """ Test whether small cardinalities are estimated exactly and large ones within the error bound """
+
+        """ PREPARATION """
+        small = sketch.HyperLogLog()
+        large = sketch.HyperLogLog(precision = 12)
+
+        """ EXECUTION """
+        small.update(np.array(["dog", "ant", "bee", "ant", None]))
+        large.update(np.arange(100_000))
+        large.update(np.arange(50_000, 150_000))
+
+        """ VERIFICATION """
+        assert small.estimate() == 3
+        assert abs(large.estimate() - 150_000) / 150_000 < 0.05
+
+
+    def test_merge_s01(self):
+        """ Test whether merging two sketches equals a sketch which has seen both streams """
+
+        """ PREPARATION """
+        first  = sketch.HyperLogLog()
+        second = sketch.HyperLogLog()
+        both   = sketch.HyperLogLog()
+
+        """ EXECUTION """
+        first.update(np.arange(0, 30_000))
+        second.update(np.arange(20_000, 60_000))
+        both.update(np.arange(0, 60_000))
+        first.merge(second)
+
+        """ VERIFICATION """
+        assert first.estimate() == both.estimate()
+
+
+    def test_serialization_s01(self):
+        """ Test whether serialized estimators can be restored and merged, e.g. across worker processes """
+
+        """ PREPARATION """
+        for method in ("exact", "hll"):
+            first  = sketch.cardinality_estimator(method = method, precision = 10)
+            second = sketch.cardinality_estimator(method = method, precision = 10)
+            first.update(np.array(["dog", "ant", "bee"], dtype = object))
+            second.update(np.array(["ant", "cat"], dtype = object))
+
+            """ EXECUTION """
+            restored = sketch.cardinality_from_dict(json.loads(json.dumps(first.to_dict())))
+            restored.merge(sketch.cardinality_from_dict(json.loads(json.dumps(second.to_dict()))))
+
+            """ VERIFICATION """
+            assert type(restored) == type(first)
+            assert restored.estimate() == 4
+
+
+    def test_merge_e01(self):
+        """ Test whether sketches with different precisions cannot be merged """
+
+        """ EXECUTION & VERIFICATION """
+        with pytest.raises(ValueError):
+            sketch.HyperLogLog(precision = 10).merge(sketch.HyperLogLog(precision = 12))
+        with pytest.raises(ValueError):
+            sketch.HyperLogLog(precision = 2)
+        with pytest.raises(ValueError):
+            sketch.cardinality_estimator(method = "linear")
+
+
+class TestSpaceSaving:
+    @classmethod
+    def setup_class(cls):
+        """ Setup of test data """
+        cls.rng  = np.random.default_rng(7)
+        cls.data = cls.rng.zipf(1.5, size = 100_000)
+
+
+    def test_top_s01(self):
+        """ Test whether counts are exact as long as the number of distinct values fits into the sketch """
+
+        """ PREPARATION """
+        heavy_hitters = sketch.SpaceSaving(capacity = 10)
+
+        """ EXECUTION """
+        heavy_hitters.update(np.array(["dog", "ant", "bee", "ant", "cat", "dog", "ant", None], dtype = object))
+
+        """ VERIFICATION """
+        assert heavy_hitters.count == 7
+        assert heavy_hitters.top(2).to_dict() == {'ant': 3, 'dog': 2}
+
+
+    def test_top_s02(self):
+        """ Test whether the heavy hitters of a merged stream are found within the error bound """
+
+        """ PREPARATION """
+        first  = sketch.SpaceSaving(capacity = 100)
+        second = sketch.SpaceSaving(capacity = 100)
+
+        """ EXECUTION """
+        first.update(self.data[:50_000], batch_size = 1000)
+        second.update(self.data[50_000:], batch_size = 1000)
+        first.merge(second)
+
+        """ VERIFICATION """
+        values, counts = np.unique(self.data, return_counts = True)
+        exp_counts     = dict(zip(values, counts))
+        act_top        = first.top(5)
+        assert first.count == len(self.data)
+        assert list(act_top.index) == list(values[np.argsort(-counts)][:5])
+        for value, count in act_top.items():
+            assert 0 <= count - exp_counts[value] <= len(self.data) / 100
+
+
+    def test_top_s03(self):
+        """ Test whether a batch with more distinct values than counters does not inflate the counts of values which it lacks """
+
+        """ PREPARATION """
+        heavy_hitters = sketch.SpaceSaving(capacity = 2)
+
+        """ EXECUTION """
+        heavy_hitters.update(np.array(["ant", "ant", "ant"], dtype = object))
+        heavy_hitters.update(np.array(["bee", "cat", "dog"], dtype = object))
+
+        """ VERIFICATION """
+        assert heavy_hitters.counts["ant"] == 3 and heavy_hitters.errors["ant"] == 0
+        assert heavy_hitters.count == 6 and len(heavy_hitters.counts) == 2
+
+
+    def test_serialization_s01(self):
+        """ Test whether a restored sketch reports the same heavy hitters """
+
+        """ PREPARATION """
+        heavy_hitters = sketch.SpaceSaving(capacity = 100)
+        heavy_hitters.update(self.data[:10_000])
+
+        """ EXECUTION """
+        restored = sketch.SpaceSaving.from_dict(json.loads(json.dumps(heavy_hitters.to_dict())))
+        restored.update(self.data[10_000:20_000])
+        heavy_hitters.update(self.data[10_000:20_000])
+
+        """ VERIFICATION """
+        assert restored.count == heavy_hitters.count
+        assert restored.top(5).to_dict() == heavy_hitters.top(5).to_dict()
+
+
+    def test_top_e01(self):
+        """ Test whether an error is raised for an invalid capacity """
+
+        """ EXECUTION & VERIFICATION """
+        with pytest.raises(ValueError):
+            sketch.SpaceSaving(capacity = 0)
\ No newline at end of file